@@ -9,12 +9,14 @@ Two supported modes:
 
 1) Incremental (per-month, per-LMK):
    - Collect LMK keys from that month's certificates (from raw tables) OR accept a provided list
-   - Call the EPC recommendations endpoint per LMK
+   - Call the EPC recommendations endpoint per LMK (concurrently, REC_CONCURRENCY workers)
    - Normalize, write NDJSON to GCS, and load into `{kind}_recommendations_raw_json`
 
 2) Backfill by year (ZIP with recommendations.csv):
    - Accept a local ZIP path, a HTTP(S) URL, or a GCS URI for the yearly recommendations ZIP
+     (GCS ZIPs are read in place via ranged reads; HTTP downloads are spooled to a temp file)
    - Extract the recommendations CSV, normalize to our JSON envelope, write to GCS and load
+     (as zstd Parquet when pyarrow is installed, otherwise NDJSON.gz)
 
 Landing schema (same for both):
   - lmk_key STRING REQUIRED
@@ -24,6 +26,7 @@ Landing schema (same for both):
 This module has no EPC fetching for certificates (see domestic.py / nondomestic.py).
 """
 
+import contextlib
 import csv
 import datetime as _dt
 import io
@@ -31,35 +34,80 @@ import os
 import re
 import tempfile
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
 from .epc_api import fetch_recommendations_by_lmk
-from .io_utils import ensure_dataset, gcs_key, load_bq_raw, write_ndjson_gcs
+from .io_utils import (
+    CountingIterator,
+    ensure_dataset,
+    envelope_batch,
+    gcs_key,
+    load_bq_raw,
+    parquet_supported,
+    peek_iter,
+    write_ndjson_gcs,
+    write_parquet_gcs,
+)
 from .schema import (
     DOMESTIC_RAW_TABLE,
     NON_DOMESTIC_RAW_TABLE,
     DOMESTIC_RECS_RAW_TABLE,
     NON_DOMESTIC_RECS_RAW_TABLE,
+    DOMESTIC_LMKS_BY_MONTH_MV,
+    NON_DOMESTIC_LMKS_BY_MONTH_MV,
+    parse_iso_date,
 )
 from .settings import Settings, settings as _settings
 
+# Optional: Arrow's C++ CSV parser for the yearly ZIP backfill
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+
+    _PYARROW_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _PYARROW_AVAILABLE = False
+
 K_DOM = "domestic"
 K_NDOM = "non-domestic"
 _VALID_KINDS = {K_DOM, K_NDOM}
 
+# Column aliases for the LMK key and lodgement date (API JSON vs bulk CSV headers).
+_LMK_COLUMNS = ("lmk_key", "lmk-key", "LMK_KEY")
+_DATE_COLUMNS = ("lodgement_date", "lodgement-date", "LODgement-Date")
+
+# Arrow CSV read block size (bytes per RecordBatch).
+_CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Read-ahead for ZIPs streamed from GCS (ranged reads through BlobReader).
+_ZIP_READ_CHUNK_SIZE = 16 * 1024 * 1024
+
+# BigQuery result page size when streaming a month's LMK keys.
+_LMK_PAGE_SIZE = 10_000
+
+# Queued fetch tasks per worker; bounds memory when LMKs are streamed in.
+_PENDING_PER_WORKER = 4
+
+# Cap on failed LMK keys echoed back in the run summary (the count is always exact).
+_MAX_REPORTED_FAILURES = 20
+# Keys per `IN UNNEST(@lmks)` lookup when diffing a provided LMK list.
+_LMK_LOOKUP_BATCH = 10_000
+
 
 def _yyyymm(month: str) -> str:
     return month.replace("-", "")
 
 
-def _gcs_key_year(kind: str, year: int) -> str:
+def _gcs_key_year(kind: str, year: int, ext: str = "json.gz") -> str:
     """GCS key for a yearly recommendations dump."""
-    return f"epc/json/{kind}/{year}/recs/part-0001.json.gz"
+    return f"epc/json/{kind}/{year}/recs/part-0001.{ext}"
 
 
 def _parse_month_bounds(month: str) -> Tuple[_dt.date, _dt.date]:
@@ -74,26 +122,18 @@ def _normalize_rec(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     Normalize a recommendation dict to our envelope.
     We only require LMK; lodgement_date is often absent for recs (left NULL).
     """
-    def g(d: Dict[str, Any], *ks: str) -> Any:
-        for k in ks:
-            if k in d:
-                return d[k]
-        return None
-
-    lmk = g(rec, "lmk_key", "lmk-key", "LMK_KEY")
+    lmk = rec.get("lmk_key") or rec.get("lmk-key") or rec.get("LMK_KEY")
     if not lmk:
         return None
 
-    lodg = g(rec, "lodgement_date", "lodgement-date", "LODgement-Date")
-    if isinstance(lodg, str):
-        try:
-            _dt.date.fromisoformat(lodg)
-        except Exception:
-            lodg = None
-    else:
-        lodg = None
-
-    return {"lmk_key": str(lmk), "lodgement_date": lodg, "postcode": None, "uprn": None, "payload": rec}
+    lodg = rec.get("lodgement_date") or rec.get("lodgement-date") or rec.get("LODgement-Date")
+    return {
+        "lmk_key": str(lmk),
+        "lodgement_date": parse_iso_date(lodg) if isinstance(lodg, str) else None,
+        "postcode": None,
+        "uprn": None,
+        "payload": rec,
+    }
 
 
 def _resolve_tables(kind: str) -> Tuple[str, str]:
@@ -105,52 +145,198 @@ def _resolve_tables(kind: str) -> Tuple[str, str]:
     raise ValueError(f"Unknown kind {kind!r}; expected one of {_VALID_KINDS}")
 
 
-def _distinct_lmks_for_month(client: bigquery.Client, project: str, dataset: str, kind: str, month: str, location: str) -> List[str]:
-    """Query BQ for distinct LMK keys for certificates lodged in the given month."""
-    cert_table, _ = _resolve_tables(kind)
-    table_id = f"`{project}.{dataset}.{cert_table}`"
+def _resolve_lmks_mv(kind: str) -> str:
+    """Return the (lodgement_month, lmk_key) materialized view name for a kind."""
+    if kind == K_DOM:
+        return DOMESTIC_LMKS_BY_MONTH_MV
+    if kind == K_NDOM:
+        return NON_DOMESTIC_LMKS_BY_MONTH_MV
+    raise ValueError(f"Unknown kind {kind!r}; expected one of {_VALID_KINDS}")
+
+
+def _table_present(client: bigquery.Client, table_id: str) -> bool:
+    try:
+        client.get_table(table_id)
+        return True
+    except NotFound:
+        return False
+
+
+def _distinct_lmks_for_month(
+    client: bigquery.Client,
+    project: str,
+    dataset: str,
+    kind: str,
+    month: str,
+    location: str,
+    mv_dataset: Optional[str] = None,
+    skip_loaded: bool = False,
+) -> Iterator[str]:
+    """
+    Yield distinct LMK keys for certificates lodged in the given month.
+
+    Reads the `*_lmks_by_month_mv` materialized view in `mv_dataset` first (one
+    month partition, clustered on lmk_key); if it has not been created yet
+    (see sql/views), falls back to a DISTINCT scan of the raw table.
+
+    With `skip_loaded`, keys already present in the recommendations raw table
+    are anti-joined away in the same query.
+
+    Results are paged (_LMK_PAGE_SIZE rows per page) and yielded as each page
+    arrives, so EPC fetches start before the full key list has downloaded.
+    """
     start, end = _parse_month_bounds(month)
+
+    anti_join = ""
+    _, recs_table = _resolve_tables(kind)
+    if skip_loaded and _table_present(client, f"{project}.{dataset}.{recs_table}"):
+        anti_join = f"""
+          AND NOT EXISTS (
+            SELECT 1 FROM `{project}.{dataset}.{recs_table}` AS r WHERE r.lmk_key = c.lmk_key
+          )"""
+
+    rows = None
+    if mv_dataset:
+        mv_id = f"`{project}.{mv_dataset}.{_resolve_lmks_mv(kind)}`"
+        sql = f"""
+        SELECT c.lmk_key
+        FROM {mv_id} AS c
+        WHERE c.lodgement_month = @month{anti_join}
+        """
+        try:
+            rows = client.query(
+                sql,
+                location=location,
+                job_config=bigquery.QueryJobConfig(
+                    query_parameters=[bigquery.ScalarQueryParameter("month", "DATE", start.isoformat())]
+                ),
+            ).result(page_size=_LMK_PAGE_SIZE)
+        except NotFound:
+            rows = None
+
+    if rows is None:
+        cert_table, _ = _resolve_tables(kind)
+        table_id = f"`{project}.{dataset}.{cert_table}`"
+        sql = f"""
+        SELECT DISTINCT c.lmk_key
+        FROM {table_id} AS c
+        WHERE c.lodgement_date BETWEEN @start AND @end
+          AND c.lmk_key IS NOT NULL{anti_join}
+        """
+        rows = client.query(
+            sql,
+            location=location,
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("start", "DATE", start.isoformat()),
+                    bigquery.ScalarQueryParameter("end", "DATE", end.isoformat()),
+                ]
+            ),
+        ).result(page_size=_LMK_PAGE_SIZE)
+
+    for r in rows:
+        yield r["lmk_key"]
+
+
+def _dedup(lmks: Iterable[str]) -> Iterator[str]:
+    """Yield each LMK key once, in first-seen order (lazily, so streaming inputs stay streaming)."""
+    seen = set()
+    for lmk in lmks:
+        if lmk and lmk not in seen:
+            seen.add(lmk)
+            yield lmk
+
+
+def _drop_loaded_lmks(
+    client: bigquery.Client, project: str, dataset: str, kind: str, lmks: Iterable[str], location: str
+) -> List[str]:
+    """
+    Return `lmks` (deduplicated, order kept) minus keys already in the recommendations raw table.
+
+    Looks keys up in batches of _LMK_LOOKUP_BATCH with a parameterized
+    `IN UNNEST(@lmks)`; the table is clustered on lmk_key, so only matching
+    blocks are read.
+    """
+    keys = list(_dedup(lmks))
+    _, recs_table = _resolve_tables(kind)
+    table_id = f"{project}.{dataset}.{recs_table}"
+    if not keys or not _table_present(client, table_id):
+        return keys
+
     sql = f"""
     SELECT DISTINCT lmk_key
-    FROM {table_id}
-    WHERE lodgement_date BETWEEN @start AND @end
-      AND lmk_key IS NOT NULL
+    FROM `{table_id}`
+    WHERE lmk_key IN UNNEST(@lmks)
     """
-    job = client.query(
-        sql,
-        location=location,
-        job_config=bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("start", "DATE", start.isoformat()),
-                bigquery.ScalarQueryParameter("end", "DATE", end.isoformat()),
-            ]
-        ),
-    )
-    rows = job.result()
-    return [r["lmk_key"] for r in rows]
+    loaded = set()
+    for i in range(0, len(keys), _LMK_LOOKUP_BATCH):
+        job = client.query(
+            sql,
+            location=location,
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("lmks", "STRING", keys[i : i + _LMK_LOOKUP_BATCH])]
+            ),
+        )
+        loaded.update(r["lmk_key"] for r in job.result())
+    return [k for k in keys if k not in loaded]
+
+
+def _fetch_recs_for_lmks(
+    kind: str, lmks: Iterable[str], settings: Settings
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Call per-LMK recommendations concurrently; flatten and normalize.
 
+    Requests share epc_api's pooled session and at most `settings.rec_concurrency`
+    are in flight at a time. `lmks` is consumed lazily with a bounded number of
+    queued tasks, so a streaming producer (e.g. paged BigQuery results) overlaps
+    with the HTTP calls. A hard error on one LMK does not abort the batch.
 
-def _fetch_recs_for_lmks(kind: str, lmks: List[str], settings: Settings) -> List[Dict[str, Any]]:
-    """Call per-LMK recommendations; flatten and normalize."""
+    Returns:
+        (rows, errors) where errors maps LMK key -> error message.
+    """
+    max_pending = settings.rec_concurrency * _PENDING_PER_WORKER
     out: List[Dict[str, Any]] = []
-    for lmk in lmks:
-        try:
-            recs = fetch_recommendations_by_lmk(
-                kind=kind,
-                lmk_key=lmk,
-                timeout=settings.request_timeout_seconds,
-                auth=settings.epc_auth,
-                retry_max=settings.retry_max,
-                retry_backoff=settings.retry_backoff,
-            )
-        except RuntimeError:
-            # Log if you like; for now, skip this LMK on hard errors
-            recs = []
-        for r in recs:
-            n = _normalize_rec(r)
-            if n:
-                out.append(n)
-    return out
+    errors: Dict[str, str] = {}
+
+    def fetch(lmk: str) -> List[Dict]:
+        return fetch_recommendations_by_lmk(
+            kind=kind,
+            lmk_key=lmk,
+            timeout=settings.request_timeout_seconds,
+            auth=settings.epc_auth,
+            retry_max=settings.retry_max,
+            retry_backoff=settings.retry_backoff,
+        )
+
+    def collect(pending: Dict[Future, str]) -> None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            lmk = pending.pop(fut)
+            try:
+                recs = fut.result()
+            except RuntimeError as e:
+                errors[lmk] = str(e)
+                continue
+            for r in recs:
+                n = _normalize_rec(r)
+                if n:
+                    out.append(n)
+
+    with ThreadPoolExecutor(max_workers=settings.rec_concurrency) as pool:
+        pending: Dict[Future, str] = {}
+        for lmk in lmks:
+            pending[pool.submit(fetch, lmk)] = lmk
+            if len(pending) >= max_pending:
+                collect(pending)
+        while pending:
+            collect(pending)
+    return out, errors
+
+
+def _error_summary(errors: Dict[str, str]) -> Dict[str, Any]:
+    """Compact per-LMK failure info for the run summary/checkpoint."""
+    return {"errors": len(errors), "failed_lmks": sorted(errors)[:_MAX_REPORTED_FAILURES]}
 
 
 # ---------------------------
@@ -162,14 +348,19 @@ def run_month_incremental(
     kind: str,
     month: str,
     settings: Settings = _settings,
-    lmk_keys: Optional[List[str]] = None,
+    lmk_keys: Optional[Iterable[str]] = None,
+    skip_loaded: bool = False,
 ) -> Dict[str, Any]:
     """
     Incremental recommendations ingestion for a single month.
 
     Strategy:
-      - Get LMK keys for that month's certificates (or use provided lmk_keys)
-      - Fetch recommendations per LMK via EPC API
+      - Get LMK keys for that month's certificates (or use provided lmk_keys),
+        deduplicated and, with `skip_loaded`, minus keys already present in
+        {kind}_recommendations_raw_json (off by default: after a partial load
+        it would also skip keys whose remaining rows never landed)
+      - Fetch recommendations per LMK via EPC API (thread pool; per-LMK failures are
+        reported in the summary as `errors` / `failed_lmks` instead of aborting)
       - Write to GCS at epc/json/{kind}/{YYYYMM}/recs/part-0001.json.gz
       - Load to {kind}_recommendations_raw_json
 
@@ -180,18 +371,32 @@ def run_month_incremental(
 
     ensure_dataset(settings.project_id, settings.dataset_raw, settings.bq_location)
 
-    # Resolve LMKs if not provided
+    # Resolve LMKs if not provided (streamed page by page from BigQuery)
+    bq = bigquery.Client(project=settings.project_id)
     if lmk_keys is None:
-        bq = bigquery.Client(project=settings.project_id)
-        lmk_keys = _distinct_lmks_for_month(bq, settings.project_id, settings.dataset_raw, kind, month, settings.bq_location)
+        lmk_keys = _distinct_lmks_for_month(
+            bq,
+            settings.project_id,
+            settings.dataset_raw,
+            kind,
+            month,
+            settings.bq_location,
+            settings.dataset_enr,
+            skip_loaded=skip_loaded,
+        )
+    elif skip_loaded:
+        lmk_keys = _drop_loaded_lmks(bq, settings.project_id, settings.dataset_raw, kind, lmk_keys, settings.bq_location)
+    else:
+        lmk_keys = _dedup(lmk_keys)
 
-    if not lmk_keys:
+    lmk_keys = peek_iter(lmk_keys)
+    if lmk_keys is None:
         return {"kind": kind, "month": month, "rows": 0, "status": "no-lmks"}
 
     # Fetch recommendations
-    rows = _fetch_recs_for_lmks(kind, lmk_keys, settings)
+    rows, errors = _fetch_recs_for_lmks(kind, lmk_keys, settings)
     if not rows:
-        return {"kind": kind, "month": month, "rows": 0, "status": "no-recs"}
+        return {"kind": kind, "month": month, "rows": 0, "status": "no-recs", **_error_summary(errors)}
 
     # Write & load
     key = gcs_key(kind, month, "recs")
@@ -216,6 +421,7 @@ def run_month_incremental(
         "gcs_uri": uri,
         "table": table_id,
         "status": "loaded",
+        **_error_summary(errors),
     }
 
 
@@ -227,25 +433,37 @@ class ZipSource:
     gcs_uri: Optional[str] = None  # gs://bucket/key.zip
 
 
-def _download_zip_to_temp(src: ZipSource, project: Optional[str] = None) -> Optional[str]:
+@contextlib.contextmanager
+def _open_zip_source(src: ZipSource, project: Optional[str] = None) -> Iterator[Optional[Union[str, BinaryIO]]]:
     """
-    Download/copy the ZIP to a local temp file and return its path.
-    Supports local path, HTTP(S) URL, or GCS URI.
+    Yield something zipfile.ZipFile can open (a path or a seekable binary file).
+
+    - Local path: used in place.
+    - GCS URI: read through a seekable BlobReader; ZipFile's seeks become ranged
+      reads, so only the central directory and the CSV member are fetched.
+    - HTTP(S) URL: spooled to a temp file (ZipFile needs seek), deleted on exit.
+
+    Yields None if the source is empty.
     """
     if src.local_path:
         if not os.path.exists(src.local_path):
             raise FileNotFoundError(src.local_path)
-        return src.local_path
+        yield src.local_path
+        return
 
     if src.http_url:
         resp = requests.get(src.http_url, stream=True, timeout=120)
         resp.raise_for_status()
         fd, tmp_path = tempfile.mkstemp(suffix=".zip")
-        with os.fdopen(fd, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
-        return tmp_path
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        f.write(chunk)
+            yield tmp_path
+        finally:
+            os.remove(tmp_path)
+        return
 
     if src.gcs_uri:
         m = re.match(r"^gs://([^/]+)/(.+)$", src.gcs_uri)
@@ -256,44 +474,189 @@ def _download_zip_to_temp(src: ZipSource, project: Optional[str] = None) -> Opti
         blob = client.bucket(bucket).blob(key)
         if not blob.exists(client):
             raise FileNotFoundError(f"GCS object not found: {src.gcs_uri}")
-        fd, tmp_path = tempfile.mkstemp(suffix=".zip")
-        with os.fdopen(fd, "wb") as f:
-            blob.download_to_file(f)
-        return tmp_path
+        with blob.open("rb", chunk_size=_ZIP_READ_CHUNK_SIZE) as f:
+            yield f
+        return
 
     # Nothing provided
-    return None
+    yield None
+
+
+class _NoSplitCRLF(io.RawIOBase):
+    """
+    Read-through wrapper whose reads never end on a bare '\r'.
+
+    pyarrow's CSV reader uses each read() as a block, and when a block boundary
+    falls between the '\r' and '\n' of a CRLF inside a quoted value it drops
+    the '\n'. Holding a trailing '\r' back for the next read keeps CRLF pairs
+    in one block.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        super().__init__()
+        self._raw = raw
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
 
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data, self._pending = self._pending + self._raw.read(), b""
+            return data
+        data = self._pending + self._raw.read(max(size - len(self._pending), 1))
+        self._pending = b""
+        if len(data) > 1 and data.endswith(b"\r"):
+            data, self._pending = data[:-1], b"\r"
+        return data
+
+    def readinto(self, b: Any) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _utf8_column(col: "pa.Array") -> "pa.Array":
+    """
+    Binary CSV column as string; undecodable bytes become U+FFFD.
+
+    The cast is a zero-copy UTF-8 validation; only a column that fails it is
+    decoded in Python with errors="replace", as the DictReader path does.
+    """
+    try:
+        return col.cast(pa.string())
+    except pa.ArrowInvalid:
+        return pa.array(
+            [v.decode("utf-8", errors="replace") if v is not None else None for v in col.to_pylist()],
+            type=pa.string(),
+        )
+
+
+def _iter_csv_batches_arrow(zf: zipfile.ZipFile, name: str) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream CSV RecordBatches with pyarrow.
+
+    Every column comes back as string so values match csv.DictReader output:
+    cells are read as binary and decoded like the fallback (invalid UTF-8 is
+    replaced, not fatal). Quoted values may contain newlines, including across
+    block boundaries (see _NoSplitCRLF). Rows without an LMK key are dropped in Arrow (empty
+    batches are skipped).
+    """
+    with zf.open(name) as f:
+        # Header from the same stream (utf-8-sig drops a BOM, as in the DictReader
+        # path); Arrow then reads the remaining rows with those column names.
+        header = next(csv.reader([f.readline().decode("utf-8-sig", errors="replace")]), [])
+        if not header or not f.peek(1):  # empty member, or header only (Arrow rejects both)
+            return
+        reader = pacsv.open_csv(
+            _NoSplitCRLF(f),
+            read_options=pacsv.ReadOptions(block_size=_CSV_BLOCK_SIZE, column_names=header),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(column_types={c: pa.binary() for c in header}),
+        )
+        lmk_col = next((c for c in _LMK_COLUMNS if c in header), None)
+        for raw in reader:
+            batch = pa.RecordBatch.from_arrays([_utf8_column(c) for c in raw.columns], names=raw.schema.names)
+            if lmk_col is not None:
+                col = batch.column(lmk_col)
+                batch = batch.filter(pc.and_(pc.is_valid(col), pc.not_equal(col, "")))
+            if batch.num_rows:
+                yield batch
+
+
+def _iter_csv_rows_arrow(zf: zipfile.ZipFile, name: str) -> Iterator[Dict[str, Any]]:
+    """Stream CSV rows (dicts) with pyarrow, one RecordBatch at a time."""
+    for batch in _iter_csv_batches_arrow(zf, name):
+        yield from batch.to_pylist()
+
+
+def _arrow_iso_dates(col: "pa.Array") -> "pa.Array":
+    """
+    date32 column for 'YYYY-MM-DD' strings; anything else becomes NULL.
 
-def _iter_recs_from_zip(zip_path: str) -> Iterator[Dict[str, Any]]:
+    strptime alone also accepts unpadded parts and rolls invalid days over
+    ('2024-02-30' -> 2024-03-01), so a value is kept only if it has the exact
+    shape and formats back to itself, matching parse_iso_date.
+    """
+    parsed = pc.strptime(col, format="%Y-%m-%d", unit="s", error_is_null=True)
+    exact = pc.and_(
+        pc.match_substring_regex(col, r"^\d{4}-\d{2}-\d{2}$"),
+        pc.equal(pc.strftime(parsed, format="%Y-%m-%d"), col),
+    )
+    return pc.if_else(exact, parsed, pa.scalar(None, parsed.type)).cast(pa.date32())
+
+
+def _rec_batches_to_envelopes(batches: Iterable["pa.RecordBatch"]) -> Iterator["pa.RecordBatch"]:
+    """
+    Columnar equivalent of `_normalize_rec` for Arrow CSV batches.
+
+    LMK filtering (null/empty keys are dropped) and date validation run as
+    Arrow kernels (invalid or non-'YYYY-MM-DD' dates become NULL); the only
+    per-row work left is encoding each payload as JSON. Yields landing-schema
+    batches ready for Parquet.
+    """
+    for batch in batches:
+        names = batch.schema.names
+        lmk_col = next((c for c in _LMK_COLUMNS if c in names), None)
+        if lmk_col is None:
+            continue  # no LMK column: _normalize_rec would drop every row
+        lmk = batch.column(lmk_col)
+        batch = batch.filter(pc.and_(pc.is_valid(lmk), pc.not_equal(lmk, "")))
+        if not batch.num_rows:
+            continue
+        date_col = next((c for c in _DATE_COLUMNS if c in names), None)
+        if date_col is None:
+            dates = pa.nulls(batch.num_rows, pa.date32())
+        else:
+            dates = _arrow_iso_dates(batch.column(date_col))
+        yield envelope_batch(batch.column(lmk_col), dates, batch.to_pylist())
+
+
+def _find_recs_csv(zf: zipfile.ZipFile) -> str:
+    """Pick the recommendations CSV member (by name, else the first CSV)."""
+    names = zf.namelist()
+    for n in names:
+        lower = n.lower()
+        if lower.endswith(".csv") and ("recom" in lower or "recommendation" in lower):
+            return n
+    for n in names:
+        if n.lower().endswith(".csv"):
+            return n
+    raise RuntimeError("No CSV file found in ZIP")
+
+
+def _iter_recs_from_zip(zip_path: Union[str, BinaryIO]) -> Iterator[Dict[str, Any]]:
     """
     Yield recommendation rows (dicts) from a yearly ZIP that contains a CSV file.
     We pick the first file that looks like a recommendations CSV.
+
+    Uses pyarrow's streaming CSV reader when installed; otherwise csv.DictReader.
     """
     with zipfile.ZipFile(zip_path, "r") as zf:
-        # find a member with recommendations in the name or .csv
-        name = None
-        for n in zf.namelist():
-            lower = n.lower()
-            if lower.endswith(".csv") and ("recom" in lower or "recommendation" in lower):
-                name = n
-                break
-        if name is None:
-            # fallback: any csv
-            for n in zf.namelist():
-                if n.lower().endswith(".csv"):
-                    name = n
-                    break
-        if name is None:
-            raise RuntimeError("No CSV file found in ZIP")
+        name = _find_recs_csv(zf)
+
+        if _PYARROW_AVAILABLE:
+            yield from _iter_csv_rows_arrow(zf, name)
+            return
 
         with zf.open(name) as f:
-            text = io.TextIOWrapper(f, encoding="utf-8", errors="replace", newline="")
+            text = io.TextIOWrapper(f, encoding="utf-8-sig", errors="replace", newline="")
             reader = csv.DictReader(text)
             for row in reader:
                 yield row
 
 
+def _iter_rec_batches_from_zip(zip_path: Union[str, BinaryIO]) -> Iterator["pa.RecordBatch"]:
+    """
+    Yield landing-schema RecordBatches from a yearly ZIP (requires pyarrow).
+
+    There is no row-based fallback here, so this relies on _iter_csv_batches_arrow
+    reading multi-line quoted values and invalid UTF-8 the way csv.DictReader does.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        yield from _rec_batches_to_envelopes(_iter_csv_batches_arrow(zf, _find_recs_csv(zf)))
+
+
 def run_year(
     kind: str,
     year: int,
@@ -317,23 +680,30 @@ def run_year(
         # No source provided; nothing to do (explicit and safe)
         return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-source"}
 
-    zip_path = _download_zip_to_temp(source, project=settings.project_id)
-    if not zip_path:
-        return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-source"}
-
-    # Parse CSV rows and normalize
-    rows: List[Dict[str, Any]] = []
-    for rec in _iter_recs_from_zip(zip_path):
-        n = _normalize_rec(rec)
-        if n:
-            rows.append(n)
-
-    if not rows:
-        return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-recs"}
-
-    # Write & load
-    key = _gcs_key_year(kind, year)
-    uri = write_ndjson_gcs(settings.project_id, settings.bucket, key, rows)
+    with _open_zip_source(source, project=settings.project_id) as zip_file:
+        if zip_file is None:
+            return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-source"}
+
+        if _PYARROW_AVAILABLE and parquet_supported():
+            # Columnar path: CSV batches -> envelope batches -> Parquet, no per-row envelopes.
+            # Parquet is columnar and loads in fewer slot-seconds than NDJSON.
+            batches = peek_iter(_iter_rec_batches_from_zip(zip_file))
+            if batches is None:
+                return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-recs"}
+            rows = CountingIterator(batches, weight=lambda b: b.num_rows)
+            key = _gcs_key_year(kind, year, ext="parquet")
+            uri = write_parquet_gcs(settings.project_id, settings.bucket, key, rows)
+            source_format = bigquery.SourceFormat.PARQUET
+        else:
+            # Parse CSV rows and normalize lazily; rows stream straight into the upload
+            normalized = (n for n in map(_normalize_rec, _iter_recs_from_zip(zip_file)) if n)
+            first = peek_iter(normalized)
+            if first is None:
+                return {"mode": "backfill", "kind": kind, "year": year, "rows": 0, "status": "no-recs"}
+            rows = CountingIterator(first)
+            key = _gcs_key_year(kind, year)
+            uri = write_ndjson_gcs(settings.project_id, settings.bucket, key, rows)
+            source_format = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
 
     _, recs_table = _resolve_tables(kind)
     table_id = load_bq_raw(
@@ -344,13 +714,14 @@ def run_year(
         gs_uri=uri,
         is_new_table=False,
         clustering=["lmk_key"],
+        source_format=source_format,
     )
 
     return {
         "mode": "backfill",
         "kind": kind,
         "year": year,
-        "rows": len(rows),
+        "rows": rows.count,
         "gcs_uri": uri,
         "table": table_id,
         "status": "loaded",
@@ -5,8 +5,8 @@ from __future__ import annotations
 """
 Domestic EPC monthly ingestion:
 - Pull JSON certificates via EPC API (search-after pagination)
-- Normalize to a minimal, stable envelope
-- Write NDJSON (gz) to GCS at a deterministic key
+- Normalize to a minimal, stable envelope plus the curated typed columns
+- Stream NDJSON (gz) to GCS at a deterministic key (fetch -> normalize -> upload in one pass)
 - Load into BigQuery raw table with partitioning/clustering on first create
 
 Public API
@@ -22,13 +22,20 @@ python -m dame_epc.domestic --month 2024-01
 
 import datetime as _dt
 import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 from google.cloud import bigquery
 
 from .epc_api import fetch_certificates_json
-from .io_utils import ensure_dataset, gcs_key, load_bq_raw, write_ndjson_gcs
-from .schema import DOMESTIC_CLUSTERING, DOMESTIC_RAW_TABLE
+from .io_utils import CountingIterator, ensure_dataset, gcs_key, load_bq_raw, peek_iter, write_ndjson_gcs
+from .schema import (
+    DOMESTIC_CLUSTERING,
+    DOMESTIC_CURATED_FIELDS,
+    DOMESTIC_RAW_TABLE,
+    curated_values,
+    get_raw_schema,
+    parse_iso_date,
+)
 from .settings import Settings, settings as _settings
 
 KIND = "domestic"
@@ -48,39 +55,22 @@ def _parse_month(month: str) -> Tuple[_dt.date, _dt.date, str]:
 
 
 def _normalize(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Normalize raw EPC record to envelope; skip if no LMK."""
-    def g(d: Dict[str, Any], *keys: str) -> Any:
-        for k in keys:
-            if k in d:
-                return d[k]
-        return None
-
-    lmk = g(rec, "lmk_key", "lmk-key", "LMK_KEY")
+    """Normalize raw EPC record to envelope (plus curated columns); skip if no LMK."""
+    lmk = rec.get("lmk_key") or rec.get("lmk-key") or rec.get("LMK_KEY")
     if not lmk:
         return None
-    lmk = str(lmk)
-
-    uprn = g(rec, "uprn", "UPRN")
-    uprn = str(uprn) if uprn not in (None, "") else None
 
-    postcode = g(rec, "postcode", "POSTCODE")
-    postcode = str(postcode) if postcode not in (None, "") else None
-
-    lodg = g(rec, "lodgement_date", "lodgement-date", "LODgement-Date")
-    if isinstance(lodg, str):
-        try:
-            _dt.date.fromisoformat(lodg)
-        except Exception:
-            lodg = None
-    else:
-        lodg = None
+    uprn = rec.get("uprn") or rec.get("UPRN")
+    postcode = rec.get("postcode") or rec.get("POSTCODE")
+    lodg = rec.get("lodgement_date") or rec.get("lodgement-date") or rec.get("LODgement-Date")
 
     return {
-        "lmk_key": lmk,
-        "lodgement_date": lodg,
-        "postcode": postcode,
-        "uprn": uprn,
+        "lmk_key": str(lmk),
+        "lodgement_date": parse_iso_date(lodg) if isinstance(lodg, str) else None,
+        "postcode": str(postcode) if postcode else None,
+        "uprn": str(uprn) if uprn else None,
         "payload": rec,
+        **curated_values(rec, DOMESTIC_CURATED_FIELDS),
     }
 
 
@@ -89,21 +79,16 @@ def _normalize(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 # ---------------------------
 
 
-def run_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
+def stage_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
     """
-    Ingest one calendar month of domestic EPC certificates.
-
-    Args:
-        month: 'YYYY-MM'
-        settings: loaded Settings (defaults to global settings)
+    Fetch one month of domestic certificates and write them to GCS without loading.
 
     Returns:
-        Dict with summary: {kind, month, rows, gcs_uri, table, status}
+        Dict with summary: {kind, month, rows, gcs_uri, status} where status is
+        "staged" or "no-data".
     """
-    # Ensure dataset exists
-    ensure_dataset(settings.project_id, settings.dataset_raw, settings.bq_location)
-
-    # Fetch & normalize
+    # Fetch & normalize lazily: records flow page by page into the upload,
+    # so the month is never held in memory as a list.
     raw_iter = fetch_certificates_json(
         kind=KIND,
         month=month,
@@ -113,38 +98,51 @@ def run_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
         retry_max=settings.retry_max,
         retry_backoff=settings.retry_backoff,
     )
-    rows: List[Dict[str, Any]] = []
-    for rec in raw_iter:
-        norm = _normalize(rec)
-        if norm:
-            rows.append(norm)
-
-    if not rows:
+    normalized = peek_iter(n for n in map(_normalize, raw_iter) if n)
+    if normalized is None:
         return {"kind": KIND, "month": month, "rows": 0, "status": "no-data"}
+    rows = CountingIterator(normalized)
 
-    # Write to GCS
     key = gcs_key(KIND, month, "certs")
     uri = write_ndjson_gcs(settings.project_id, settings.bucket, key, rows)
+    return {"kind": KIND, "month": month, "rows": rows.count, "gcs_uri": uri, "status": "staged"}
 
-    # Load to BigQuery
-    table_id = load_bq_raw(
+
+def load_staged(gs_uris: Union[str, Sequence[str]], settings: Settings = _settings) -> str:
+    """Load one or more staged NDJSON files into the domestic raw table with a single job."""
+    return load_bq_raw(
         project=settings.project_id,
         dataset=settings.dataset_raw,
         table=DOMESTIC_RAW_TABLE,
         region=settings.bq_location,
-        gs_uri=uri,
+        gs_uri=gs_uris,
         is_new_table=False,  # create options applied automatically if table is missing
         clustering=DOMESTIC_CLUSTERING,
+        require_partition_filter=settings.require_partition_filter,
+        schema=get_raw_schema(KIND),
     )
 
-    return {
-        "kind": KIND,
-        "month": month,
-        "rows": len(rows),
-        "gcs_uri": uri,
-        "table": table_id,
-        "status": "loaded",
-    }
+
+def run_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
+    """
+    Ingest one calendar month of domestic EPC certificates.
+
+    Args:
+        month: 'YYYY-MM'
+        settings: loaded Settings (defaults to global settings)
+
+    Returns:
+        Dict with summary: {kind, month, rows, gcs_uri, table, status}
+    """
+    # Ensure dataset exists
+    ensure_dataset(settings.project_id, settings.dataset_raw, settings.bq_location)
+
+    res = stage_month(month, settings)
+    if res["status"] != "staged":
+        return res
+
+    table_id = load_staged(res["gcs_uri"], settings)
+    return {**res, "table": table_id, "status": "loaded"}
 
 
 # ---------------------------
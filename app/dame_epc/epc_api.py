@@ -29,18 +29,55 @@ Notes
 - Pagination uses response header "X-Next-Search-After" to request the next page.
 - For robustness, we accept both {"rows":[...]} and raw list responses.
 - Network errors and non-2xx (except 404 on recommendations) raise RuntimeError with context.
+- One pooled requests.Session is shared per retry policy (thread-safe for GETs),
+  so repeated calls reuse keep-alive connections.
+- Certificate pages are stream-parsed with `ijson` when installed, so records are
+  yielded while the page is still downloading; otherwise each page is decoded in
+  one go (with `orjson` when installed).
 """
 
 import datetime as _dt
-from typing import Dict, Iterable, Iterator, List, Tuple
+import functools
+import io
+import json
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as _Urllib3HTTPError
 from urllib3.util.retry import Retry
 
+# Optional: incremental JSON parsing of large search pages
+try:
+    import ijson  # type: ignore
+
+    _IJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _IJSON_AVAILABLE = False
+
+# Optional: fast whole-document JSON decoding
+try:
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _ORJSON_AVAILABLE = False
+
 BASE_URL = "https://epc.opendatacommunities.org/api/v1"
 VALID_KINDS = {"domestic", "non-domestic"}
 
+# Connection pool sizing: enough for the recommendations thread pool. The pool
+# blocks when exhausted instead of opening throwaway (non-keep-alive) sockets.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+_POOL_BLOCK = True
+
+_HEADERS = {"Accept": "application/json"}
+
+_SESSIONS: Dict[Tuple[int, float], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
 
 # ---------------------------
 # Helpers
@@ -55,7 +92,7 @@ def _month_bounds(month: str) -> tuple[_dt.date, _dt.date]:
     return start, end
 
 
-def _build_session(retry_max: int, backoff: float) -> requests.Session:
+def _new_session(retry_max: int, backoff: float) -> requests.Session:
     """Retrying session for resilient API calls."""
     s = requests.Session()
     retry = Retry(
@@ -66,13 +103,74 @@ def _build_session(retry_max: int, backoff: float) -> requests.Session:
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=frozenset({"GET"}),
         raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        pool_block=_POOL_BLOCK,
     )
-    adapter = HTTPAdapter(max_retries=retry)
     s.mount("https://", adapter)
     s.mount("http://", adapter)
     return s
 
 
+@functools.lru_cache(maxsize=4)
+def _basic_auth(auth: Tuple[str, str]) -> requests.auth.HTTPBasicAuth:
+    """HTTP Basic auth object per credential pair (built once, reused by every request)."""
+    return requests.auth.HTTPBasicAuth(*auth)
+
+
+def _build_session(retry_max: int, backoff: float) -> requests.Session:
+    """
+    Return the process-wide retrying session for this retry policy.
+
+    Sessions are cached per (retry_max, backoff) so keep-alive connections (and
+    their TLS handshakes) are reused across pages, LMKs and worker threads.
+    """
+    key = (retry_max, backoff)
+    with _SESSIONS_LOCK:
+        s = _SESSIONS.get(key)
+        if s is None:
+            s = _SESSIONS[key] = _new_session(retry_max, backoff)
+        return s
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON document (orjson when available). Raises ValueError on bad JSON."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _rows_of(data: Any) -> List[Dict]:
+    """Accept both {"rows": [...]} and raw list responses."""
+    return data.get("rows", []) if isinstance(data, dict) else (data if isinstance(data, list) else [])
+
+
+def _iter_page_rows(r: requests.Response) -> Iterator[Dict]:
+    """
+    Yield the records of one search page.
+
+    With ijson the (streamed) body is parsed incrementally; the first
+    non-whitespace byte tells a raw list apart from a {"rows": [...]} object.
+    Raises ValueError on malformed JSON.
+    """
+    if not _IJSON_AVAILABLE:
+        yield from _rows_of(_loads(r.content))
+        return
+
+    r.raw.decode_content = True  # let urllib3 undo gzip/deflate
+    r.raw.auto_close = False  # keep readinto() valid at EOF for the buffered wrapper
+    body = io.BufferedReader(r.raw, buffer_size=64 * 1024)
+    prefix = "item" if body.peek(64)[:64].lstrip()[:1] == b"[" else "rows.item"
+    try:
+        yield from ijson.items(body, prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+
+
 def _check_kind(kind: str) -> str:
     if kind not in VALID_KINDS:
         raise ValueError(f"kind must be one of {sorted(VALID_KINDS)}, got {kind!r}")
@@ -114,48 +212,49 @@ def fetch_certificates_json(
     _check_kind(kind)
     start, end = _month_bounds(month)
     url = f"{BASE_URL}/{kind}/search"
-    headers = {"Accept": "application/json"}
-    basic = requests.auth.HTTPBasicAuth(*auth)
+    basic = _basic_auth(tuple(auth))
     session = _build_session(retry_max, retry_backoff)
 
+    base_params = {
+        "from-year": start.year,
+        "from-month": start.month,
+        "to-year": end.year,
+        "to-month": end.month,
+        "size": page_size,
+    }
+
     search_after = None
     while True:
-        params = {
-            "from-year": start.year,
-            "from-month": start.month,
-            "to-year": end.year,
-            "to-month": end.month,
-            "size": page_size,
-        }
-        if search_after:
-            params["search-after"] = search_after
+        params = {**base_params, "search-after": search_after} if search_after else base_params
 
         try:
-            r = session.get(url, params=params, headers=headers, auth=basic, timeout=timeout)
+            r = session.get(url, params=params, headers=_HEADERS, auth=basic, timeout=timeout, stream=True)
         except requests.RequestException as e:
             raise RuntimeError(f"EPC {kind} search request failed: {e}") from e
 
-        # Unauthorized gets a special message
-        if r.status_code == 401:
-            raise RuntimeError("EPC 401 Unauthorized: check EPC_EMAIL/EPC_API_KEY")
-
-        if r.status_code // 100 != 2:
-            raise RuntimeError(
-                f"EPC {kind} search HTTP {r.status_code}: {r.text[:200]} (params={params})"
-            )
-
-        try:
-            data = r.json()
-        except ValueError as e:
-            raise RuntimeError(f"EPC {kind} search returned non-JSON payload") from e
-
-        rows = data.get("rows", data if isinstance(data, list) else [])
-        if not rows:
+        with r:
+            # Unauthorized gets a special message
+            if r.status_code == 401:
+                raise RuntimeError("EPC 401 Unauthorized: check EPC_EMAIL/EPC_API_KEY")
+
+            if r.status_code // 100 != 2:
+                raise RuntimeError(
+                    f"EPC {kind} search HTTP {r.status_code}: {r.text[:200]} (params={params})"
+                )
+
+            n = 0
+            try:
+                for rec in _iter_page_rows(r):
+                    n += 1
+                    yield rec
+            except ValueError as e:
+                raise RuntimeError(f"EPC {kind} search returned non-JSON payload") from e
+            except (requests.RequestException, _Urllib3HTTPError) as e:
+                raise RuntimeError(f"EPC {kind} search response read failed: {e}") from e
+
+        if not n:
             break
 
-        for rec in rows:
-            yield rec
-
         # Advance pagination
         search_after = r.headers.get("X-Next-Search-After")
         if not search_after:
@@ -169,6 +268,7 @@ def fetch_recommendations_by_lmk(
     auth: Tuple[str, str],
     retry_max: int = 5,
     retry_backoff: float = 2.0,
+    session: Optional[requests.Session] = None,
 ) -> List[Dict]:
     """
     Fetch recommendation rows for a given LMK key.
@@ -180,6 +280,8 @@ def fetch_recommendations_by_lmk(
         auth: (email, api_key) tuple
         retry_max: total retry attempts for transient errors
         retry_backoff: exponential backoff factor in seconds
+        session: optional session override; defaults to the cached session for
+                 this retry policy
 
     Returns:
         list of recommendation dicts (may be empty).
@@ -190,12 +292,12 @@ def fetch_recommendations_by_lmk(
     """
     _check_kind(kind)
     url = f"{BASE_URL}/{kind}/recommendations/{lmk_key}"
-    headers = {"Accept": "application/json"}
-    basic = requests.auth.HTTPBasicAuth(*auth)
-    session = _build_session(retry_max, retry_backoff)
+    basic = _basic_auth(tuple(auth))
+    if session is None:
+        session = _build_session(retry_max, retry_backoff)
 
     try:
-        r = session.get(url, headers=headers, auth=basic, timeout=timeout)
+        r = session.get(url, headers=_HEADERS, auth=basic, timeout=timeout)
     except requests.RequestException as e:
         raise RuntimeError(f"EPC {kind} recommendations request failed: {e}") from e
 
@@ -209,13 +311,12 @@ def fetch_recommendations_by_lmk(
         )
 
     try:
-        data = r.json()
+        data = _loads(r.content)
     except ValueError as e:
         raise RuntimeError("EPC recommendations returned non-JSON payload") from e
 
     # API may return {"rows":[..]} or list
-    rows = data.get("rows", data if isinstance(data, list) else [])
-    return rows
+    return _rows_of(data)
 
 
 __all__ = [
@@ -15,27 +15,137 @@ gcs_key(kind, month, what) -> str
     Return a deterministic GCS key like:
     'epc/json/{kind}/{YYYYMM}/{what}/part-0001.json.gz'
 
+open_upload(blob, content_type, chunk_size=16 MiB) -> context manager
+    Resumable-upload writer that is finalized only if the block completes;
+    on an exception the upload is cancelled and no object is written.
+
 write_ndjson_gcs(project, bucket, key, objs) -> str
-    Write gzipped NDJSON to GCS and return 'gs://bucket/key'.
+    Stream gzipped NDJSON to GCS (resumable upload) and return 'gs://bucket/key'.
+
+peek_iter(objs) -> Iterator | None
+    Return an iterator over objs, or None if objs is empty.
+
+CountingIterator(objs, weight=None)
+    Pass-through iterator exposing `.count` of items (or weighted items) yielded so far.
+
+write_parquet_gcs(project, bucket, key, batches) -> str
+    Stream Arrow RecordBatches to GCS as a zstd Parquet file (requires pyarrow).
+
+envelope_batch(lmk_keys, lodgement_dates, payloads, postcodes=None, uprns=None) -> RecordBatch
+    Assemble a landing-schema RecordBatch from Arrow columns (payloads JSON-encoded).
 
 ensure_dataset(project, dataset, region) -> None
     Create the dataset if it does not exist (in the chosen region).
 
-load_bq_raw(project, dataset, table, region, gs_uri, is_new_table=False, clustering=None) -> str
-    Load NDJSON from GCS into a BigQuery table with the minimal landing schema.
+load_bq_raw(project, dataset, table, region, gs_uri, is_new_table=False, clustering=None,
+            source_format=NEWLINE_DELIMITED_JSON, require_partition_filter=False, schema=None) -> str
+    Load NDJSON (or Parquet) from GCS into a BigQuery table with the minimal landing schema.
     If the table doesn't exist (or is_new_table=True), set partitioning and clustering.
     Returns the fully-qualified table id.
 """
 
-import gzip
-import io
-from typing import Iterable, List, Optional
+import contextlib
+import itertools
+import json
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
 from .schema import PARTITION_FIELD, get_raw_schema
 
+# Optional fast JSON encoder
+try:
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _ORJSON_AVAILABLE = False
+
+# Optional SIMD-accelerated gzip (python-isal); drop-in for the stdlib module.
+try:
+    from isal import igzip as _gzip  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    import gzip as _gzip
+
+# NDJSON compresses nearly as well at level 1 as at 9, at a fraction of the CPU.
+_GZIP_LEVEL = 1
+
+# Optional Parquet support. The JSON extension type (pyarrow >= 19) is needed so
+# `payload` carries the Parquet JSON logical type and lands in a BigQuery JSON column.
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+
+    _PARQUET_AVAILABLE = hasattr(pa, "json_")
+except Exception:  # pragma: no cover - optional dependency
+    _PARQUET_AVAILABLE = False
+
+# Rows per Parquet row group / Arrow batch.
+_PARQUET_ROW_GROUP_SIZE = 128_000
+
+# Resumable upload chunk size for streamed writes (must be a multiple of 256 KiB).
+_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# ---------------------------
+# Serialization
+# ---------------------------
+
+
+def _ndjson_line(o: Any) -> bytes:
+    """Encode one object as a UTF-8 JSON line (trailing newline included)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(o, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(o, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _json_text(o: Any) -> str:
+    """Encode one object as a JSON string (for Parquet JSON columns)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(o, ensure_ascii=False)
+
+
+# ---------------------------
+# Iteration helpers
+# ---------------------------
+
+
+def peek_iter(objs: Iterable[Any]) -> Optional[Iterator[Any]]:
+    """
+    Return an iterator equivalent to `objs`, or None if it yields nothing.
+
+    Only the first item is consumed to decide; it is re-attached to the result.
+    Lets callers skip writes for empty months without materializing a list.
+    """
+    it = iter(objs)
+    for first in it:
+        return itertools.chain((first,), it)
+    return None
+
+
+class CountingIterator:
+    """
+    Pass-through iterator that counts the items it yields (see `.count`).
+
+    `weight` maps an item to how much it adds to the count (e.g. rows per
+    RecordBatch); by default each item counts once.
+    """
+
+    def __init__(self, objs: Iterable[Any], weight: Optional[Callable[[Any], int]] = None) -> None:
+        self._it = iter(objs)
+        self._weight = weight
+        self.count = 0
+
+    def __iter__(self) -> "CountingIterator":
+        return self
+
+    def __next__(self) -> Any:
+        item = next(self._it)
+        self.count += 1 if self._weight is None else self._weight(item)
+        return item
+
+
 # ---------------------------
 # GCS helpers
 # ---------------------------
@@ -62,22 +172,123 @@ def gcs_key(kind: str, month: str, what: str) -> str:
     return f"epc/json/{kind}/{_yyyymm(month)}/{what}/part-0001.json.gz"
 
 
+@contextlib.contextmanager
+def open_upload(
+    blob: storage.Blob, content_type: str, chunk_size: Optional[int] = _UPLOAD_CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Open a resumable-upload writer on `blob` that commits only on success.
+
+    `blob.open("wb")` used as a context manager finalizes whatever was buffered
+    when the block exits, on older google-cloud-storage releases even if it
+    exits with an exception, which would publish a truncated object (e.g. a
+    gzip stream cut off mid-month). Here the writer is closed (and the object
+    created) only when the block completes; otherwise the upload session is
+    cancelled and the exception re-raised. An existing object at the key is
+    left untouched. `chunk_size=None` uses the library default.
+    """
+    raw = blob.open("wb", content_type=content_type, chunk_size=chunk_size, ignore_flush=True)
+    try:
+        yield raw
+    except BaseException:
+        terminate = getattr(raw, "terminate", None)  # added in google-cloud-storage 2.x
+        if terminate is not None:
+            terminate()
+        raise
+    raw.close()
+
+
 def write_ndjson_gcs(project: str, bucket: str, key: str, objs: Iterable[dict]) -> str:
     """
-    Write gzipped NDJSON to GCS and return the gs:// URI.
+    Stream gzipped NDJSON to GCS and return the gs:// URI.
 
     Notes:
-        - One JSON object per line, UTF-8 encoded.
-        - Uses in-memory buffer; suitable for typical monthly batches.
+        - One JSON object per line, UTF-8 encoded (orjson when installed).
+        - gzip level 1 (python-isal's igzip when installed): much cheaper CPU
+          for a few percent larger objects.
+        - `objs` is consumed once; pass a generator so rows are compressed and
+          uploaded as they are produced. Peak memory is one upload chunk, not
+          the whole month.
+        - The object is pre-gzipped (Content-Type application/gzip, no
+          Content-Encoding); BigQuery detects the compression on load.
+        - An empty iterable still creates an (empty) object; use `peek_iter`
+          upstream to skip the write entirely.
+        - If `objs` raises, the upload is cancelled (see open_upload): no
+          truncated object is left at `key` and the error propagates.
+    """
+    client = storage.Client(project=project)
+    blob = client.bucket(bucket).blob(key)
+    # The body is already gzipped: store it as an opaque .gz object. No
+    # Content-Encoding (avoids decompressive transcoding on download) and
+    # no-transform so intermediaries don't try to recompress it.
+    blob.content_encoding = None
+    blob.cache_control = "no-transform"
+    with open_upload(blob, "application/gzip") as raw:
+        # mtime=0: identical input gives byte-identical objects
+        with _gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=_GZIP_LEVEL, mtime=0) as gz:
+            for o in objs:
+                gz.write(_ndjson_line(o))
+    return f"gs://{bucket}/{key}"
+
+
+def parquet_supported() -> bool:
+    """True if pyarrow (with the JSON extension type) is installed."""
+    return _PARQUET_AVAILABLE
+
+
+def _raw_arrow_schema() -> "pa.Schema":
+    """Arrow mirror of get_raw_schema() for Parquet landing files."""
+    return pa.schema(
+        [
+            pa.field("lmk_key", pa.string(), nullable=False),
+            pa.field("lodgement_date", pa.date32()),
+            pa.field("postcode", pa.string()),
+            pa.field("uprn", pa.string()),
+            pa.field("payload", pa.json_(pa.string())),
+        ]
+    )
+
+
+def envelope_batch(
+    lmk_keys: "pa.Array",
+    lodgement_dates: "pa.Array",
+    payloads: Iterable[Any],
+    postcodes: Optional["pa.Array"] = None,
+    uprns: Optional["pa.Array"] = None,
+) -> "pa.RecordBatch":
+    """
+    Assemble one landing-schema RecordBatch from Arrow columns.
+
+    `lodgement_dates` must be date32; each payload is encoded to JSON text.
+    Missing postcode/uprn columns are filled with nulls.
+    """
+    n = len(lmk_keys)
+    payload = pa.array([_json_text(p) for p in payloads], type=pa.string())
+    return pa.RecordBatch.from_arrays(
+        [
+            lmk_keys,
+            lodgement_dates,
+            postcodes if postcodes is not None else pa.nulls(n, pa.string()),
+            uprns if uprns is not None else pa.nulls(n, pa.string()),
+            pa.ExtensionArray.from_storage(pa.json_(pa.string()), payload),
+        ],
+        schema=_raw_arrow_schema(),
+    )
+
+
+def write_parquet_gcs(project: str, bucket: str, key: str, batches: Iterable["pa.RecordBatch"]) -> str:
     """
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-        for o in objs:
-            gz.write((bigquery._helpers._json.dumps(o, ensure_ascii=False) + "\n").encode("utf-8"))  # type: ignore[attr-defined]
+    Stream RecordBatches to GCS as one zstd-compressed Parquet file; return the gs:// URI.
 
+    Batches must follow the landing schema (see envelope_batch). Like
+    write_ndjson_gcs, data is uploaded as it is produced (resumable upload).
+    """
     client = storage.Client(project=project)
     blob = client.bucket(bucket).blob(key)
-    blob.upload_from_string(buf.getvalue(), content_type="application/gzip")
+    with open_upload(blob, "application/octet-stream") as raw:
+        with pq.ParquetWriter(raw, _raw_arrow_schema(), compression="zstd") as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=_PARQUET_ROW_GROUP_SIZE)
     return f"gs://{bucket}/{key}"
 
 
@@ -102,12 +313,19 @@ def ensure_dataset(project: str, dataset: str, region: str) -> None:
     client.create_dataset(ds, exists_ok=True)
 
 
+# Tables seen to exist in this process (skips repeat get_table() probes).
+_TABLE_EXISTS: Set[str] = set()
+
+
 def _table_exists(client: bigquery.Client, table_id: str) -> bool:
+    if table_id in _TABLE_EXISTS:
+        return True
     try:
         client.get_table(table_id)
-        return True
     except NotFound:
         return False
+    _TABLE_EXISTS.add(table_id)
+    return True
 
 
 def load_bq_raw(
@@ -115,22 +333,33 @@ def load_bq_raw(
     dataset: str,
     table: str,
     region: str,
-    gs_uri: str,
+    gs_uri: Union[str, Sequence[str]],
     is_new_table: bool = False,
     clustering: Optional[List[str]] = None,
+    source_format: str = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+    require_partition_filter: bool = False,
+    schema: Optional[List[bigquery.SchemaField]] = None,
 ) -> str:
     """
-    Load NDJSON from GCS into a BigQuery raw table with the minimal landing schema.
+    Load NDJSON (or Parquet) from GCS into a BigQuery raw table with the minimal landing schema.
 
     Args:
         project: GCP project id.
         dataset: BigQuery dataset id.
         table: Target table id (without project/dataset).
         region: BigQuery job location (e.g., 'europe-west2').
-        gs_uri: gs:// URI of the gzipped NDJSON file.
+        gs_uri: gs:// URI of the gzipped NDJSON file, a wildcard URI, or a list of
+                URIs; several files are committed by a single load job.
         is_new_table: If True, force table-creation options (partitioning/clustering).
                       If False, options are applied only when the table doesn't exist.
         clustering: Optional clustering fields to set on first create.
+        source_format: bigquery.SourceFormat value. Parquet is self-describing, so
+                       no explicit schema is sent for it.
+        require_partition_filter: On first create, reject queries that don't filter
+                       on the partition field (forces partition pruning). Leave
+                       off for tables whose views scan without a date filter.
+        schema: Landing schema for NDJSON loads (default: get_raw_schema()). Fields
+                missing from an existing table are added by the load job.
 
     Returns:
         Fully-qualified table id as a string.
@@ -142,24 +371,38 @@ def load_bq_raw(
     create_opts = is_new_table or not exists
 
     cfg = bigquery.LoadJobConfig(
-        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        source_format=source_format,
         write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-        schema=get_raw_schema(),
-        ignore_unknown_values=True,
     )
+    if source_format != bigquery.SourceFormat.PARQUET:
+        cfg.schema = schema if schema is not None else get_raw_schema()
+        cfg.ignore_unknown_values = True
+        if not create_opts:
+            cfg.schema_update_options = [bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
     if create_opts:
-        cfg.time_partitioning = bigquery.TimePartitioning(field=PARTITION_FIELD)
+        cfg.time_partitioning = bigquery.TimePartitioning(
+            field=PARTITION_FIELD,
+            require_partition_filter=require_partition_filter,
+        )
         if clustering:
             cfg.clustering_fields = clustering
 
-    job = client.load_table_from_uri(gs_uri, table_id, job_config=cfg, location=region)
+    uris = gs_uri if isinstance(gs_uri, str) else list(gs_uri)
+    job = client.load_table_from_uri(uris, table_id, job_config=cfg, location=region)
     job.result()
+    _TABLE_EXISTS.add(table_id)
     return table_id
 
 
 __all__ = [
+    "peek_iter",
+    "CountingIterator",
     "gcs_key",
+    "open_upload",
     "write_ndjson_gcs",
+    "parquet_supported",
+    "envelope_batch",
+    "write_parquet_gcs",
     "ensure_dataset",
     "load_bq_raw",
 ]
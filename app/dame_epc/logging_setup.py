@@ -10,6 +10,9 @@ Goals
 - One-line setup: `from dame_epc.logging_setup import setup_logging, get_logger; setup_logging()`
 - JSON logs to stdout by default (great for Cloud Run, Pipelines, local tailing).
 - Optional Google Cloud Logging handler if available and enabled.
+- Non-blocking: callers only enqueue records; a background QueueListener thread
+  formats and writes them (stopped, and drained, at interpreter exit). Stdout
+  is flushed per burst rather than per line (WARNING+ flush immediately).
 - Easy contextual logs via `LoggerAdapter` so you can bind fields like
   `kind`, `month`, `step`, `rows`, `gcs_uri`, `table`, `job_id`.
 
@@ -30,12 +33,16 @@ Environment knobs
 - ENABLE_GCLOUD_LOGGING: "1"/"true" to enable Cloud Logging handler if library present
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import socket
 import sys
-from datetime import datetime, timezone
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Mapping, Optional
 
 # Optional Google Cloud Logging
@@ -47,6 +54,43 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     _GCLOUD_LOGGING_AVAILABLE = False
 
+# Optional: fast JSON encoding for log lines
+try:
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _ORJSON_AVAILABLE = False
+
+# Resolved once: gethostname() is a syscall and the host does not change.
+# The pid is still read from record.process so forked workers report their own.
+_HOSTNAME = socket.gethostname()
+
+# Standard LogRecord attributes that are not user extras.
+_RESERVED_LOGRECORD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+    }
+)
 
 # ---------------------------
 # JSON formatter
@@ -59,40 +103,17 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         # Base envelope
         payload: Dict[str, Any] = {
-            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc)
-            .isoformat(timespec="milliseconds")
-            .replace("+00:00", "Z"),
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "pid": record.process,
-            "host": socket.gethostname(),
+            "host": _HOSTNAME,
         }
 
         # Extras: anything attached via LoggerAdapter or `extra=...`
         for k, v in record.__dict__.items():
-            if k in (
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            ):
+            if k in _RESERVED_LOGRECORD_KEYS:
                 continue
             # avoid overwriting base fields unless intentional
             if k not in payload:
@@ -100,9 +121,14 @@ class JsonFormatter(logging.Formatter):
 
         # Exception info
         if record.exc_info:
+            # Cache on the record like logging.Formatter does, so other handlers reuse it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             payload["exc_type"] = getattr(record.exc_info[0], "__name__", str(record.exc_info[0]))
-            payload["exc"] = self.formatException(record.exc_info)
+            payload["exc"] = record.exc_text
 
+        if _ORJSON_AVAILABLE:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
         return json.dumps(payload, ensure_ascii=False)
 
 
@@ -112,6 +138,70 @@ class JsonFormatter(logging.Formatter):
 
 
 _CONFIGURED = False
+_LISTENER: Optional["_FlushingQueueListener"] = None
+_ATEXIT_REGISTERED = False
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues a copy of the record with its message resolved.
+
+    The stock prepare() pre-formats the record and drops exc_info, which would
+    fold tracebacks into `message` and lose JsonFormatter's exc/exc_type fields
+    (and the structured record CloudLoggingHandler expects). Here only msg/args
+    are resolved (args may be mutated after the call returns); formatting is
+    left to the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that does not flush after every record.
+
+    Lines accumulate in the stream's buffer and go out in one write; WARNING+
+    records flush immediately, and the listener flushes whenever its queue
+    runs dry (see _FlushingQueueListener), so output lags only during bursts.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes buffered stream handlers before it waits for more records."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            self.flush_buffered()
+        return self.queue.get(block)
+
+    def flush_buffered(self) -> None:
+        for h in self.handlers:
+            if isinstance(h, _BufferedStreamHandler):
+                h.flush()
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, writing out queued records (idempotent)."""
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER.flush_buffered()
+        _LISTENER = None
 
 
 def _level_from_env(default: str = "INFO") -> int:
@@ -132,11 +222,12 @@ def setup_logging(force: bool = False) -> None:
     - StreamHandler to stdout with JSON formatting.
     - If ENABLE_GCLOUD_LOGGING is set and the library is available,
       attach a CloudLoggingHandler as well.
+    - Both run behind a QueueListener; the root logger only gets a QueueHandler.
 
     Args:
         force: if True, remove existing handlers and reconfigure.
     """
-    global _CONFIGURED
+    global _CONFIGURED, _LISTENER, _ATEXIT_REGISTERED
     if _CONFIGURED and not force:
         return
 
@@ -144,6 +235,7 @@ def setup_logging(force: bool = False) -> None:
     level = _level_from_env("INFO")
 
     if force:
+        _stop_listener()
         for h in list(root.handlers):
             root.removeHandler(h)
 
@@ -151,22 +243,34 @@ def setup_logging(force: bool = False) -> None:
         root.setLevel(level)
 
         # JSON to stdout (works everywhere)
-        sh = logging.StreamHandler(stream=sys.stdout)
+        sh = _BufferedStreamHandler(stream=sys.stdout)
         sh.setLevel(level)
         sh.setFormatter(JsonFormatter())
-        root.addHandler(sh)
+        handlers: list[logging.Handler] = [sh]
 
         # Optional: Cloud Logging handler (in addition to stdout)
+        cloud_failed = False
         if os.environ.get("ENABLE_GCLOUD_LOGGING", "").lower() in {"1", "true", "yes"} and _GCLOUD_LOGGING_AVAILABLE:
             try:
                 client = gcloud_logging.Client()  # ADC will be used if available
                 clh = CloudLoggingHandler(client)
                 clh.setLevel(level)
                 # No formatter: Cloud handler preserves structured fields in record.__dict__
-                root.addHandler(clh)
+                handlers.append(clh)
             except Exception:
-                # If Cloud Logging fails to init, keep stdout handler only.
-                root.warning("Cloud Logging handler not initialized; continuing with stdout JSON.")
+                cloud_failed = True
+
+        q: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _LISTENER = _FlushingQueueListener(q, *handlers, respect_handler_level=True)
+        _LISTENER.start()
+        root.addHandler(_RecordQueueHandler(q))
+        if not _ATEXIT_REGISTERED:
+            atexit.register(_stop_listener)
+            _ATEXIT_REGISTERED = True
+
+        if cloud_failed:
+            # If Cloud Logging fails to init, keep stdout handler only.
+            root.warning("Cloud Logging handler not initialized; continuing with stdout JSON.")
 
     _CONFIGURED = True
 
@@ -174,13 +278,22 @@ def setup_logging(force: bool = False) -> None:
 class ContextAdapter(logging.LoggerAdapter):
     """
     LoggerAdapter that merges context `extra` dicts (adapter.extra < call.extra).
+
+    Below-threshold calls cost one level check: LoggerAdapter.log() tests
+    isEnabledFor() before calling process(), and Logger.callHandlers() skips
+    handlers whose level is above the record's, so neither the context merge
+    nor JsonFormatter runs for suppressed records.
     """
 
     def process(self, msg: Any, kwargs: Mapping[str, Any]) -> tuple[Any, Mapping[str, Any]]:
-        call_extra = dict(kwargs.get("extra") or {})
-        merged = dict(self.extra or {})
-        merged.update(call_extra)
-        kwargs["extra"] = merged
+        # Logger.makeRecord only reads `extra`, so either side can be passed through uncopied.
+        call_extra = kwargs.get("extra")
+        if not self.extra:
+            return msg, kwargs
+        if not call_extra:
+            kwargs["extra"] = self.extra
+            return msg, kwargs
+        kwargs["extra"] = {**self.extra, **call_extra}
         return msg, kwargs
 
 
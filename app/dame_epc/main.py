@@ -28,17 +28,24 @@ python -m dame_epc.main --dry-run
 # Reset a step's checkpoint (e.g., re-run recs for a month):
 python -m dame_epc.main --kinds domestic --start 2024-01 --end 2024-01 --reset recs
 
+# Backfill a whole year: stage months concurrently, one BigQuery load per kind:
+python -m dame_epc.main --bulk-year 2023
+
 Notes
 -----
 - Checkpoints live in GCS under: state/{kind}/{YYYYMM}/{step}.json
   where step is "certs" or "recs".
-- Steps are sequential per month: certs -> recs (if enabled).
+- Steps are sequential per month: certs -> recs (if enabled). Different
+  (kind, month) cells run concurrently on CONCURRENCY worker threads.
+- With --bulk-year, certificate months are staged to GCS concurrently
+  (CONCURRENCY workers) and committed by a single load job per kind.
 """
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Set, Tuple
 
 from google.api_core.exceptions import GoogleAPICallError
 
@@ -47,13 +54,18 @@ from . import nondomestic as mod_nondomestic
 from . import bulk_recommendations as mod_recs
 from .io_utils import ensure_dataset
 from .logging_setup import get_logger, setup_logging
-from .settings import Settings, load_settings, settings
-from .state import clear_checkpoint, is_done, mark_done
+from .settings import Settings, _parse_month, load_settings, settings
+from .state import clear_checkpoint, is_done, list_checkpoints, mark_done
 
 Kind = Literal["domestic", "non-domestic"]
 
 STEPS: Tuple[str, str] = ("certs", "recs")
 
+# (kind, 'YYYY-MM', step) tuples known to be checkpointed in this run.
+CheckpointIndex = Set[Tuple[str, str, str]]
+
+_CERT_MODULES = {"domestic": mod_domestic, "non-domestic": mod_nondomestic}
+
 
 @dataclass
 class RunOptions:
@@ -63,23 +75,22 @@ class RunOptions:
     with_recs: bool
     dry_run: bool
     reset_step: Optional[str] = None  # "certs" | "recs"
+    bulk_year: Optional[int] = None
+    skip_loaded_recs: bool = False  # recs: skip LMKs already in the recommendations raw table
 
 
-def _month_range(start: str, end: str) -> List[str]:
-    # Local utility to avoid importing internal helpers
-    ys, ms = map(int, start.split("-"))
-    ye, me = map(int, end.split("-"))
-    months = []
-    y, m = ys, ms
-    while True:
-        months.append(f"{y:04d}-{m:02d}")
-        if y == ye and m == me:
-            break
-        if m == 12:
-            y, m = y + 1, 1
-        else:
-            m += 1
-    return months
+def _month_range(start: str, end: str) -> Iterator[str]:
+    """
+    Iterate 'YYYY-MM' from start to end inclusive (month index arithmetic, no rollover branch).
+
+    Validates eagerly: raises ValueError on a malformed month or end < start
+    before returning, rather than silently yielding nothing.
+    """
+    a, b = _parse_month(start), _parse_month(end)
+    first, last = a.year * 12 + a.month - 1, b.year * 12 + b.month - 1
+    if last < first:
+        raise ValueError(f"end month {end!r} is before start month {start!r}")
+    return (f"{t // 12:04d}-{t % 12 + 1:02d}" for t in range(first, last + 1))
 
 
 def _ensure_env(s: Settings) -> None:
@@ -87,9 +98,43 @@ def _ensure_env(s: Settings) -> None:
     ensure_dataset(s.project_id, s.dataset_raw, s.bq_location)
 
 
-def _process_certs(kind: Kind, month: str, s: Settings, log) -> Dict[str, any]:
+def _load_checkpoint_index(s: Settings, log) -> Optional[CheckpointIndex]:
+    """List all checkpoints once; None if listing fails (steps then probe GCS individually)."""
+    try:
+        return list_checkpoints(s.bucket, project_id=s.project_id)
+    except GoogleAPICallError:
+        log.warning("checkpoint index unavailable; checking each step individually")
+        return None
+
+
+def _step_done(kind: Kind, month: str, step: str, s: Settings, done: Optional[CheckpointIndex]) -> bool:
+    """
+    Checkpoint lookup: trust the run's index when it has the key; probe GCS
+    for that one key otherwise (e.g. written by another runner since the
+    listing, or no index at all).
+    """
+    if done is not None and (kind, month, step) in done:
+        return True
+    if not is_done(s.bucket, kind, month, step, project_id=s.project_id):
+        return False
+    if done is not None:
+        done.add((kind, month, step))
+    return True
+
+
+def _mark_step_done(
+    kind: Kind, month: str, step: str, res: Dict[str, any], s: Settings, done: Optional[CheckpointIndex]
+) -> None:
+    mark_done(s.bucket, kind, month, step, meta=res, project_id=s.project_id)
+    if done is not None:
+        done.add((kind, month, step))
+
+
+def _process_certs(
+    kind: Kind, month: str, s: Settings, log, done: Optional[CheckpointIndex] = None
+) -> Dict[str, any]:
     # Skip if checkpoint exists
-    if is_done(s.bucket, kind, month, "certs", project_id=s.project_id):
+    if _step_done(kind, month, "certs", s, done):
         log.info("skip: certs checkpoint exists", extra={"kind": kind, "month": month, "step": "certs"})
         return {"kind": kind, "month": month, "status": "skipped"}
 
@@ -99,38 +144,126 @@ def _process_certs(kind: Kind, month: str, s: Settings, log) -> Dict[str, any]:
     else:
         res = mod_nondomestic.run_month(month, s)
     # Mark checkpoint even for no-data to avoid re-pulling empty months
-    mark_done(
-        s.bucket,
-        kind,
-        month,
-        "certs",
-        meta=res,
-        project_id=s.project_id,
-    )
+    _mark_step_done(kind, month, "certs", res, s, done)
     log.info("done: certificates", extra={"kind": kind, "month": month, "step": "certs", "rows": res.get("rows", 0)})
     return res
 
 
-def _process_recs(kind: Kind, month: str, s: Settings, log) -> Dict[str, any]:
-    if is_done(s.bucket, kind, month, "recs", project_id=s.project_id):
+def _process_recs(
+    kind: Kind,
+    month: str,
+    s: Settings,
+    log,
+    done: Optional[CheckpointIndex] = None,
+    skip_loaded: bool = False,
+) -> Dict[str, any]:
+    if _step_done(kind, month, "recs", s, done):
         log.info("skip: recs checkpoint exists", extra={"kind": kind, "month": month, "step": "recs"})
         return {"kind": kind, "month": month, "status": "skipped"}
 
     log.info("start: recommendations", extra={"kind": kind, "month": month, "step": "recs"})
-    res = mod_recs.run_month_incremental(kind=kind, month=month, settings=s)
-    mark_done(
-        s.bucket,
-        kind,
-        month,
-        "recs",
-        meta=res,
-        project_id=s.project_id,
-    )
+    res = mod_recs.run_month_incremental(kind=kind, month=month, settings=s, skip_loaded=skip_loaded)
+    _mark_step_done(kind, month, "recs", res, s, done)
     log.info("done: recommendations", extra={"kind": kind, "month": month, "step": "recs", "rows": res.get("rows", 0)})
     return res
 
 
-def _reset_step_if_requested(kind: Kind, month: str, step: str, s: Settings, log) -> None:
+def run_year_bulk(
+    kind: Kind, year: int, s: Settings, log=None, done: Optional[CheckpointIndex] = None
+) -> List[Dict[str, any]]:
+    """
+    Ingest one calendar year of certificates for `kind` with a single BigQuery load job.
+
+    Months without a certs checkpoint are staged to GCS concurrently
+    (`s.concurrency` workers), every staged file is committed by one load job,
+    then each month is checkpointed. A month that fails to stage is reported and
+    left unchecked so the next run retries it; if the load fails, nothing is
+    checkpointed.
+    """
+    log = log or get_logger(__name__, component="orchestrator", project=s.project_id, dataset=s.dataset_raw)
+    mod = _CERT_MODULES[kind]
+
+    results: List[Dict[str, any]] = []
+    pending: List[str] = []
+    for month in (f"{year:04d}-{m:02d}" for m in range(1, 13)):
+        if _step_done(kind, month, "certs", s, done):
+            log.info("skip: certs checkpoint exists", extra={"kind": kind, "month": month, "step": "certs"})
+            results.append({"kind": kind, "month": month, "status": "skipped"})
+        else:
+            pending.append(month)
+    if not pending:
+        return results
+
+    log.info("start: bulk stage", extra={"kind": kind, "year": year, "months": len(pending), "step": "certs"})
+    staged: Dict[str, Dict[str, any]] = {}
+    with ThreadPoolExecutor(max_workers=s.concurrency) as ex:
+        futures = {ex.submit(mod.stage_month, month, s): month for month in pending}
+        for fut in as_completed(futures):
+            month = futures[fut]
+            try:
+                staged[month] = fut.result()
+            except Exception as e:
+                log.exception("certificates stage failed", extra={"kind": kind, "month": month})
+                results.append({"kind": kind, "month": month, "step": "certs", "status": "error", "error": str(e)})
+
+    uris = [r["gcs_uri"] for r in staged.values() if r["status"] == "staged"]
+    table_id = mod.load_staged(uris, s) if uris else None
+    log.info("done: bulk load", extra={"kind": kind, "year": year, "files": len(uris), "step": "certs"})
+
+    for month in sorted(staged):
+        res = staged[month]
+        if res["status"] == "staged":
+            res = {**res, "table": table_id, "status": "loaded"}
+        _mark_step_done(kind, month, "certs", res, s, done)
+        results.append(res)
+    return results
+
+
+def _process_cell(
+    kind: Kind, month: str, opts: RunOptions, s: Settings, log, done: Optional[CheckpointIndex] = None
+) -> List[Dict[str, any]]:
+    """Run the steps for one (kind, month): certs, then recs if enabled and certs succeeded."""
+    results: List[Dict[str, any]] = []
+    log.info("month/kind begin", extra={"kind": kind, "month": month})
+    if opts.reset_step in {"certs", "recs"}:
+        _reset_step_if_requested(kind, month, opts.reset_step, s, log, done)
+
+    if opts.dry_run:
+        log.info(
+            "dry-run: would run steps",
+            extra={"kind": kind, "month": month, "steps": "certs -> recs" if opts.with_recs else "certs"},
+        )
+        results.append({"kind": kind, "month": month, "status": "dry-run"})
+        return results
+
+    # Certificates
+    try:
+        res_c = _process_certs(kind, month, s, log, done)
+        results.append(res_c)
+    except Exception as e:
+        log.exception("certificates step failed", extra={"kind": kind, "month": month})
+        results.append({"kind": kind, "month": month, "step": "certs", "status": "error", "error": str(e)})
+        # Do not attempt recs if certs failed
+        return results
+
+    # Recommendations (optional)
+    if opts.with_recs:
+        try:
+            res_r = _process_recs(kind, month, s, log, done, skip_loaded=opts.skip_loaded_recs)
+            results.append(res_r)
+        except Exception as e:
+            log.exception("recommendations step failed", extra={"kind": kind, "month": month})
+            results.append({"kind": kind, "month": month, "step": "recs", "status": "error", "error": str(e)})
+
+    log.info("month/kind end", extra={"kind": kind, "month": month})
+    return results
+
+
+def _reset_step_if_requested(
+    kind: Kind, month: str, step: str, s: Settings, log, done: Optional[CheckpointIndex] = None
+) -> None:
+    if done is not None:
+        done.discard((kind, month, step))
     try:
         clear_checkpoint(s.bucket, kind, month, step, project_id=s.project_id)
         log.info("checkpoint cleared", extra={"kind": kind, "month": month, "step": step})
@@ -145,7 +278,7 @@ def run(opts: RunOptions, s: Settings) -> List[Dict[str, any]]:
 
     _ensure_env(s)
 
-    months = _month_range(opts.start_month, opts.end_month)
+    months = list(_month_range(opts.start_month, opts.end_month))
     log.info(
         "plan",
         extra={
@@ -160,40 +293,40 @@ def run(opts: RunOptions, s: Settings) -> List[Dict[str, any]]:
 
     results: List[Dict[str, any]] = []
 
-    for month in months:
+    # One listing of state/ replaces a GCS probe per (kind, month, step) for finished cells
+    done = None if opts.dry_run else _load_checkpoint_index(s, log)
+
+    if opts.bulk_year is not None and not opts.dry_run:
         for kind in opts.kinds:
-            log.info("month/kind begin", extra={"kind": kind, "month": month})
             if opts.reset_step in {"certs", "recs"}:
-                _reset_step_if_requested(kind, month, opts.reset_step, s, log)
-
-            if opts.dry_run:
-                log.info(
-                    "dry-run: would run steps",
-                    extra={"kind": kind, "month": month, "steps": "certs -> recs" if opts.with_recs else "certs"},
-                )
-                results.append({"kind": kind, "month": month, "status": "dry-run"})
-                continue
-
-            # Certificates
+                for month in months:
+                    _reset_step_if_requested(kind, month, opts.reset_step, s, log, done)
             try:
-                res_c = _process_certs(kind, month, s, log)
-                results.append(res_c)
+                cert_results = run_year_bulk(kind, opts.bulk_year, s, log, done)
             except Exception as e:
-                log.exception("certificates step failed", extra={"kind": kind, "month": month})
-                results.append({"kind": kind, "month": month, "step": "certs", "status": "error", "error": str(e)})
-                # Continue to next kind/month; do not attempt recs if certs failed
+                log.exception("bulk certificates step failed", extra={"kind": kind, "year": opts.bulk_year})
+                results.append({"kind": kind, "year": opts.bulk_year, "step": "certs", "status": "error", "error": str(e)})
                 continue
-
-            # Recommendations (optional)
+            results.extend(cert_results)
             if opts.with_recs:
-                try:
-                    res_r = _process_recs(kind, month, s, log)
-                    results.append(res_r)
-                except Exception as e:
-                    log.exception("recommendations step failed", extra={"kind": kind, "month": month})
-                    results.append({"kind": kind, "month": month, "step": "recs", "status": "error", "error": str(e)})
-
-            log.info("month/kind end", extra={"kind": kind, "month": month})
+                failed = {r["month"] for r in cert_results if r.get("status") == "error"}
+                for month in months:
+                    if month in failed:
+                        continue
+                    try:
+                        results.append(_process_recs(kind, month, s, log, done, skip_loaded=opts.skip_loaded_recs))
+                    except Exception as e:
+                        log.exception("recommendations step failed", extra={"kind": kind, "month": month})
+                        results.append({"kind": kind, "month": month, "step": "recs", "status": "error", "error": str(e)})
+        print(json.dumps(results, indent=2))
+        return results
+
+    # Cells are independent and I/O-bound, so they run concurrently; within a
+    # cell certs -> recs stay sequential. Results keep the month/kind order.
+    cells = [(kind, month) for month in months for kind in opts.kinds]
+    with ThreadPoolExecutor(max_workers=s.concurrency) as ex:
+        for cell_results in ex.map(lambda c: _process_cell(c[0], c[1], opts, s, log, done), cells):
+            results.extend(cell_results)
 
     # Pretty print a compact summary to stdout (useful in notebooks/pipelines)
     print(json.dumps(results, indent=2))
@@ -215,6 +348,12 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> Tuple[RunOptions, Setti
     g = parser.add_mutually_exclusive_group()
     g.add_argument("--with-recs", action="store_true", help="Also fetch per-LMK recommendations (default off)")
     g.add_argument("--no-recs", action="store_true", help="Skip recommendations even if configured (default)")
+    parser.add_argument(
+        "--skip-loaded-recs",
+        action="store_true",
+        help="With --with-recs, do not re-fetch LMKs that already have rows in the recommendations raw table. "
+        "Faster re-runs, but LMKs left partially loaded by a failed run are not completed.",
+    )
     parser.add_argument(
         "--dry-run", action="store_true", help="Show plan but do not call EPC/GCS/BQ; no checkpoints written."
     )
@@ -224,6 +363,12 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> Tuple[RunOptions, Setti
         choices=("certs", "recs"),
         help="If provided, clears the chosen step checkpoint for the selected months/kinds before running.",
     )
+    parser.add_argument(
+        "--bulk-year",
+        type=int,
+        default=None,
+        help="Ingest a whole year (YYYY): stage months concurrently, then one BigQuery load per kind.",
+    )
 
     args = parser.parse_args(argv)
 
@@ -239,8 +384,11 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> Tuple[RunOptions, Setti
     if not kinds:
         kinds = ["domestic", "non-domestic"]
 
-    start_month = args.start_month or s.start_month
-    end_month = args.end_month or s.end_month
+    if args.bulk_year is not None:
+        start_month, end_month = f"{args.bulk_year:04d}-01", f"{args.bulk_year:04d}-12"
+    else:
+        start_month = args.start_month or s.start_month
+        end_month = args.end_month or s.end_month
 
     with_recs = True if args.with_recs else False
     if args.no_recs:
@@ -253,6 +401,8 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> Tuple[RunOptions, Setti
         with_recs=with_recs,
         dry_run=bool(args.dry_run),
         reset_step=args.reset_step,
+        bulk_year=args.bulk_year,
+        skip_loaded_recs=bool(args.skip_loaded_recs),
     )
     return opts, s
 
@@ -1,21 +1,32 @@
 import datetime as _dt
-import gzip
-import io
+import functools
 import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import requests
-from google.api_core.exceptions import NotFound
-from google.cloud import bigquery, storage
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .io_utils import CountingIterator, load_bq_raw, peek_iter, write_ndjson_gcs
 from .schema import (
     NON_DOMESTIC_CLUSTERING,
+    NON_DOMESTIC_CURATED_FIELDS,
     NON_DOMESTIC_RAW_TABLE,
-    PARTITION_FIELD,
+    curated_values,
     get_raw_schema,
+    parse_iso_date,
 )
 from .settings import Settings, settings as _settings
 
+# Optional: fast JSON decoding of API pages
+try:
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _ORJSON_AVAILABLE = False
+
 KIND = "non-domestic"
 
 
@@ -24,6 +35,7 @@ KIND = "non-domestic"
 # ---------------------------
 
 
+@functools.lru_cache(maxsize=64)
 def _parse_month(month: str) -> Tuple[_dt.date, _dt.date, str]:
     """Return (start_date, end_date, yyyymm) for 'YYYY-MM'."""
     y, m = map(int, month.split("-"))
@@ -32,88 +44,103 @@ def _parse_month(month: str) -> Tuple[_dt.date, _dt.date, str]:
     return start, end, f"{y:04d}{m:02d}"
 
 
-def _normalize(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Normalize raw EPC record to envelope; skip if no LMK."""
-    def g(d: Dict[str, Any], *keys: str) -> Any:
-        for k in keys:
-            if k in d:
-                return d[k]
-        return None
+def _str_or_none(v: Any) -> Optional[str]:
+    """str(v), or None for missing/empty values."""
+    return str(v) if v not in (None, "") else None
+
 
-    lmk = g(rec, "lmk_key", "lmk-key", "LMK_KEY")
+def _normalize(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize raw EPC record to envelope (plus curated columns); skip if no LMK."""
+    lmk = rec.get("lmk_key") or rec.get("lmk-key") or rec.get("LMK_KEY")
     if not lmk:
         return None
-    lmk = str(lmk)
 
-    uprn = g(rec, "uprn", "UPRN")
-    uprn = str(uprn) if uprn not in (None, "") else None
-
-    postcode = g(rec, "postcode", "POSTCODE")
-    postcode = str(postcode) if postcode not in (None, "") else None
-
-    lodg = g(rec, "lodgement_date", "lodgement-date", "LODgement-Date")
-    if isinstance(lodg, str):
-        try:
-            _dt.date.fromisoformat(lodg)
-        except Exception:
-            lodg = None
-    else:
-        lodg = None
+    uprn = rec.get("uprn")
+    if uprn is None:
+        uprn = rec.get("UPRN")
+    postcode = rec.get("postcode")
+    if postcode is None:
+        postcode = rec.get("POSTCODE")
+    lodg = rec.get("lodgement_date") or rec.get("lodgement-date") or rec.get("LODgement-Date")
+    lodg = parse_iso_date(lodg) if isinstance(lodg, str) else None
 
     return {
-        "lmk_key": lmk,
+        "lmk_key": str(lmk),
         "lodgement_date": lodg,
-        "postcode": postcode,
-        "uprn": uprn,
+        "postcode": _str_or_none(postcode),
+        "uprn": _str_or_none(uprn),
         "payload": rec,
+        **curated_values(rec, NON_DOMESTIC_CURATED_FIELDS),
     }
 
 
+def _session(auth: Tuple[str, str], retry_max: int, retry_backoff: float) -> requests.Session:
+    """Session with auth, Accept header and transient-error retries; keeps one connection alive across pages."""
+    s = requests.Session()
+    s.auth = requests.auth.HTTPBasicAuth(*auth)
+    s.headers.update({"Accept": "application/json"})
+    retry = Retry(
+        total=retry_max,
+        backoff_factor=retry_backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    s.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=4))
+    return s
+
+
 def _fetch_certificates(
     month: str,
     page_size: int,
     timeout: int,
     auth: Tuple[str, str],
+    retry_max: int = 5,
+    retry_backoff: float = 0.5,
 ) -> Iterable[Dict[str, Any]]:
     """
     Generator yielding normalized non-domestic certificate rows for the month.
-    Uses EPC /api/v1/non-domestic/search with search-after pagination.
+    Uses EPC /api/v1/non-domestic/search with search-after pagination over one
+    session, prefetching the next page while the current one is consumed.
     """
     start, end, _ = _parse_month(month)
     url = f"https://epc.opendatacommunities.org/api/v1/{KIND}/search"
-    headers = {"Accept": "application/json"}
-    basic = requests.auth.HTTPBasicAuth(*auth)
-
-    search_after: Optional[str] = None
-    while True:
-        params = {
-            "from-year": start.year,
-            "from-month": start.month,
-            "to-year": end.year,
-            "to-month": end.month,
-            "size": page_size,
-        }
-        if search_after:
-            params["search-after"] = search_after
-
-        r = requests.get(url, params=params, headers=headers, auth=basic, timeout=timeout)
+
+    base_params = {
+        "from-year": start.year,
+        "from-month": start.month,
+        "to-year": end.year,
+        "to-month": end.month,
+        "size": page_size,
+    }
+
+    def get_page(session: requests.Session, search_after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        params = {**base_params, "search-after": search_after} if search_after else base_params
+
+        r = session.get(url, params=params, timeout=timeout)
         if r.status_code == 401:
             raise RuntimeError("EPC 401 Unauthorized: check EPC_EMAIL/EPC_API_KEY")
         r.raise_for_status()
 
-        data = r.json()
-        rows = data.get("rows", data if isinstance(data, list) else [])
-        if not rows:
-            break
+        # r.content is already gunzipped once by urllib3 (requests sends Accept-Encoding: gzip)
+        data = orjson.loads(r.content) if _ORJSON_AVAILABLE else r.json()
+        rows = data if isinstance(data, list) else data.get("rows", [])
+        return rows, r.headers.get("X-Next-Search-After")
 
-        for rec in rows:
-            norm = _normalize(rec)
-            if norm:
-                yield norm
+    # Page N+1 is requested as soon as page N's cursor is known, so the round
+    # trip overlaps with normalizing/uploading page N.
+    with _session(auth, retry_max, retry_backoff) as session, ThreadPoolExecutor(max_workers=1) as pool:
+        fut: Optional[Future] = pool.submit(get_page, session, None)
+        while fut is not None:
+            rows, search_after = fut.result()
+            if not rows:
+                break
+            fut = pool.submit(get_page, session, search_after) if search_after else None
 
-        search_after = r.headers.get("X-Next-Search-After")
-        if not search_after:
-            break
+            for rec in rows:
+                norm = _normalize(rec)
+                if norm:
+                    yield norm
 
 
 def _gcs_key(month: str) -> str:
@@ -122,49 +149,25 @@ def _gcs_key(month: str) -> str:
     return f"epc/json/{KIND}/{yyyymm}/certs/part-0001.json.gz"
 
 
-def _write_ndjson_gcs(project: str, bucket: str, key: str, objs: Iterable[Dict[str, Any]]) -> str:
-    """Write gzipped NDJSON to GCS, return gs:// URI."""
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-        for o in objs:
-            gz.write((json.dumps(o, ensure_ascii=False) + "\n").encode("utf-8"))
-    client = storage.Client(project=project)
-    blob = client.bucket(bucket).blob(key)
-    blob.upload_from_string(buf.getvalue(), content_type="application/gzip")
-    return f"gs://{bucket}/{key}"
-
-
 def _load_bq_raw(
     project: str,
     dataset: str,
     table: str,
     region: str,
-    gs_uri: str,
+    gs_uri: Union[str, Sequence[str]],
+    require_partition_filter: bool = False,
 ) -> str:
-    """Load the NDJSON file into the raw table, creating with partitioning/clustering if needed."""
-    bq = bigquery.Client(project=project)
-    table_id = f"{project}.{dataset}.{table}"
-
-    # exists?
-    try:
-        bq.get_table(table_id)
-        exists = True
-    except NotFound:
-        exists = False
-
-    cfg = bigquery.LoadJobConfig(
-        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-        schema=get_raw_schema(),
-        ignore_unknown_values=True,
+    """Load NDJSON file(s) into the raw table with one job (io_utils.load_bq_raw with the non-domestic schema)."""
+    return load_bq_raw(
+        project=project,
+        dataset=dataset,
+        table=table,
+        region=region,
+        gs_uri=gs_uri,
+        clustering=NON_DOMESTIC_CLUSTERING,
+        require_partition_filter=require_partition_filter,
+        schema=get_raw_schema(KIND),
     )
-    if not exists:
-        cfg.time_partitioning = bigquery.TimePartitioning(field=PARTITION_FIELD)
-        cfg.clustering_fields = NON_DOMESTIC_CLUSTERING
-
-    job = bq.load_table_from_uri(gs_uri, table_id, job_config=cfg, location=region)
-    job.result()
-    return table_id
 
 
 # ---------------------------
@@ -172,50 +175,63 @@ def _load_bq_raw(
 # ---------------------------
 
 
-def run_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
+def stage_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
     """
-    Ingest one calendar month of non-domestic EPC certificates.
-
-    Args:
-        month: 'YYYY-MM'
-        settings: loaded Settings (defaults to global settings)
+    Fetch one month of non-domestic certificates and write them to GCS without loading.
 
     Returns:
-        Dict with summary: {kind, month, rows, gcs_uri, table, status}
+        Dict with summary: {kind, month, rows, gcs_uri, status} where status is
+        "staged" or "no-data".
     """
-    # Fetch & normalize
-    rows = list(
+    # Rows stream page by page into the upload; an empty month never opens one.
+    normalized = peek_iter(
         _fetch_certificates(
             month=month,
             page_size=settings.page_size,
             timeout=settings.request_timeout_seconds,
             auth=settings.epc_auth,
+            retry_max=settings.retry_max,
+            retry_backoff=settings.retry_backoff,
         )
     )
-    if not rows:
+    if normalized is None:
         return {"kind": KIND, "month": month, "rows": 0, "status": "no-data"}
+    rows = CountingIterator(normalized)
 
-    # Write to GCS
     key = _gcs_key(month)
-    uri = _write_ndjson_gcs(settings.project_id, settings.bucket, key, rows)
+    uri = write_ndjson_gcs(settings.project_id, settings.bucket, key, rows)
+    return {"kind": KIND, "month": month, "rows": rows.count, "gcs_uri": uri, "status": "staged"}
+
 
-    # Load to BigQuery
-    table_id = _load_bq_raw(
+def load_staged(gs_uris: Union[str, Sequence[str]], settings: Settings = _settings) -> str:
+    """Load one or more staged NDJSON files into the non-domestic raw table with a single job."""
+    return _load_bq_raw(
         project=settings.project_id,
         dataset=settings.dataset_raw,
         table=NON_DOMESTIC_RAW_TABLE,
         region=settings.bq_location,
-        gs_uri=uri,
+        gs_uri=gs_uris,
+        require_partition_filter=settings.require_partition_filter,
     )
 
-    return {
-        "kind": KIND,
-        "month": month,
-        "rows": len(rows),
-        "gcs_uri": uri,
-        "table": table_id,
-        "status": "loaded",
-    }
+
+def run_month(month: str, settings: Settings = _settings) -> Dict[str, Any]:
+    """
+    Ingest one calendar month of non-domestic EPC certificates.
+
+    Args:
+        month: 'YYYY-MM'
+        settings: loaded Settings (defaults to global settings)
+
+    Returns:
+        Dict with summary: {kind, month, rows, gcs_uri, table, status}
+    """
+    res = stage_month(month, settings)
+    if res["status"] != "staged":
+        return res
+
+    table_id = load_staged(res["gcs_uri"], settings)
+    return {**res, "table": table_id, "status": "loaded"}
 
 
 # ---------------------------
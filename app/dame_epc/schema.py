@@ -5,13 +5,20 @@ Centralized schema and view SQL templates for the DAME EPC pipeline.
 
 This module is deliberately IO-free. It only defines:
 - Raw table names and clustering/partitioning conventions
-- A helper to build the raw BigQuery schema
-- Rendering functions that return CREATE OR REPLACE VIEW SQL strings
+- A helper to build the raw BigQuery schema, and the curated columns
+  materialized from `payload` at ingest
+- View SQL as module-level templates ({{PROJECT}}/{{DATASET}} placeholders, as
+  in the sql/views/ files), and rendering functions that return CREATE OR
+  REPLACE VIEW / CREATE MATERIALIZED VIEW IF NOT EXISTS SQL strings
 
 Other modules (e.g., scripts/apply_views.py, io_utils.py) should import from here.
 """
 
-from typing import List
+import datetime as _dt
+import functools
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from google.cloud import bigquery
 
@@ -24,6 +31,17 @@ NON_DOMESTIC_RAW_TABLE = "non_domestic_raw_json"
 DOMESTIC_RECS_RAW_TABLE = "domestic_recommendations_raw_json"
 NON_DOMESTIC_RECS_RAW_TABLE = "non_domestic_recommendations_raw_json"
 
+# Materialized (lodgement month, lmk_key) index over the certificate raw tables
+DOMESTIC_LMKS_BY_MONTH_MV = "domestic_lmks_by_month_mv"
+NON_DOMESTIC_LMKS_BY_MONTH_MV = "non_domestic_lmks_by_month_mv"
+
+# Materialized curated certificates and newest lodgement date per LMK.
+# The recommendations views stay plain views (the full ones return the JSON payload).
+DOMESTIC_CURATED_MV = "enr_domestic_certificates_mv"
+NON_DOMESTIC_CURATED_MV = "enr_non_domestic_certificates_mv"
+DOMESTIC_LMK_MAX_DATE_MV = "enr_domestic_lmk_max_date_mv"
+NON_DOMESTIC_LMK_MAX_DATE_MV = "enr_non_domestic_lmk_max_date_mv"
+
 # ---------------------------
 # Partitioning / clustering
 # ---------------------------
@@ -36,7 +54,41 @@ NON_DOMESTIC_CLUSTERING = ["lmk_key"]  # keep simple; many cols are sparse
 # ---------------------------
 
 
-def get_raw_schema() -> List[bigquery.SchemaField]:
+# Hot payload fields landed as typed columns on the certificate raw tables:
+# (column, payload key, BigQuery type). Loaders fill them at ingest with
+# SAFE_CAST(JSON_VALUE(...)) semantics (see curated_values), so the curated
+# views read narrow columns instead of re-parsing `payload` on every query.
+DOMESTIC_CURATED_FIELDS: List[Tuple[str, str, str]] = [
+    ("current_energy_efficiency", "current-energy-efficiency", "INT64"),
+    ("potential_energy_efficiency", "potential-energy-efficiency", "INT64"),
+    ("address1", "address1", "STRING"),
+    ("address2", "address2", "STRING"),
+    ("property_type", "property-type", "STRING"),
+    ("built_form", "built-form", "STRING"),
+    ("main_heating_controls", "main-heating-controls", "STRING"),
+    ("main_fuel", "main-fuel", "STRING"),
+    ("main_heating_description", "main-heating-description", "STRING"),
+    ("hot_water_description", "hot-water-description", "STRING"),
+    ("co2_emissions_current", "co2-emissions-current", "FLOAT64"),
+]
+
+NON_DOMESTIC_CURATED_FIELDS: List[Tuple[str, str, str]] = [
+    ("building_category", "building-category", "STRING"),
+    ("lodgement_type", "lodgement-type", "STRING"),
+    ("asset_rating", "asset-rating", "FLOAT64"),
+    ("co2_emissions", "co2-emissions", "FLOAT64"),
+]
+
+_CURATED_FIELDS_BY_KIND = {
+    "domestic": DOMESTIC_CURATED_FIELDS,
+    "non-domestic": NON_DOMESTIC_CURATED_FIELDS,
+}
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def get_raw_schema(kind: Optional[str] = None) -> List[bigquery.SchemaField]:
     """
     Minimal, stable landing schema used for all raw JSON tables.
 
@@ -46,176 +98,450 @@ def get_raw_schema() -> List[bigquery.SchemaField]:
     - uprn: STRING (nullable)
     - payload: JSON (entire source record)
 
+    With kind='domestic' or 'non-domestic', the certificate table's curated
+    columns (DOMESTIC_CURATED_FIELDS / NON_DOMESTIC_CURATED_FIELDS) follow as
+    NULLABLE fields. Recommendations tables use the base schema.
+
     Returns a list of google.cloud.bigquery.SchemaField objects.
     """
-    return [
+    fields = [
         bigquery.SchemaField("lmk_key", "STRING", mode="REQUIRED"),
         bigquery.SchemaField("lodgement_date", "DATE", mode="NULLABLE"),
         bigquery.SchemaField("postcode", "STRING", mode="NULLABLE"),
         bigquery.SchemaField("uprn", "STRING", mode="NULLABLE"),
         bigquery.SchemaField("payload", "JSON", mode="NULLABLE"),
     ]
+    if kind is not None:
+        fields += [bigquery.SchemaField(col, typ, mode="NULLABLE") for col, _, typ in curated_fields(kind)]
+    return fields
+
+
+def curated_fields(kind: str) -> List[Tuple[str, str, str]]:
+    """(column, payload key, type) triples materialized on the `kind` certificate table."""
+    try:
+        return _CURATED_FIELDS_BY_KIND[kind]
+    except KeyError:
+        raise ValueError(f"Unknown kind: {kind!r} (expected 'domestic' or 'non-domestic')") from None
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_iso_date(s: str) -> Optional[str]:
+    """Return `s` if it is a valid 'YYYY-MM-DD' date, else None (memoized: dates repeat within a month)."""
+    if not _ISO_DATE_RE.match(s):
+        return None
+    try:
+        _dt.date.fromisoformat(s)
+    except ValueError:
+        return None
+    return s
+
+
+def _safe_cast(v: Any, typ: str) -> Any:
+    """
+    Python mirror of SAFE_CAST(JSON_VALUE(payload, key) AS typ) for one value.
+
+    typ is STRING, INT64, FLOAT64 or DATE (returned as 'YYYY-MM-DD'); anything
+    that would not cast is None.
+    """
+    if v is None or isinstance(v, (dict, list)):
+        return None  # JSON_VALUE is NULL for objects/arrays
+    s = ("true" if v else "false") if isinstance(v, bool) else str(v)
+    if typ == "STRING":
+        return s
+    if typ == "DATE":
+        return parse_iso_date(s)
+    try:
+        if typ == "INT64":
+            n = int(s.strip())
+            return n if _INT64_MIN <= n <= _INT64_MAX else None
+        x = float(s)
+    except ValueError:
+        return None
+    return x if math.isfinite(x) else None
+
+
+def curated_values(rec: Dict[str, Any], fields: Sequence[Tuple[str, str, str]]) -> Dict[str, Any]:
+    """Extract the curated columns for `fields` from a raw EPC record."""
+    return {col: _safe_cast(rec.get(key), typ) for col, key, typ in fields}
+
+
+def _json_extract_sql(key: str, typ: str) -> str:
+    expr = f"JSON_VALUE(payload, '$.\"{key}\"')"
+    return expr if typ == "STRING" else f"SAFE_CAST({expr} AS {typ})"
+
+
+def backfill_curated_columns_sql(project: str, dataset: str, kind: str) -> str:
+    """
+    Script that adds the curated columns to a `kind` certificate table (if
+    missing) and fills them for rows loaded before they existed.
+
+    scripts/apply_views runs it before creating the views, once per distinct
+    script (tracked with a label on the table). The UPDATE carries an
+    always-true lodgement_date predicate so it is accepted on tables created
+    with require_partition_filter.
+    """
+    fields = curated_fields(kind)
+    table = f"`{project}.{dataset}.{DOMESTIC_RAW_TABLE if kind == 'domestic' else NON_DOMESTIC_RAW_TABLE}`"
+    adds = ",\n  ".join(f"ADD COLUMN IF NOT EXISTS {col} {typ}" for col, _, typ in fields)
+    sets = ",\n  ".join(f"{col} = {_json_extract_sql(key, typ)}" for col, key, typ in fields)
+    unset = "\n    OR ".join(f"{col} IS NULL" for col, _, _ in fields)
+    return f"""
+ALTER TABLE {table}
+  {adds};
+
+UPDATE {table}
+SET
+  {sets}
+WHERE ({PARTITION_FIELD} IS NOT NULL OR {PARTITION_FIELD} IS NULL)
+  AND payload IS NOT NULL
+  AND ({unset});
+""".strip()
 
 
 # ---------------------------
 # View SQL templates
 # ---------------------------
+#
+# Each view's SQL is a module-level template using the same {{PROJECT}} /
+# {{DATASET}} placeholders as the .sql files under sql/views/ (see
+# scripts/apply_views.py); the *_sql(project, dataset) functions only
+# substitute them.
+
+# Curated column lists, shared by the plain and materialized views.
+_DOMESTIC_CURATED_COLUMNS = ",\n".join(f"  {col}" for col, _, _ in DOMESTIC_CURATED_FIELDS)
+_NON_DOMESTIC_CURATED_COLUMNS = ",\n".join(f"  {col}" for col, _, _ in NON_DOMESTIC_CURATED_FIELDS)
+
+# Kept inside the curated view bodies so it shows up in the view definition.
+_PRUNING_NOTE = """
+-- Partitioned on lodgement_date: filter it with a literal/constant predicate
+-- (not a subquery result) so BigQuery prunes partitions.
+""".strip()
 
-def domestic_curated_view_sql(project: str, dataset: str) -> str:
-    """
-    Curated domestic certificates view over the raw JSON table.
+# Incremental refresh; queries may be served up to an hour stale without
+# touching the base table.
+_MV_OPTIONS = 'enable_refresh = true, refresh_interval_minutes = 60, max_staleness = INTERVAL "1:0:0" HOUR TO SECOND'
 
-    Selects common fields and uses SAFE_CAST where appropriate.
-    """
-    fq_source = f"`{project}.{dataset}.{DOMESTIC_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_domestic_certificates_v`"
+
+def _fq(name: str) -> str:
+    """Backticked `{{PROJECT}}.{{DATASET}}.name` reference."""
+    return f"`{{{{PROJECT}}}}.{{{{DATASET}}}}.{name}`"
+
+
+# Shared by every *_sql() function below: one cache entry per (template, project,
+# dataset), so repeat calls skip the placeholder substitution. Strings are immutable.
+@functools.lru_cache(maxsize=64)
+def _render(template: str, project: str, dataset: str) -> str:
+    return template.replace("{{PROJECT}}", project).replace("{{DATASET}}", dataset)
+
+
+def _curated_view_template(source_table: str, view: str, columns: str) -> str:
     return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
+CREATE OR REPLACE VIEW {_fq(view)} AS
+{_PRUNING_NOTE}
 SELECT
   lmk_key,
   lodgement_date,
   postcode,
   uprn,
-  SAFE_CAST(JSON_VALUE(payload, '$."current-energy-efficiency"') AS INT64)    AS current_energy_efficiency,
-  SAFE_CAST(JSON_VALUE(payload, '$."potential-energy-efficiency"') AS INT64)  AS potential_energy_efficiency,
-  JSON_VALUE(payload, '$.address1')                                           AS address1,
-  JSON_VALUE(payload, '$.address2')                                           AS address2,
-  JSON_VALUE(payload, '$."property-type"')                                    AS property_type,
-  JSON_VALUE(payload, '$."built-form"')                                       AS built_form,
-  JSON_VALUE(payload, '$."main-heating-controls"')                            AS main_heating_controls,
-  JSON_VALUE(payload, '$."main-fuel"')                                        AS main_fuel,
-  JSON_VALUE(payload, '$."main-heating-description"')                         AS main_heating_description,
-  JSON_VALUE(payload, '$."hot-water-description"')                            AS hot_water_description,
-  SAFE_CAST(JSON_VALUE(payload, '$."co2-emissions-current"') AS FLOAT64)      AS co2_emissions_current
-FROM {fq_source};
+{columns}
+FROM {_fq(source_table)};
 """.strip()
 
 
-def non_domestic_curated_view_sql(project: str, dataset: str) -> str:
-    """
-    Curated non-domestic certificates view over the raw JSON table.
-    """
-    fq_source = f"`{project}.{dataset}.{NON_DOMESTIC_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_non_domestic_certificates_v`"
+def _latest_by_lmk_template(source_view: str, view: str) -> str:
     return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
+CREATE OR REPLACE VIEW {_fq(view)} AS
+SELECT *
+FROM {_fq(source_view)}
+QUALIFY ROW_NUMBER() OVER (
+  PARTITION BY lmk_key
+  -- Newest first; undated rows only win when an LMK has no dated row
+  ORDER BY lodgement_date DESC NULLS LAST
+) = 1;
+""".strip()
+
+
+def _recommendations_view_template(source_table: str, view: str, with_payload: bool) -> str:
+    # The narrow variant leaves `payload` out so readers of the helper columns
+    # don't pull the whole JSON blob per row.
+    payload = ",\n  payload" if with_payload else ""
+    return f"""
+CREATE OR REPLACE VIEW {_fq(view)} AS
+SELECT
+  lmk_key,
+  lodgement_date,
+  JSON_VALUE(payload, '$."improvement-description"') AS improvement_description,
+  JSON_VALUE(payload, '$."indicative-cost"')         AS indicative_cost,
+  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving{payload}
+FROM {_fq(source_table)};
+""".strip()
+
+
+def _cert_with_recs_template(cert_view: str, recs_table: str, view: str) -> str:
+    # No recs for an LMK -> no group -> NULL after the LEFT JOIN (as the old
+    # correlated ARRAY_AGG returned).
+    return f"""
+CREATE OR REPLACE VIEW {_fq(view)} AS
+WITH recs_by_lmk AS (
+  SELECT lmk_key, ARRAY_AGG(payload) AS recommendations
+  FROM {_fq(recs_table)}
+  GROUP BY lmk_key
+)
+SELECT
+  c.*,
+  r.recommendations
+FROM {_fq(cert_view)} AS c
+LEFT JOIN recs_by_lmk AS r
+  ON r.lmk_key = c.lmk_key;
+""".strip()
+
+
+def _curated_mv_template(source_table: str, mv_name: str, clustering: str, columns: str) -> str:
+    return f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {_fq(mv_name)}
+PARTITION BY lodgement_date
+CLUSTER BY {clustering}
+OPTIONS ({_MV_OPTIONS})
+AS
 SELECT
   lmk_key,
   lodgement_date,
   postcode,
   uprn,
-  JSON_VALUE(payload, '$."building-category"')                                 AS building_category,
-  JSON_VALUE(payload, '$."lodgement-type"')                                    AS lodgement_type,
-  SAFE_CAST(JSON_VALUE(payload, '$."asset-rating"') AS FLOAT64)                AS asset_rating,
-  SAFE_CAST(JSON_VALUE(payload, '$."co2-emissions"') AS FLOAT64)               AS co2_emissions
-FROM {fq_source};
+{columns}
+FROM {_fq(source_table)};
+""".strip()
+
+
+def _lmk_max_date_mv_template(source_table: str, mv_name: str) -> str:
+    return f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {_fq(mv_name)}
+CLUSTER BY lmk_key
+OPTIONS ({_MV_OPTIONS})
+AS
+SELECT
+  lmk_key,
+  MAX(lodgement_date) AS max_lodgement_date
+FROM {_fq(source_table)}
+GROUP BY lmk_key;
 """.strip()
 
 
+def _mv_latest_by_lmk_template(curated_mv: str, max_date_mv: str, view: str) -> str:
+    return f"""
+CREATE OR REPLACE VIEW {_fq(view)} AS
+SELECT
+  c.*
+FROM {_fq(curated_mv)} AS c
+JOIN {_fq(max_date_mv)} AS m
+  ON c.lmk_key = m.lmk_key
+ AND c.lodgement_date IS NOT DISTINCT FROM m.max_lodgement_date
+-- Re-loaded months can leave identical rows; keep one per LMK
+QUALIFY ROW_NUMBER() OVER (PARTITION BY c.lmk_key) = 1;
+""".strip()
+
+
+def _lmks_by_month_mv_template(source_table: str, mv_name: str) -> str:
+    return f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {_fq(mv_name)}
+PARTITION BY lodgement_month
+CLUSTER BY lmk_key
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 60)
+AS
+SELECT
+  DATE_TRUNC(lodgement_date, MONTH) AS lodgement_month,
+  lmk_key,
+  COUNT(*) AS certificates
+FROM {_fq(source_table)}
+GROUP BY lodgement_month, lmk_key;
+""".strip()
+
+
+_DOMESTIC_CURATED_TEMPLATE = _curated_view_template(
+    DOMESTIC_RAW_TABLE, "enr_domestic_certificates_v", _DOMESTIC_CURATED_COLUMNS
+)
+_NON_DOMESTIC_CURATED_TEMPLATE = _curated_view_template(
+    NON_DOMESTIC_RAW_TABLE, "enr_non_domestic_certificates_v", _NON_DOMESTIC_CURATED_COLUMNS
+)
+_DOMESTIC_LATEST_TEMPLATE = _latest_by_lmk_template("enr_domestic_certificates_v", "enr_domestic_latest_by_lmk")
+_NON_DOMESTIC_LATEST_TEMPLATE = _latest_by_lmk_template(
+    "enr_non_domestic_certificates_v", "enr_non_domestic_latest_by_lmk"
+)
+_DOMESTIC_RECS_TEMPLATE = _recommendations_view_template(
+    DOMESTIC_RECS_RAW_TABLE, "enr_domestic_recommendations_v", with_payload=False
+)
+_NON_DOMESTIC_RECS_TEMPLATE = _recommendations_view_template(
+    NON_DOMESTIC_RECS_RAW_TABLE, "enr_non_domestic_recommendations_v", with_payload=False
+)
+_DOMESTIC_RECS_FULL_TEMPLATE = _recommendations_view_template(
+    DOMESTIC_RECS_RAW_TABLE, "enr_domestic_recommendations_full_v", with_payload=True
+)
+_NON_DOMESTIC_RECS_FULL_TEMPLATE = _recommendations_view_template(
+    NON_DOMESTIC_RECS_RAW_TABLE, "enr_non_domestic_recommendations_full_v", with_payload=True
+)
+_DOMESTIC_CERT_WITH_RECS_TEMPLATE = _cert_with_recs_template(
+    "enr_domestic_certificates_v", DOMESTIC_RECS_RAW_TABLE, "enr_domestic_cert_with_recs_v"
+)
+_NON_DOMESTIC_CERT_WITH_RECS_TEMPLATE = _cert_with_recs_template(
+    "enr_non_domestic_certificates_v", NON_DOMESTIC_RECS_RAW_TABLE, "enr_non_domestic_cert_with_recs_v"
+)
+_DOMESTIC_CURATED_MV_TEMPLATE = _curated_mv_template(
+    DOMESTIC_RAW_TABLE, DOMESTIC_CURATED_MV, "lmk_key, postcode", _DOMESTIC_CURATED_COLUMNS
+)
+_NON_DOMESTIC_CURATED_MV_TEMPLATE = _curated_mv_template(
+    NON_DOMESTIC_RAW_TABLE, NON_DOMESTIC_CURATED_MV, "lmk_key", _NON_DOMESTIC_CURATED_COLUMNS
+)
+_DOMESTIC_LMK_MAX_DATE_MV_TEMPLATE = _lmk_max_date_mv_template(DOMESTIC_RAW_TABLE, DOMESTIC_LMK_MAX_DATE_MV)
+_NON_DOMESTIC_LMK_MAX_DATE_MV_TEMPLATE = _lmk_max_date_mv_template(NON_DOMESTIC_RAW_TABLE, NON_DOMESTIC_LMK_MAX_DATE_MV)
+_DOMESTIC_MV_LATEST_TEMPLATE = _mv_latest_by_lmk_template(
+    DOMESTIC_CURATED_MV, DOMESTIC_LMK_MAX_DATE_MV, "enr_domestic_mv_latest_by_lmk_v"
+)
+_NON_DOMESTIC_MV_LATEST_TEMPLATE = _mv_latest_by_lmk_template(
+    NON_DOMESTIC_CURATED_MV, NON_DOMESTIC_LMK_MAX_DATE_MV, "enr_non_domestic_mv_latest_by_lmk_v"
+)
+_DOMESTIC_LMKS_BY_MONTH_MV_TEMPLATE = _lmks_by_month_mv_template(DOMESTIC_RAW_TABLE, DOMESTIC_LMKS_BY_MONTH_MV)
+_NON_DOMESTIC_LMKS_BY_MONTH_MV_TEMPLATE = _lmks_by_month_mv_template(
+    NON_DOMESTIC_RAW_TABLE, NON_DOMESTIC_LMKS_BY_MONTH_MV
+)
+
+
+def domestic_curated_view_sql(project: str, dataset: str) -> str:
+    """
+    Curated domestic certificates view over the raw JSON table.
+
+    Selects the typed columns materialized at ingest; `payload` is not read.
+    """
+    return _render(_DOMESTIC_CURATED_TEMPLATE, project, dataset)
+
+
+def non_domestic_curated_view_sql(project: str, dataset: str) -> str:
+    """
+    Curated non-domestic certificates view over the raw JSON table.
+    """
+    return _render(_NON_DOMESTIC_CURATED_TEMPLATE, project, dataset)
+
+
 def domestic_latest_by_lmk_view_sql(project: str, dataset: str) -> str:
     """
     Latest domestic certificate per LMK key.
     """
-    fq_source = f"`{project}.{dataset}.enr_domestic_certificates_v`"
-    fq_view = f"`{project}.{dataset}.enr_domestic_latest_by_lmk`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT *
-FROM {fq_source}
-QUALIFY ROW_NUMBER() OVER (
-  PARTITION BY lmk_key
-  ORDER BY lodgement_date DESC
-) = 1;
-""".strip()
+    return _render(_DOMESTIC_LATEST_TEMPLATE, project, dataset)
 
 
 def non_domestic_latest_by_lmk_view_sql(project: str, dataset: str) -> str:
     """
     Latest non-domestic certificate per LMK key.
     """
-    fq_source = f"`{project}.{dataset}.enr_non_domestic_certificates_v`"
-    fq_view = f"`{project}.{dataset}.enr_non_domestic_latest_by_lmk`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT *
-FROM {fq_source}
-QUALIFY ROW_NUMBER() OVER (
-  PARTITION BY lmk_key
-  ORDER BY lodgement_date DESC
-) = 1;
-""".strip()
+    return _render(_NON_DOMESTIC_LATEST_TEMPLATE, project, dataset)
 
 
 def domestic_recommendations_view_sql(project: str, dataset: str) -> str:
     """
-    Lightweight recommendations view (domestic).
-    Keeps the full JSON recommendation and exposes a few helper columns as STRING.
+    Narrow recommendations view (domestic).
+    Exposes a few helper columns as STRING, without the JSON payload.
     """
-    fq_source = f"`{project}.{dataset}.{DOMESTIC_RECS_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_domestic_recommendations_v`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT
-  lmk_key,
-  lodgement_date,
-  JSON_VALUE(payload, '$."improvement-description"') AS improvement_description,
-  JSON_VALUE(payload, '$."indicative-cost"')         AS indicative_cost,
-  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving,
-  payload
-FROM {fq_source};
-""".strip()
+    return _render(_DOMESTIC_RECS_TEMPLATE, project, dataset)
 
 
 def non_domestic_recommendations_view_sql(project: str, dataset: str) -> str:
     """
-    Lightweight recommendations view (non-domestic).
+    Narrow recommendations view (non-domestic).
     """
-    fq_source = f"`{project}.{dataset}.{NON_DOMESTIC_RECS_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_non_domestic_recommendations_v`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT
-  lmk_key,
-  lodgement_date,
-  JSON_VALUE(payload, '$."improvement-description"') AS improvement_description,
-  JSON_VALUE(payload, '$."indicative-cost"')         AS indicative_cost,
-  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving,
-  payload
-FROM {fq_source};
-""".strip()
+    return _render(_NON_DOMESTIC_RECS_TEMPLATE, project, dataset)
+
+
+def domestic_recommendations_full_view_sql(project: str, dataset: str) -> str:
+    """
+    Full recommendations view (domestic): the helper columns plus the JSON payload.
+    """
+    return _render(_DOMESTIC_RECS_FULL_TEMPLATE, project, dataset)
+
+
+def non_domestic_recommendations_full_view_sql(project: str, dataset: str) -> str:
+    """
+    Full recommendations view (non-domestic): the helper columns plus the JSON payload.
+    """
+    return _render(_NON_DOMESTIC_RECS_FULL_TEMPLATE, project, dataset)
 
 
 def domestic_cert_with_recs_view_sql(project: str, dataset: str) -> str:
     """
     Denormalized domestic view: each certificate with an ARRAY of recommendation payloads.
-    Uses a correlated subquery to avoid GROUP BY on all columns.
+    Recommendations are aggregated per LMK once and LEFT JOINed, not re-queried per row.
     """
-    fq_cert = f"`{project}.{dataset}.enr_domestic_certificates_v`"
-    fq_recs = f"`{project}.{dataset}.{DOMESTIC_RECS_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_domestic_cert_with_recs_v`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT
-  c.*,
-  (SELECT ARRAY_AGG(r.payload) FROM {fq_recs} AS r WHERE r.lmk_key = c.lmk_key) AS recommendations
-FROM {fq_cert} AS c;
-""".strip()
+    return _render(_DOMESTIC_CERT_WITH_RECS_TEMPLATE, project, dataset)
 
 
 def non_domestic_cert_with_recs_view_sql(project: str, dataset: str) -> str:
     """
     Denormalized non-domestic view: each certificate with an ARRAY of recommendation payloads.
     """
-    fq_cert = f"`{project}.{dataset}.enr_non_domestic_certificates_v`"
-    fq_recs = f"`{project}.{dataset}.{NON_DOMESTIC_RECS_RAW_TABLE}`"
-    fq_view = f"`{project}.{dataset}.enr_non_domestic_cert_with_recs_v`"
-    return f"""
-CREATE OR REPLACE VIEW {fq_view} AS
-SELECT
-  c.*,
-  (SELECT ARRAY_AGG(r.payload) FROM {fq_recs} AS r WHERE r.lmk_key = c.lmk_key) AS recommendations
-FROM {fq_cert} AS c;
-""".strip()
+    return _render(_NON_DOMESTIC_CERT_WITH_RECS_TEMPLATE, project, dataset)
+
+
+def domestic_curated_mv_sql(project: str, dataset: str) -> str:
+    """
+    Materialized twin of enr_domestic_certificates_v.
+
+    Same projection, re-partitioned and clustered for point lookups. SPJ shape,
+    so BigQuery refreshes it incrementally.
+    """
+    return _render(_DOMESTIC_CURATED_MV_TEMPLATE, project, dataset)
+
+
+def non_domestic_curated_mv_sql(project: str, dataset: str) -> str:
+    """
+    Materialized twin of enr_non_domestic_certificates_v.
+    """
+    return _render(_NON_DOMESTIC_CURATED_MV_TEMPLATE, project, dataset)
+
+
+def domestic_lmk_max_date_mv_sql(project: str, dataset: str) -> str:
+    """
+    Aggregate MV: newest lodgement_date per domestic LMK.
+
+    Materialized views cannot use QUALIFY/ROW_NUMBER, so "latest by LMK" is
+    split into this incrementally maintained aggregate plus a thin join view
+    (domestic_mv_latest_by_lmk_view_sql).
+    """
+    return _render(_DOMESTIC_LMK_MAX_DATE_MV_TEMPLATE, project, dataset)
+
+
+def non_domestic_lmk_max_date_mv_sql(project: str, dataset: str) -> str:
+    """
+    Aggregate MV: newest lodgement_date per non-domestic LMK.
+    """
+    return _render(_NON_DOMESTIC_LMK_MAX_DATE_MV_TEMPLATE, project, dataset)
+
+
+def domestic_mv_latest_by_lmk_view_sql(project: str, dataset: str) -> str:
+    """
+    Latest domestic certificate per LMK, served from the materialized views.
+    """
+    return _render(_DOMESTIC_MV_LATEST_TEMPLATE, project, dataset)
+
+
+def non_domestic_mv_latest_by_lmk_view_sql(project: str, dataset: str) -> str:
+    """
+    Latest non-domestic certificate per LMK, served from the materialized views.
+    """
+    return _render(_NON_DOMESTIC_MV_LATEST_TEMPLATE, project, dataset)
+
+
+def domestic_lmks_by_month_mv_sql(project: str, dataset: str) -> str:
+    """
+    Materialized (lodgement_month, lmk_key) index for domestic certificates.
+    Lets the recommendations step list a month's LMKs from one small partition
+    instead of a DISTINCT over the raw JSON table.
+    """
+    return _render(_DOMESTIC_LMKS_BY_MONTH_MV_TEMPLATE, project, dataset)
+
+
+def non_domestic_lmks_by_month_mv_sql(project: str, dataset: str) -> str:
+    """
+    Materialized (lodgement_month, lmk_key) index for non-domestic certificates.
+    """
+    return _render(_NON_DOMESTIC_LMKS_BY_MONTH_MV_TEMPLATE, project, dataset)
 
 
 __all__ = [
@@ -224,10 +550,22 @@ __all__ = [
     "NON_DOMESTIC_RAW_TABLE",
     "DOMESTIC_RECS_RAW_TABLE",
     "NON_DOMESTIC_RECS_RAW_TABLE",
+    "DOMESTIC_LMKS_BY_MONTH_MV",
+    "NON_DOMESTIC_LMKS_BY_MONTH_MV",
+    "DOMESTIC_CURATED_MV",
+    "NON_DOMESTIC_CURATED_MV",
+    "DOMESTIC_LMK_MAX_DATE_MV",
+    "NON_DOMESTIC_LMK_MAX_DATE_MV",
     "PARTITION_FIELD",
     "DOMESTIC_CLUSTERING",
     "NON_DOMESTIC_CLUSTERING",
+    "DOMESTIC_CURATED_FIELDS",
+    "NON_DOMESTIC_CURATED_FIELDS",
     "get_raw_schema",
+    "curated_fields",
+    "curated_values",
+    "parse_iso_date",
+    "backfill_curated_columns_sql",
     # views
     "domestic_curated_view_sql",
     "non_domestic_curated_view_sql",
@@ -235,6 +573,17 @@ __all__ = [
     "non_domestic_latest_by_lmk_view_sql",
     "domestic_recommendations_view_sql",
     "non_domestic_recommendations_view_sql",
+    "domestic_recommendations_full_view_sql",
+    "non_domestic_recommendations_full_view_sql",
     "domestic_cert_with_recs_view_sql",
     "non_domestic_cert_with_recs_view_sql",
+    "domestic_lmks_by_month_mv_sql",
+    "non_domestic_lmks_by_month_mv_sql",
+    # materialized views
+    "domestic_curated_mv_sql",
+    "non_domestic_curated_mv_sql",
+    "domestic_lmk_max_date_mv_sql",
+    "non_domestic_lmk_max_date_mv_sql",
+    "domestic_mv_latest_by_lmk_view_sql",
+    "non_domestic_mv_latest_by_lmk_view_sql",
 ]
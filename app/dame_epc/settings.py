@@ -4,11 +4,14 @@ from __future__ import annotations
 
 """
 Typed settings loaded from a single `.env` file (developer-friendly) with safe
-overrides from real environment variables (for CI/Cloud). Uses pydantic-settings.
+overrides from real environment variables (for CI/Cloud). A plain frozen
+dataclass: no pydantic import or model build at startup.
 
 Precedence (left < right):
   defaults  <  .env (if present)  <  real environment variables  <  runtime kwargs
 
+Settings are frozen; derive overrides with `dataclasses.replace(settings, ...)`.
+
 Usage:
     from dame_epc.settings import settings
     print(settings.project_id)
@@ -20,105 +23,143 @@ Environment:
 - Required: PROJECT_ID, BUCKET, EPC_EMAIL, EPC_API_KEY, START_MONTH, END_MONTH
 """
 
+import dataclasses
+import functools
 import os
 import re
 import datetime as _dt
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Optional: python-dotenv for full .env syntax; a minimal KEY=VALUE reader otherwise
+try:
+    from dotenv import dotenv_values  # type: ignore
 
-from pydantic import Field, PositiveInt, ValidationError
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic.functional_validators import field_validator, model_validator
+    _DOTENV_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _DOTENV_AVAILABLE = False
 
 
 _MONTH_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_month(s: str) -> _dt.date:
-    """Parse 'YYYY-MM' to first-of-month date."""
+    """Parse 'YYYY-MM' to first-of-month date (memoized; raises on bad input, which is not cached)."""
     if not _MONTH_RE.match(s or ""):
         raise ValueError(f"Month must be 'YYYY-MM' with 01-12: got {s!r}")
     y, m = map(int, s.split("-"))
     return _dt.date(y, m, 1)
 
 
+def _months_between_dates(a: _dt.date, b: _dt.date) -> List[str]:
+    """Inclusive list of YYYY-MM from month `a` to month `b` (days are ignored)."""
+    first = a.year * 12 + a.month - 1
+    total = (b.year * 12 + b.month - 1) - first + 1
+    if total <= 0:
+        raise ValueError(f"END_MONTH {b:%Y-%m} is before START_MONTH {a:%Y-%m}")
+    return [f"{(first + i) // 12:04d}-{(first + i) % 12 + 1:02d}" for i in range(total)]
+
+
 def _months_between(start: str, end: str) -> List[str]:
     """Inclusive list of YYYY-MM from start to end (validated)."""
     a = _parse_month(start)
     b = _parse_month(end)
-    if (b.year, b.month) < (a.year, a.month):
+    if b < a:
         raise ValueError(f"END_MONTH {end!r} is before START_MONTH {start!r}")
-    out: List[str] = []
-    d = a
-    while True:
-        out.append(f"{d.year:04d}-{d.month:02d}")
-        if d.year == b.year and d.month == b.month:
-            break
-        # advance one month
-        if d.month == 12:
-            d = _dt.date(d.year + 1, 1, 1)
-        else:
-            d = _dt.date(d.year, d.month + 1, 1)
+    return _months_between_dates(a, b)
+
+
+# --- Env value parsing ---
+
+_TRUE = {"1", "true", "t", "yes", "y", "on"}
+_FALSE = {"0", "false", "f", "no", "n", "off"}
+
+
+def _parse_bool(v: str) -> bool:
+    s = v.strip().lower()
+    if s in _TRUE:
+        return True
+    if s in _FALSE:
+        return False
+    raise ValueError(f"expected a boolean, got {v!r}")
+
+
+def _parse_positive_int(v: str) -> int:
+    n = int(v.strip())
+    if n <= 0:
+        raise ValueError(f"expected a positive integer, got {v!r}")
+    return n
+
+
+def _env(name: str, default: Any = dataclasses.MISSING, parse: Callable[[str], Any] = str) -> Any:
+    """Dataclass field bound to environment variable `name`, converted with `parse`."""
+    return dataclasses.field(default=default, metadata={"env": name, "parse": parse})
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
+    """KEY=VALUE pairs from a .env file (python-dotenv if installed, else a minimal reader)."""
+    if _DOTENV_AVAILABLE:
+        return {k: v for k, v in dotenv_values(path).items() if v is not None}
+    out: Dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        out[key] = value
     return out
 
 
-class Settings(BaseSettings):
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class Settings:
     # GCP / BigQuery / GCS
-    project_id: str = Field(..., alias="PROJECT_ID")
-    region: str = Field("europe-west2", alias="REGION")
-    bucket: str = Field(..., alias="BUCKET")
-    dataset_raw: str = Field("dame_epc", alias="DATASET_RAW")
-    dataset_enr: str = Field("dame_epc", alias="DATASET_ENR")
+    project_id: str = _env("PROJECT_ID")
+    region: str = _env("REGION", "europe-west2")
+    bucket: str = _env("BUCKET")
+    dataset_raw: str = _env("DATASET_RAW", "dame_epc")
+    dataset_enr: str = _env("DATASET_ENR", "dame_epc")
+    # Create certificate raw tables with require_partition_filter (first create only)
+    require_partition_filter: bool = _env("REQUIRE_PARTITION_FILTER", False, _parse_bool)
 
     # EPC API
-    epc_email: str = Field(..., alias="EPC_EMAIL")
-    epc_api_key: str = Field(..., alias="EPC_API_KEY")
+    epc_email: str = _env("EPC_EMAIL")
+    epc_api_key: str = _env("EPC_API_KEY")
 
-    # Ingestion window
-    start_month: str = Field(..., alias="START_MONTH", description="YYYY-MM")
-    end_month: str = Field(..., alias="END_MONTH", description="YYYY-MM")
+    # Ingestion window (YYYY-MM)
+    start_month: str = _env("START_MONTH")
+    end_month: str = _env("END_MONTH")
 
     # Network / pagination
-    page_size: PositiveInt = Field(5000, alias="PAGE_SIZE")
-    concurrency: PositiveInt = Field(2, alias="CONCURRENCY")
-    request_timeout_seconds: PositiveInt = Field(60, alias="REQUEST_TIMEOUT_SECONDS")
-    retry_max: PositiveInt = Field(5, alias="RETRY_MAX")
-    retry_backoff: float = Field(2.0, alias="RETRY_BACKOFF")
+    page_size: int = _env("PAGE_SIZE", 5000, _parse_positive_int)
+    concurrency: int = _env("CONCURRENCY", 2, _parse_positive_int)
+    request_timeout_seconds: int = _env("REQUEST_TIMEOUT_SECONDS", 60, _parse_positive_int)
+    retry_max: int = _env("RETRY_MAX", 5, _parse_positive_int)
+    retry_backoff: float = _env("RETRY_BACKOFF", 2.0, float)
+    rec_concurrency: int = _env("REC_CONCURRENCY", 8, _parse_positive_int)
 
     # Optional: explicit Google ADC path (for local dev)
-    google_application_credentials: str | None = Field(
-        default=None, alias="GOOGLE_APPLICATION_CREDENTIALS"
-    )
-
-    # Config: do not hard-bind env_file here; we pass it at construction time.
-    model_config = SettingsConfigDict(
-        extra="ignore",
-        case_sensitive=False,
-        env_prefix="",
-        # env_file=None is intentional; see load_settings() below
-    )
-
-    # --- Validators ---
-
-    @field_validator("start_month", "end_month")
-    @classmethod
-    def _validate_month(cls, v: str) -> str:
-        _parse_month(v)  # will raise with a helpful message
-        return v
-
-    @field_validator("region")
-    @classmethod
-    def _validate_region(cls, v: str) -> str:
-        # Keep permissive; restrict only if you need to.
-        if not v:
-            raise ValueError("region must be set")
-        return v
+    google_application_credentials: Optional[str] = _env("GOOGLE_APPLICATION_CREDENTIALS", None)
 
-    @model_validator(mode="after")
-    def _check_window(self) -> "Settings":
-        # Ensures end >= start
-        _months_between(self.start_month, self.end_month)
-        return self
+    # Month window, computed once in __post_init__ (also on dataclasses.replace)
+    _months_cache: Tuple[str, ...] = dataclasses.field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.region:
+            raise ValueError("region must be set")
+        for name in ("page_size", "concurrency", "request_timeout_seconds", "retry_max", "rec_concurrency"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be a positive integer")
+        # Validates both months and end >= start
+        object.__setattr__(self, "_months_cache", tuple(_months_between(self.start_month, self.end_month)))
 
     # --- Convenience ---
 
@@ -129,12 +170,11 @@ class Settings(BaseSettings):
 
     def month_range(self) -> List[str]:
         """Inclusive YYYY-MM list between START_MONTH and END_MONTH."""
-        return _months_between(self.start_month, self.end_month)
+        return list(self._months_cache)
 
     def iter_months(self) -> Iterable[str]:
-        """Generator over the month range (inclusive)."""
-        for m in self.month_range():
-            yield m
+        """Iterator over the month range (inclusive)."""
+        return iter(self._months_cache)
 
     @property
     def bq_location(self) -> str:
@@ -142,31 +182,49 @@ class Settings(BaseSettings):
         return self.region
 
 
-def load_settings() -> Settings:
+def load_settings(**overrides: Any) -> Settings:
     """
     Create a Settings instance, honoring ENV_FILE if set.
 
     ENV_FILE allows swapping the .env path without code changes:
       ENV_FILE=.env.test python -m dame_epc.main ...
+
+    Variable names are matched case-insensitively; keyword `overrides` win over both sources.
     """
     env_file = os.environ.get("ENV_FILE", ".env")
     env_path = Path(env_file)
-    try:
-        s = Settings(_env_file=env_path if env_path.exists() else None)
-    except ValidationError as e:
-        missing = []
-        # Extract a friendlier message for missing required fields
-        for err in e.errors():
-            if err.get("type") == "missing":
-                loc = err.get("loc", ["?"])[0]
-                missing.append(str(loc))
-        if missing:
-            raise RuntimeError(
-                "Missing required settings: "
-                + ", ".join(sorted(set(missing)))
-                + f". Looked in ENV_FILE={env_file!r} and process environment."
-            ) from e
-        raise
+    env: Dict[str, str] = {}
+    if env_path.exists():
+        env.update((k.upper(), v) for k, v in _read_env_file(env_path).items())
+    env.update((k.upper(), v) for k, v in os.environ.items())
+
+    init_fields = [f for f in dataclasses.fields(Settings) if f.init]
+    unknown = sorted(set(overrides) - {f.name for f in init_fields})
+    if unknown:
+        # Same failure as dataclasses.replace() for a misspelled field
+        raise TypeError(f"load_settings() got unexpected keyword argument(s): {', '.join(unknown)}")
+
+    kwargs: Dict[str, Any] = {}
+    missing: List[str] = []
+    for f in init_fields:
+        if f.name in overrides:
+            kwargs[f.name] = overrides[f.name]
+            continue
+        name = f.metadata["env"]
+        if name in env:
+            try:
+                kwargs[f.name] = f.metadata["parse"](env[name])
+            except ValueError as e:
+                raise ValueError(f"Invalid {name}: {e}") from e
+        elif f.default is dataclasses.MISSING:
+            missing.append(name)
+    if missing:
+        raise RuntimeError(
+            "Missing required settings: "
+            + ", ".join(sorted(missing))
+            + f". Looked in ENV_FILE={env_file!r} and process environment."
+        )
+    s = Settings(**kwargs)
     # Optionally set ADC env for downstream libs if provided in .env
     if s.google_application_credentials:
         os.environ.setdefault(
@@ -175,12 +233,19 @@ def load_settings() -> Settings:
     return s
 
 
+@functools.lru_cache(maxsize=1)
+def cached_settings() -> Settings:
+    """Process-wide Settings, loaded (and .env parsed) once."""
+    return load_settings()
+
+
 # Singleton used across modules
-settings: Settings = load_settings()
+settings: Settings = cached_settings()
 
 __all__ = [
     "Settings",
     "settings",
     "load_settings",
+    "cached_settings",
     "_months_between",
 ]
\ No newline at end of file
@@ -11,34 +11,56 @@ We persist one JSON file per step in GCS at:
 API:
 - is_done(bucket, kind, month, step, project_id=None) -> bool
 - get_status(bucket, kind, month, step, project_id=None) -> dict | None
-- mark_done(bucket, kind, month, step, meta=None, project_id=None) -> dict
+- is_done_and_get(bucket, kind, month, step, project_id=None) -> (bool, dict | None)
+- mark_done(bucket, kind, month, step, meta=None, project_id=None, force=False) -> dict
 - clear_checkpoint(bucket, kind, month, step, project_id=None) -> None
+- list_done_steps(bucket, kind, month, project_id=None) -> set[str]
+- list_checkpoints(bucket, project_id=None, kind=None) -> set[(kind, month, step)]
+- close_clients() -> None
 
 Design notes:
 - `month` must be 'YYYY-MM'.
 - Files are uploaded with content_type='application/json' and no-store cache.
-- Overwrites are allowed (last write wins).
+- First write wins: mark_done creates the object only if absent
+  (if_generation_match=0); pass force=True to overwrite.
+- Storage clients (and bucket handles) are cached per project for the process.
 """
 
 import datetime as _dt
+import functools
 import json
 import re
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
 
-from google.api_core.exceptions import GoogleAPICallError, NotFound
+from google.api_core.exceptions import GoogleAPICallError, NotFound, PreconditionFailed
 from google.cloud import storage
 
+# Optional: fast JSON encoding/decoding (bytes in, bytes out)
+try:
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    _ORJSON_AVAILABLE = False
+
 __all__ = [
     "is_done",
     "get_status",
+    "is_done_and_get",
     "mark_done",
     "clear_checkpoint",
     "checkpoint_path",
+    "list_done_steps",
+    "list_checkpoints",
+    "close_clients",
 ]
 
 _MONTH_RE = re.compile(r"^\d{4}-\d{2}$")
+_CHECKPOINT_KEY_RE = re.compile(r"^state/([^/]+)/(\d{4})(\d{2})/([^/]+)\.json$")
 
 
+@functools.lru_cache(maxsize=1024)
 def _mm_compact(month: str) -> str:
     """Return compact YYYYMM after validating 'YYYY-MM'."""
     if not _MONTH_RE.match(month):
@@ -46,14 +68,48 @@ def _mm_compact(month: str) -> str:
     return month.replace("-", "")
 
 
+@functools.lru_cache(maxsize=1024)
 def checkpoint_path(kind: str, month: str, step: str) -> str:
     """Return the GCS object key for a checkpoint."""
     return f"state/{kind}/{_mm_compact(month)}/{step}.json"
 
 
-def _blob(client: storage.Client, bucket: str, key: str) -> storage.Blob:
-    bkt = client.bucket(bucket)
-    return bkt.blob(key)
+# One storage client per project, reused across calls: constructing one does
+# ADC discovery and loads credentials. Clients are safe to share across threads.
+_CLIENTS: Dict[Optional[str], storage.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _client(project_id: Optional[str]) -> storage.Client:
+    client = _CLIENTS.get(project_id)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(project_id)
+            if client is None:
+                client = _CLIENTS[project_id] = storage.Client(project=project_id)
+    return client
+
+
+@functools.lru_cache(maxsize=32)
+def _bucket(project_id: Optional[str], bucket: str) -> storage.Bucket:
+    return _client(project_id).bucket(bucket)
+
+
+def _blob(project_id: Optional[str], bucket: str, key: str) -> storage.Blob:
+    return _bucket(project_id, bucket).blob(key)
+
+
+def close_clients() -> None:
+    """Close and forget the cached storage clients (e.g. between tests or after forking)."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _bucket.cache_clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
 
 
 def is_done(
@@ -69,11 +125,10 @@ def is_done(
     Returns:
         True if the checkpoint object exists; False otherwise.
     """
-    client = storage.Client(project=project_id)
     key = checkpoint_path(kind, month, step)
-    blob = _blob(client, bucket, key)
+    blob = _blob(project_id, bucket, key)
     try:
-        return blob.exists(client)
+        return blob.exists()
     except GoogleAPICallError:
         # Conservative: if we can't check, report False so the step can retry.
         return False
@@ -92,19 +147,39 @@ def get_status(
     Returns:
         The parsed dict or None if not found.
     """
-    client = storage.Client(project=project_id)
     key = checkpoint_path(kind, month, step)
-    blob = _blob(client, bucket, key)
-    if not blob.exists(client):
+    blob = _blob(project_id, bucket, key)
+    # Single GET: a missing object surfaces as NotFound, no separate exists() probe
+    try:
+        data = blob.download_as_bytes()
+    except NotFound:
         return None
-    data = blob.download_as_bytes()
     try:
-        return json.loads(data.decode("utf-8"))
+        return orjson.loads(data) if _ORJSON_AVAILABLE else json.loads(data.decode("utf-8"))
     except Exception:
         # Return a minimal structure if the payload is not valid JSON.
         return {"raw": data.decode("utf-8", "ignore")}
 
 
+def is_done_and_get(
+    bucket: str,
+    kind: str,
+    month: str,
+    step: str,
+    project_id: Optional[str] = None,
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Existence check and payload read in one GET.
+
+    Use instead of is_done() followed by get_status(), which costs two round trips.
+
+    Returns:
+        (True, document) if the checkpoint exists; (False, None) otherwise.
+    """
+    doc = get_status(bucket, kind, month, step, project_id=project_id)
+    return doc is not None, doc
+
+
 def mark_done(
     bucket: str,
     kind: str,
@@ -112,9 +187,14 @@ def mark_done(
     step: str,
     meta: Optional[Dict[str, Any]] = None,
     project_id: Optional[str] = None,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
-    Write/overwrite the checkpoint JSON document for a completed step.
+    Write the checkpoint JSON document for a completed step.
+
+    The upload is conditional on the object not existing, so when two workers
+    finish the same step the second one keeps the first checkpoint instead of
+    overwriting its meta.
 
     Args:
         bucket: GCS bucket name.
@@ -123,29 +203,41 @@ def mark_done(
         step: logical step name, e.g. 'certs' or 'recs'.
         meta: optional metadata (e.g., rows, gcs_uri, table, job_id).
         project_id: optional GCP project override.
+        force: overwrite an existing checkpoint instead of keeping it.
 
     Returns:
-        The document that was written.
+        The document that was written, or the existing one if a checkpoint
+        was already present (and force is False).
     """
-    client = storage.Client(project=project_id)
     key = checkpoint_path(kind, month, step)
-    blob = _blob(client, bucket, key)
+    blob = _blob(project_id, bucket, key)
 
     doc: Dict[str, Any] = {
         "kind": kind,
         "month": month,
         "step": step,
         "status": "done",
-        "ts": _dt.datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "ts": _dt.datetime.now(_dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "meta": meta or {},
         "version": 1,
     }
 
-    payload = json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if _ORJSON_AVAILABLE:
+        payload = orjson.dumps(doc, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     # Set metadata for better cache behavior/inspection.
     blob.cache_control = "no-store, max-age=0"
     blob.content_type = "application/json"
-    blob.upload_from_string(payload, content_type="application/json")
+    try:
+        blob.upload_from_string(payload, content_type="application/json", if_generation_match=0)
+    except PreconditionFailed:
+        if not force:
+            existing = get_status(bucket, kind, month, step, project_id=project_id)
+            if existing is not None:
+                return existing
+        # Forced, or the object vanished between the two calls
+        blob.upload_from_string(payload, content_type="application/json")
     return doc
 
 
@@ -161,10 +253,51 @@ def clear_checkpoint(
 
     This is safe to call if the object does not exist.
     """
-    client = storage.Client(project=project_id)
     key = checkpoint_path(kind, month, step)
-    blob = _blob(client, bucket, key)
+    blob = _blob(project_id, bucket, key)
     try:
         blob.delete()  # type: ignore[no-untyped-call]
     except NotFound:
-        return
\ No newline at end of file
+        return
+
+
+def list_done_steps(
+    bucket: str,
+    kind: str,
+    month: str,
+    project_id: Optional[str] = None,
+) -> Set[str]:
+    """
+    Return the steps checkpointed for one (kind, month) with a single listing.
+
+    Replaces one is_done() round trip per step when a caller needs several.
+    """
+    prefix = f"state/{kind}/{_mm_compact(month)}/"
+    steps: Set[str] = set()
+    for blob in _client(project_id).list_blobs(bucket, prefix=prefix, fields="items(name),nextPageToken"):
+        name = blob.name[len(prefix):]
+        if name.endswith(".json") and "/" not in name:
+            steps.add(name[: -len(".json")])
+    return steps
+
+
+def list_checkpoints(
+    bucket: str,
+    project_id: Optional[str] = None,
+    kind: Optional[str] = None,
+) -> Set[Tuple[str, str, str]]:
+    """
+    List every checkpoint under state/ (or state/{kind}/) with one paged listing.
+
+    Returns:
+        A set of (kind, 'YYYY-MM', step) tuples, suitable as an in-memory index
+        instead of one is_done() call per cell.
+    """
+    client = _client(project_id)
+    prefix = f"state/{kind}/" if kind else "state/"
+    done: Set[Tuple[str, str, str]] = set()
+    for blob in client.list_blobs(bucket, prefix=prefix, fields="items(name),nextPageToken"):
+        m = _CHECKPOINT_KEY_RE.match(blob.name)
+        if m:
+            done.add((m.group(1), f"{m.group(2)}-{m.group(3)}", m.group(4)))
+    return done
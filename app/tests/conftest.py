@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# dame_epc.settings builds the process-wide Settings at import time.
+for _key, _value in {
+    "PROJECT_ID": "test-project",
+    "BUCKET": "test-bucket",
+    "EPC_EMAIL": "test@example.com",
+    "EPC_API_KEY": "test-key",
+    "START_MONTH": "2024-01",
+    "END_MONTH": "2024-03",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+# Repository root, so `scripts.apply_views` is importable.
+_ROOT = Path(__file__).resolve().parents[2]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from dame_epc import io_utils  # noqa: E402  (needs the settings above)
+
+
+class FakeWriter(io.BytesIO):
+    """BlobWriter stand-in: close() finalizes the object, terminate() cancels it."""
+
+    def __init__(self, blob):
+        super().__init__()
+        self.blob = blob
+        self.terminated = False
+
+    def close(self):
+        if not self.closed:
+            self.blob.data = self.getvalue()
+        super().close()
+
+    def terminate(self):
+        self.terminated = True
+        super().close()
+
+
+class FakeBlob:
+    def __init__(self, name, data=None):
+        self.name = name
+        self.data = data
+        self.writers = []
+        self.open_kwargs = None
+
+    def open(self, mode, **kwargs):
+        assert mode == "wb"
+        self.open_kwargs = kwargs
+        w = FakeWriter(self)
+        self.writers.append(w)
+        return w
+
+    def delete(self):
+        self.data = None
+
+
+class FakeStorage:
+    def __init__(self):
+        self.blobs = {}
+
+    def Client(self, project=None):
+        return self
+
+    def bucket(self, name):
+        return self
+
+    def blob(self, key):
+        return self.blobs.setdefault(key, FakeBlob(key))
+
+
+@pytest.fixture
+def gcs(monkeypatch):
+    """In-memory GCS behind io_utils' upload helpers."""
+    fake = FakeStorage()
+    monkeypatch.setattr(io_utils, "storage", fake)
+    return fake
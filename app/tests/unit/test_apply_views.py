@@ -0,0 +1,286 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from dame_epc.settings import Settings
+from scripts import apply_views
+
+
+class FakeJob:
+    _ids = itertools.count()
+
+    def __init__(self, ddl_operation_performed, error=None):
+        self.ddl_operation_performed = ddl_operation_performed
+        self.job_id = f"job_{next(self._ids)}"
+        self._error = error
+
+    def result(self):
+        if self._error:
+            raise self._error
+        return SimpleNamespace(total_bytes_processed=0)
+
+
+class FakeClient:
+    """In-memory stand-in for the few BigQuery calls apply_views makes."""
+
+    def __init__(self, fail=()):
+        self.tables = {}
+        self.queries = []
+        self.deleted = []
+        self.fail = set(fail)
+
+    def get_table(self, table_id):
+        if table_id not in self.tables:
+            raise NotFound(table_id)
+        # a detached copy, as from the API: edits only persist via update_table
+        return SimpleNamespace(table_id=table_id, labels=dict(self.tables[table_id].labels))
+
+    def update_table(self, table, fields):
+        assert fields == ["labels"]
+        self.tables[table.table_id].labels = dict(table.labels)
+        return table
+
+    def delete_table(self, table_id, not_found_ok=False):
+        self.deleted.append(table_id)
+        self.tables.pop(table_id, None)
+
+    def query(self, sql, job_config=None, location=None):
+        self.queries.append(sql)
+        table_id = apply_views._table_id(apply_views._extract_view_name(sql))
+        if table_id.split(".")[-1] in self.fail:
+            return FakeJob(None, error=RuntimeError(f"boom: {table_id}"))
+        if table_id in self.tables:
+            op = "SKIP" if "IF NOT EXISTS" in sql.upper() else "REPLACE"
+        else:
+            op = "CREATE"
+            self.tables[table_id] = SimpleNamespace(labels={})
+        return FakeJob(op)
+
+
+@pytest.fixture
+def settings():
+    return Settings(
+        project_id="p",
+        bucket="b",
+        epc_email="e",
+        epc_api_key="k",
+        start_month="2024-01",
+        end_month="2024-01",
+        dataset_enr="d",
+        dataset_raw="d",
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(apply_views, "ensure_dataset", lambda *a, **k: None)
+    monkeypatch.setattr(apply_views.bigquery, "Client", lambda *a, **k: fake)
+    return fake
+
+
+def _write(views_dir, name, sql):
+    views_dir.mkdir(exist_ok=True)
+    (views_dir / name).write_text(sql, encoding="utf-8")
+
+
+def _statuses(results):
+    return {r.view_name: r.status for r in results if not r.file.startswith("backfill:")}
+
+
+VIEW_SQL = "CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.v_a` AS SELECT 1 AS x;"
+MV_SQL = "CREATE MATERIALIZED VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.mv_a` AS SELECT 1 AS x;"
+
+
+def test_unchanged_view_is_skipped_and_edit_reapplied(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "v_a.sql", VIEW_SQL)
+
+    first = apply_views.run(views, settings, None, False)
+    assert _statuses(first) == {"`p.d.v_a`": "applied"}
+    digest = client.tables["p.d.v_a"].labels["sql_hash"]
+
+    second = apply_views.run(views, settings, None, False)
+    assert _statuses(second) == {"`p.d.v_a`": "skipped"}
+    assert len(client.queries) == 1
+
+    _write(views, "v_a.sql", VIEW_SQL.replace("1 AS x", "2 AS x"))
+    third = apply_views.run(views, settings, None, False)
+    assert _statuses(third) == {"`p.d.v_a`": "applied"}
+    assert client.tables["p.d.v_a"].labels["sql_hash"] != digest
+
+
+def test_if_not_exists_noop_is_not_labelled(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "v_a.sql", "CREATE VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.v_a` AS SELECT 1 AS x;")
+    client.tables["p.d.v_a"] = SimpleNamespace(labels={})
+
+    results = apply_views.run(views, settings, None, False)
+    assert _statuses(results) == {"`p.d.v_a`": "skipped"}
+    assert "sql_hash" not in client.tables["p.d.v_a"].labels
+
+
+def test_changed_materialized_view_errors_until_forced(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "mv_a.sql", MV_SQL)
+    assert _statuses(apply_views.run(views, settings, None, False)) == {"`p.d.mv_a`": "applied"}
+    old = client.tables["p.d.mv_a"].labels["sql_hash"]
+
+    _write(views, "mv_a.sql", MV_SQL.replace("1 AS x", "2 AS x"))
+    results = apply_views.run(views, settings, None, False)
+    assert _statuses(results) == {"`p.d.mv_a`": "error"}
+    assert "--force" in results[-1].error
+    assert client.tables["p.d.mv_a"].labels["sql_hash"] == old
+    assert len(client.queries) == 1  # the edit was not submitted as a no-op
+
+    forced = apply_views.run(views, settings, None, False, force=True)
+    assert _statuses(forced) == {"`p.d.mv_a`": "applied"}
+    assert client.deleted == ["p.d.mv_a"]
+    assert client.tables["p.d.mv_a"].labels["sql_hash"] not in (None, old)
+
+
+def test_forced_unchanged_materialized_view_is_not_dropped(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "mv_a.sql", MV_SQL)
+    apply_views.run(views, settings, None, False)
+
+    results = apply_views.run(views, settings, None, False, force=True)
+    assert _statuses(results) == {"`p.d.mv_a`": "skipped"}  # IF NOT EXISTS -> SKIP
+    assert client.deleted == []
+
+
+
+def test_unlabelled_materialized_view_is_adopted_not_an_error(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "mv_a.sql", MV_SQL)
+    client.tables["p.d.mv_a"] = SimpleNamespace(labels={})  # hand-made, or stamping failed
+
+    results = apply_views.run(views, settings, None, False)
+    assert _statuses(results) == {"`p.d.mv_a`": "skipped"}
+    assert client.queries == [] and client.deleted == []
+    assert client.tables["p.d.mv_a"].labels["sql_hash"] == apply_views._sql_digest(
+        apply_views._render_sql(MV_SQL, "p", "d")
+    )
+    # adopted: the next run is an ordinary hash match
+    assert _statuses(apply_views.run(views, settings, None, False)) == {"`p.d.mv_a`": "skipped"}
+
+
+def test_stamp_failure_after_create_is_not_an_error(tmp_path, settings, client, monkeypatch):
+    views = tmp_path / "views"
+    _write(views, "mv_a.sql", MV_SQL)
+
+    def failing_update(table, fields):
+        raise RuntimeError("labels update denied")
+
+    monkeypatch.setattr(client, "update_table", failing_update)
+    assert _statuses(apply_views.run(views, settings, None, False)) == {"`p.d.mv_a`": "applied"}
+    assert "sql_hash" not in client.tables["p.d.mv_a"].labels
+    # the unlabeled MV left behind does not turn into an error on later runs
+    assert _statuses(apply_views.run(views, settings, None, False)) == {"`p.d.mv_a`": "skipped"}
+
+# --- DDL parsing and dependency waves ---
+
+
+@pytest.mark.parametrize(
+    "sql, name, materialized",
+    [
+        ("CREATE OR REPLACE VIEW `p.d.v` AS SELECT 1", "`p.d.v`", False),
+        ("create view if not exists d.v as select 1", "d.v", False),
+        ("  CREATE MATERIALIZED VIEW IF NOT EXISTS `p.d.mv`\nAS SELECT 1", "`p.d.mv`", True),
+        (
+            "-- Idempotent: CREATE OR REPLACE VIEW\n-- Source: `p.d.other`\n\nCREATE OR REPLACE VIEW `p.d.v` AS\nSELECT 1",
+            "`p.d.v`",
+            False,
+        ),
+        ("SELECT 1", None, False),
+    ],
+)
+def test_view_name_regex(sql, name, materialized):
+    assert apply_views._extract_view_name(sql) == name
+    assert apply_views._is_materialized(sql) is materialized
+
+
+def _deps(files):
+    """files: {name: sql}; returns ({name: set(dep names)}, waves as names, cyclic names)."""
+    from pathlib import Path
+
+    sqls = {Path(n): sql for n, sql in files.items()}
+    ids = {f: apply_views._object_id(apply_views._extract_view_name(sql), f, "p", "d") for f, sql in sqls.items()}
+    deps = apply_views._dependencies(sqls, ids, "p", "d")
+    waves, cyclic = apply_views._dependency_waves(deps)
+    return (
+        {f.name: {g.name for g in gs} for f, gs in deps.items()},
+        [[f.name for f in w] for w in waves],
+        [f.name for f in cyclic],
+    )
+
+
+def test_dependencies_match_full_identifiers_only():
+    deps, _, _ = _deps(
+        {
+            "a": "CREATE OR REPLACE VIEW `p.d.certs_v` AS SELECT 1",
+            # `p.d.domestic_certs_v` ends with ".certs_v`"-like text but is a different object
+            "b": "CREATE OR REPLACE VIEW `p.d.domestic_certs_v` AS SELECT 1",
+            "c": "CREATE OR REPLACE VIEW `p.d.c` AS SELECT * FROM `p.d.domestic_certs_v`",
+            # other project/dataset with the same table name
+            "e": "CREATE OR REPLACE VIEW `p.d.e` AS SELECT * FROM `q.x.certs_v`",
+        }
+    )
+    assert deps == {"a": set(), "b": set(), "c": {"b"}, "e": set()}
+
+
+def test_dependencies_unquoted_and_split_references():
+    deps, _, _ = _deps(
+        {
+            "a": "CREATE OR REPLACE VIEW `p.d.a` AS SELECT 1",
+            "b": "CREATE OR REPLACE VIEW `p.d.b` AS SELECT 1",
+            "c": "CREATE OR REPLACE VIEW `p.d.c` AS SELECT 1",
+            "x": (
+                "CREATE OR REPLACE VIEW `p.d.x` AS\n"
+                "SELECT * FROM d.a\n"
+                "JOIN `p`.`d`.`b` USING (k)\n"
+                "-- also see `p.d.c` (comment only)\n"
+                "WHERE note != 'p.d.c'"
+            ),
+        }
+    )
+    assert deps["x"] == {"a", "b"}
+
+
+def test_dependency_waves_order_and_cycles():
+    _, waves, cyclic = _deps(
+        {
+            "1_top": "CREATE OR REPLACE VIEW `p.d.top` AS SELECT * FROM `p.d.mid`",
+            "2_mid": "CREATE OR REPLACE VIEW `p.d.mid` AS SELECT * FROM `p.d.base`",
+            "3_base": "CREATE OR REPLACE VIEW `p.d.base` AS SELECT 1",
+            "4_free": "CREATE OR REPLACE VIEW `p.d.free` AS SELECT 1",
+            "5_x": "CREATE OR REPLACE VIEW `p.d.x` AS SELECT * FROM `p.d.y`",
+            "6_y": "CREATE OR REPLACE VIEW `p.d.y` AS SELECT * FROM `p.d.x`",
+        }
+    )
+    assert waves == [["3_base", "4_free"], ["2_mid"], ["1_top"]]
+    assert cyclic == ["5_x", "6_y"]
+
+
+def test_failure_propagates_downstream_only(tmp_path, settings, client):
+    views = tmp_path / "views"
+    _write(views, "a_base.sql", "CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.base` AS SELECT 1 AS x;")
+    _write(views, "b_mid.sql", "CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.mid` AS SELECT * FROM `{{PROJECT}}.{{DATASET}}.base`;")
+    _write(views, "c_top.sql", "CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.top` AS SELECT * FROM `{{PROJECT}}.{{DATASET}}.mid`;")
+    _write(views, "d_free.sql", "CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.base_free` AS SELECT 1 AS x;")
+    client.fail = {"base"}
+
+    results = apply_views.run(views, settings, None, False)
+    by_name = {r.view_name: r for r in results}
+    assert by_name["`p.d.base`"].status == "error"
+    assert by_name["`p.d.mid`"].status == "skipped"
+    assert by_name["`p.d.mid`"].error == "upstream failed: p.d.base"
+    assert by_name["`p.d.top`"].status == "skipped"
+    assert by_name["`p.d.top`"].error == "upstream failed: p.d.mid"
+    assert by_name["`p.d.base_free`"].status == "applied"
+    # reported in file order
+    assert [r.view_name for r in results if not r.file.startswith("backfill:")] == [
+        "`p.d.base`", "`p.d.mid`", "`p.d.top`", "`p.d.base_free`"
+    ]
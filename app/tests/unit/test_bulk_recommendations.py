@@ -0,0 +1,174 @@
+import datetime as dt
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from dame_epc import bulk_recommendations as br  # noqa: E402
+from dame_epc.io_utils import parquet_supported  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not parquet_supported(), reason="pyarrow without the JSON extension type")
+
+
+def _batch(**cols):
+    return pa.RecordBatch.from_pydict({k: pa.array(v, type=pa.string()) for k, v in cols.items()})
+
+
+def test_rec_batches_drop_null_and_empty_lmk_rows():
+    batch = _batch(
+        LMK_KEY=["a", None, "", "b"],
+        IMPROVEMENT_ITEM=["1", "2", "3", "4"],
+    )
+    (out,) = list(br._rec_batches_to_envelopes([batch]))
+    assert out.column("lmk_key").to_pylist() == ["a", "b"]
+    assert out.column("lodgement_date").to_pylist() == [None, None]  # no date column
+    payloads = [json.loads(p) for p in out.column("payload").storage.to_pylist()]
+    assert payloads == [
+        {"LMK_KEY": "a", "IMPROVEMENT_ITEM": "1"},
+        {"LMK_KEY": "b", "IMPROVEMENT_ITEM": "4"},
+    ]
+
+
+def test_rec_batches_skip_all_null_and_lmkless_batches():
+    assert list(br._rec_batches_to_envelopes([_batch(LMK_KEY=[None, ""])])) == []
+    assert list(br._rec_batches_to_envelopes([_batch(OTHER=["x"])])) == []
+
+
+def test_rec_batches_date_handling_matches_row_path():
+    dates = [
+        "2024-01-05",
+        "2024-02-29",
+        "2024-02-30",  # strptime alone rolls this over to March 1st
+        "2024-1-5",
+        "2024/01/05",
+        "2024-01-05T10:00:00",
+        " 2024-01-05",
+        "",
+        None,
+    ]
+    batch = _batch(lmk_key=[f"k{i}" for i in range(len(dates))], lodgement_date=dates)
+    (out,) = list(br._rec_batches_to_envelopes([batch]))
+    got = out.column("lodgement_date").to_pylist()
+
+    expected = [
+        br._normalize_rec({"lmk_key": "k", "lodgement_date": d})["lodgement_date"] for d in dates
+    ]
+    assert [d.isoformat() if d else None for d in got] == expected
+    assert got[:3] == [dt.date(2024, 1, 5), dt.date(2024, 2, 29), None]
+    assert out.schema.field("lodgement_date").type == pa.date32()
+
+
+def _zip(csv_bytes, name="recommendations.csv"):
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(name, csv_bytes)
+    buf.seek(0)
+    return buf
+
+
+BOM_CSV = "﻿LMK_KEY,IMPROVEMENT_ITEM,LODGEMENT_DATE\r\nk1,1,2024-01-05\r\n,2,\r\nk2,\"a, b\",\r\n".encode("utf-8")
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_recs_zip_strips_bom_in_both_paths(monkeypatch, arrow):
+    monkeypatch.setattr(br, "_PYARROW_AVAILABLE", arrow)
+    rows = list(br._iter_recs_from_zip(_zip(BOM_CSV)))
+    lmks = [r["LMK_KEY"] for r in rows if r["LMK_KEY"]]
+    assert lmks == ["k1", "k2"]
+    assert all("﻿LMK_KEY" not in r for r in rows)
+    assert rows[-1]["IMPROVEMENT_ITEM"] == "a, b"
+
+
+def test_arrow_csv_batches_header_only_and_empty_member():
+    import zipfile
+
+    with zipfile.ZipFile(_zip(b"LMK_KEY,X\r\n")) as zf:
+        assert list(br._iter_csv_batches_arrow(zf, "recommendations.csv")) == []
+    with zipfile.ZipFile(_zip(b"")) as zf:
+        assert list(br._iter_csv_batches_arrow(zf, "recommendations.csv")) == []
+
+
+def test_arrow_csv_batches_read_everything_as_strings():
+    import zipfile
+
+    with zipfile.ZipFile(_zip(b"LMK_KEY,N\r\n007,0012\r\n")) as zf:
+        (batch,) = list(br._iter_csv_batches_arrow(zf, "recommendations.csv"))
+    assert batch.to_pylist() == [{"LMK_KEY": "007", "N": "0012"}]
+
+
+# Quoted multi-line values: at these block sizes most rows straddle a block boundary,
+# and some boundaries fall inside a quoted CRLF.
+MULTILINE_CSV = b"LMK_KEY,IMPROVEMENT_DESCR_TEXT,LODGEMENT_DATE\r\n" + b"".join(
+    b'k%d,"Insulate the loft\r\nthen the walls (%d)",2024-01-05\r\n' % (i, i) for i in range(50)
+)
+INVALID_UTF8_CSV = b"LMK_KEY,IMPROVEMENT_DESCR_TEXT\r\nk1,caf\xe9 boiler\r\nk2,ok\r\n"
+
+
+def _rows_both_paths(monkeypatch, data):
+    monkeypatch.setattr(br, "_PYARROW_AVAILABLE", False)
+    expected = list(br._iter_recs_from_zip(_zip(data)))
+    monkeypatch.setattr(br, "_PYARROW_AVAILABLE", True)
+    return expected, list(br._iter_recs_from_zip(_zip(data)))
+
+
+@pytest.mark.parametrize("block_size", [64, 65, 77, 101])
+def test_arrow_rows_multiline_values_across_blocks(monkeypatch, block_size):
+    monkeypatch.setattr(br, "_CSV_BLOCK_SIZE", block_size)
+    expected, got = _rows_both_paths(monkeypatch, MULTILINE_CSV)
+    assert len(got) == 50
+    assert got[7]["IMPROVEMENT_DESCR_TEXT"] == "Insulate the loft\r\nthen the walls (7)"
+    assert got == expected
+
+
+def test_arrow_rows_replace_invalid_utf8_like_dictreader(monkeypatch):
+    expected, got = _rows_both_paths(monkeypatch, INVALID_UTF8_CSV)
+    assert [r["IMPROVEMENT_DESCR_TEXT"] for r in got] == ["caf� boiler", "ok"]
+    assert got == expected
+
+
+def _payloads(batches):
+    return [json.loads(p) for b in batches for p in b.column("payload").storage.to_pylist()]
+
+
+@pytest.mark.parametrize("block_size", [64, 65, 77, 101])
+def test_parquet_batches_multiline_values_across_blocks(monkeypatch, block_size):
+    monkeypatch.setattr(br, "_CSV_BLOCK_SIZE", block_size)
+    batches = list(br._iter_rec_batches_from_zip(_zip(MULTILINE_CSV)))
+    payloads = _payloads(batches)
+    assert [p["LMK_KEY"] for p in payloads] == [f"k{i}" for i in range(50)]
+    assert [p["IMPROVEMENT_DESCR_TEXT"] for p in payloads] == [
+        f"Insulate the loft\r\nthen the walls ({i})" for i in range(50)
+    ]
+
+
+def test_parquet_batches_replace_invalid_utf8():
+    batches = list(br._iter_rec_batches_from_zip(_zip(INVALID_UTF8_CSV)))
+    assert [p["IMPROVEMENT_DESCR_TEXT"] for p in _payloads(batches)] == ["caf� boiler", "ok"]
+
+
+def test_run_year_parquet_path_reads_awkward_csv(monkeypatch, tmp_path):
+    zip_path = tmp_path / "recs-2024.zip"
+    zip_path.write_bytes(_zip(MULTILINE_CSV + b'k50,"caf\xe9\r\nstove",\r\n').getvalue())
+    uploaded = []
+
+    def fake_write_parquet_gcs(project, bucket, key, batches):
+        uploaded.extend(batches)
+        return f"gs://{bucket}/{key}"
+
+    monkeypatch.setattr(br, "_CSV_BLOCK_SIZE", 77)
+    monkeypatch.setattr(br, "ensure_dataset", lambda *a, **k: None)
+    monkeypatch.setattr(br, "write_parquet_gcs", fake_write_parquet_gcs)
+    monkeypatch.setattr(br, "load_bq_raw", lambda **k: f"{k['project']}.{k['dataset']}.{k['table']}")
+
+    settings = SimpleNamespace(project_id="p", bucket="b", dataset_raw="d", bq_location="EU")
+    res = br.run_year("domestic", 2024, settings, source=br.ZipSource(local_path=str(zip_path)))
+
+    assert res["status"] == "loaded"
+    assert res["rows"] == 51
+    assert res["gcs_uri"].endswith(".parquet")
+    assert _payloads(uploaded)[-1]["IMPROVEMENT_DESCR_TEXT"] == "caf�\r\nstove"
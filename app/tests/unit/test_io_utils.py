@@ -0,0 +1,66 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from dame_epc import io_utils
+
+
+def _rows(n, fail_at=None):
+    for i in range(n):
+        if i == fail_at:
+            raise RuntimeError("EPC page failed")
+        yield {"lmk_key": f"k{i}"}
+
+
+def test_write_ndjson_gcs_finalizes_complete_stream(gcs):
+    uri = io_utils.write_ndjson_gcs("p", "b", "k.json.gz", _rows(3))
+    assert uri == "gs://b/k.json.gz"
+    blob = gcs.blobs["k.json.gz"]
+    lines = gzip.decompress(blob.data).decode().splitlines()
+    assert [json.loads(x)["lmk_key"] for x in lines] == ["k0", "k1", "k2"]
+    assert blob.open_kwargs["content_type"] == "application/gzip"
+    assert not blob.writers[0].terminated
+
+
+def test_write_ndjson_gcs_cancels_upload_when_source_raises(gcs):
+    with pytest.raises(RuntimeError, match="EPC page failed"):
+        io_utils.write_ndjson_gcs("p", "b", "k.json.gz", _rows(5, fail_at=2))
+    blob = gcs.blobs["k.json.gz"]
+    assert blob.writers[0].terminated
+    assert blob.data is None  # nothing finalized
+
+
+def test_failed_upload_keeps_existing_object(gcs):
+    gcs.blob("k.json.gz").data = b"previous"
+    with pytest.raises(RuntimeError):
+        io_utils.write_ndjson_gcs("p", "b", "k.json.gz", _rows(5, fail_at=0))
+    assert gcs.blobs["k.json.gz"].data == b"previous"
+
+
+def test_open_upload_without_terminate_still_skips_finalize():
+    class OldWriter(io.BytesIO):
+        finalized = False
+
+        def close(self):
+            OldWriter.finalized = True
+            super().close()
+
+    class OldBlob:
+        def open(self, mode, **kwargs):
+            return OldWriter()
+
+    with pytest.raises(ValueError):
+        with io_utils.open_upload(OldBlob(), "application/gzip") as raw:
+            raw.write(b"partial")
+            raise ValueError
+    assert OldWriter.finalized is False
+
+
+def test_ndjson_output_is_deterministic(gcs):
+    io_utils.write_ndjson_gcs("p", "b", "a.json.gz", _rows(3))
+    io_utils.write_ndjson_gcs("p", "b", "b.json.gz", _rows(3))
+    assert gcs.blobs["a.json.gz"].data[4:8] == b"\0\0\0\0"  # gzip header MTIME
+    assert gcs.blobs["a.json.gz"].data == gcs.blobs["b.json.gz"].data
+
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dame_epc import main
+
+S = SimpleNamespace(bucket="b", project_id="p")
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Record is_done() calls; keys in `present` exist in GCS."""
+    calls = []
+    present = set()
+
+    def fake_is_done(bucket, kind, month, step, project_id=None):
+        calls.append((kind, month, step))
+        return (kind, month, step) in present
+
+    monkeypatch.setattr(main, "is_done", fake_is_done)
+    return SimpleNamespace(calls=calls, present=present)
+
+
+def test_step_done_trusts_index_hit(probes):
+    done = {("domestic", "2024-01", "certs")}
+    assert main._step_done("domestic", "2024-01", "certs", S, done) is True
+    assert probes.calls == []
+
+
+def test_step_done_probes_only_the_missed_key(probes):
+    done = {("domestic", "2024-01", "certs")}
+    assert main._step_done("domestic", "2024-01", "recs", S, done) is False
+    assert probes.calls == [("domestic", "2024-01", "recs")]
+
+
+def test_step_done_miss_found_in_gcs_is_cached(probes):
+    probes.present.add(("domestic", "2024-02", "certs"))
+    done = set()
+    assert main._step_done("domestic", "2024-02", "certs", S, done) is True
+    assert ("domestic", "2024-02", "certs") in done
+    assert main._step_done("domestic", "2024-02", "certs", S, done) is True
+    assert len(probes.calls) == 1
+
+
+def test_step_done_without_index_probes(probes):
+    assert main._step_done("non-domestic", "2024-01", "certs", S, None) is False
+    assert probes.calls == [("non-domestic", "2024-01", "certs")]
+
+
+def test_month_range_crosses_year_boundary():
+    assert list(main._month_range("2023-11", "2024-02")) == ["2023-11", "2023-12", "2024-01", "2024-02"]
+    assert list(main._month_range("2024-05", "2024-05")) == ["2024-05"]
+
+
+@pytest.mark.parametrize("start, end", [("2024-03", "2024-02"), ("2024-13", "2024-12"), ("2024-1", "2024-02")])
+def test_month_range_fails_before_iteration(start, end):
+    with pytest.raises(ValueError):
+        main._month_range(start, end)  # no list(): must raise on the call itself
@@ -0,0 +1,60 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from dame_epc import nondomestic
+
+S = SimpleNamespace(
+    project_id="p",
+    bucket="b",
+    page_size=100,
+    request_timeout_seconds=5,
+    epc_auth=("e", "k"),
+    retry_max=0,
+    retry_backoff=0.0,
+)
+KEY = "epc/json/non-domestic/202401/certs/part-0001.json.gz"
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Rows (or an exception) returned by the patched _fetch_certificates."""
+    src = SimpleNamespace(rows=[], fail=None)
+
+    def fake_fetch(month, **kwargs):
+        for i, row in enumerate(src.rows):
+            if i == src.fail:
+                raise RuntimeError("EPC page failed")
+            yield row
+
+    monkeypatch.setattr(nondomestic, "_fetch_certificates", fake_fetch)
+    return src
+
+
+def test_stage_month_streams_rows(gcs, fetched):
+    fetched.rows = [{"lmk_key": "a"}, {"lmk_key": "b"}]
+    res = nondomestic.stage_month("2024-01", S)
+    assert res == {"kind": "non-domestic", "month": "2024-01", "rows": 2, "gcs_uri": f"gs://b/{KEY}", "status": "staged"}
+    blob = gcs.blobs[KEY]
+    assert [json.loads(x)["lmk_key"] for x in gzip.decompress(blob.data).splitlines()] == ["a", "b"]
+    # shared writer: pre-gzipped object metadata
+    assert blob.content_encoding is None
+    assert blob.cache_control == "no-transform"
+
+
+def test_stage_month_empty_month_never_opens_an_upload(gcs, fetched):
+    res = nondomestic.stage_month("2024-01", S)
+    assert res == {"kind": "non-domestic", "month": "2024-01", "rows": 0, "status": "no-data"}
+    assert gcs.blobs == {}
+
+
+def test_stage_month_cancels_upload_when_fetch_fails(gcs, fetched):
+    fetched.rows = [{"lmk_key": str(i)} for i in range(5)]
+    fetched.fail = 3
+    with pytest.raises(RuntimeError, match="EPC page failed"):
+        nondomestic.stage_month("2024-01", S)
+    blob = gcs.blobs[KEY]
+    assert blob.writers[0].terminated
+    assert blob.data is None
@@ -0,0 +1,153 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from dame_epc import schema
+from dame_epc.schema import (
+    DOMESTIC_CURATED_FIELDS,
+    NON_DOMESTIC_CURATED_FIELDS,
+    _safe_cast,
+    backfill_curated_columns_sql,
+    curated_values,
+    parse_iso_date,
+)
+
+
+@pytest.mark.parametrize(
+    "value, typ, expected",
+    [
+        ("42", "INT64", 42),
+        (" 42 ", "INT64", 42),
+        (42, "INT64", 42),
+        ("4.0", "INT64", None),
+        ("abc", "INT64", None),
+        (str(2**63), "INT64", None),
+        ("12.5", "FLOAT64", 12.5),
+        ("1e3", "FLOAT64", 1000.0),
+        (7, "FLOAT64", 7.0),
+        ("inf", "FLOAT64", None),
+        ("n/a", "FLOAT64", None),
+        ("2024-02-29", "DATE", "2024-02-29"),
+        ("2023-02-29", "DATE", None),
+        ("2024-13-01", "DATE", None),
+        ("2024-1-01", "DATE", None),
+        ("01/02/2024", "DATE", None),
+        ("2024-01-01T00:00:00", "DATE", None),
+        (True, "STRING", "true"),
+        (123, "STRING", "123"),
+    ],
+)
+def test_safe_cast(value, typ, expected):
+    assert _safe_cast(value, typ) == expected
+
+
+@pytest.mark.parametrize("typ", ["INT64", "FLOAT64", "DATE"])
+def test_safe_cast_empty_string_is_null_for_non_strings(typ):
+    assert _safe_cast("", typ) is None
+
+
+def test_safe_cast_empty_string_stays_a_string():
+    assert _safe_cast("", "STRING") == ""
+
+
+@pytest.mark.parametrize("value", [None, {"a": 1}, [1, 2]])
+@pytest.mark.parametrize("typ", ["STRING", "INT64", "FLOAT64", "DATE"])
+def test_safe_cast_null_and_containers(value, typ):
+    assert _safe_cast(value, typ) is None
+
+
+def test_curated_values_domestic():
+    rec = {
+        "current-energy-efficiency": "67",
+        "potential-energy-efficiency": "",
+        "address1": "1 High Street",
+        "property-type": "House",
+        "co2-emissions-current": "2.3",
+        "main-fuel": None,
+        "unrelated": "x",
+    }
+    out = curated_values(rec, DOMESTIC_CURATED_FIELDS)
+    assert set(out) == {col for col, _, _ in DOMESTIC_CURATED_FIELDS}
+    assert out["current_energy_efficiency"] == 67
+    assert out["potential_energy_efficiency"] is None
+    assert out["address1"] == "1 High Street"
+    assert out["property_type"] == "House"
+    assert out["co2_emissions_current"] == 2.3
+    assert out["main_fuel"] is None
+    assert out["address2"] is None  # missing key
+
+
+def test_curated_values_non_domestic_bad_numbers():
+    rec = {"building-category": "A1", "asset-rating": "not rated", "co2-emissions": "-1.5"}
+    out = curated_values(rec, NON_DOMESTIC_CURATED_FIELDS)
+    assert out == {
+        "building_category": "A1",
+        "lodgement_type": None,
+        "asset_rating": None,
+        "co2_emissions": -1.5,
+    }
+
+
+def test_backfill_sql_adds_columns_and_bounds_partition():
+    sql = backfill_curated_columns_sql("p", "d", "non-domestic")
+    assert "ALTER TABLE `p.d.non_domestic_raw_json`" in sql
+    assert "ADD COLUMN IF NOT EXISTS asset_rating FLOAT64" in sql
+    assert "UPDATE `p.d.non_domestic_raw_json`" in sql
+    # accepted on tables created with require_partition_filter
+    assert "(lodgement_date IS NOT NULL OR lodgement_date IS NULL)" in sql
+
+
+def test_backfill_sql_unknown_kind():
+    with pytest.raises(ValueError):
+        backfill_curated_columns_sql("p", "d", "commercial")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-02-29", "2024-02-29"),
+        ("2023-02-29", None),
+        ("2024-1-05", None),
+        ("2024-01-05 ", None),
+        ("", None),
+    ],
+)
+def test_parse_iso_date(value, expected):
+    assert parse_iso_date(value) == expected
+
+
+# ---------------------------
+# Python templates vs sql/views/*.sql
+# ---------------------------
+
+_VIEWS_DIR = Path(__file__).resolve().parents[3] / "cloud" / "dame-prod-473718" / "bigquery" / "sql" / "views"
+_OBJECT_RE = re.compile(r"`\{\{PROJECT\}\}\.\{\{DATASET\}\}\.(\w+)`")
+
+
+def _normalized(sql):
+    """SQL without comments, whitespace runs or the trailing semicolon."""
+    return " ".join(re.sub(r"--[^\n]*", "", sql).split()).rstrip(";").strip()
+
+
+def _templates_by_object():
+    out = {}
+    for name in dir(schema):
+        value = getattr(schema, name)
+        if name.endswith("_TEMPLATE") and isinstance(value, str):
+            out[_OBJECT_RE.search(value).group(1)] = value
+    return out
+
+
+_SQL_FILES = sorted(_VIEWS_DIR.glob("*.sql")) if _VIEWS_DIR.is_dir() else []
+
+
+@pytest.mark.skipif(not _SQL_FILES, reason="sql/views directory not present")
+@pytest.mark.parametrize("path", _SQL_FILES, ids=lambda p: p.name)
+def test_sql_files_match_python_templates(path):
+    sql = path.read_text(encoding="utf-8")
+    obj = _OBJECT_RE.search(re.sub(r"--[^\n]*", "", sql)).group(1)
+    template = _templates_by_object().get(obj)
+    if template is None:
+        pytest.skip(f"{obj} has no Python builder")
+    assert _normalized(sql) == _normalized(template)
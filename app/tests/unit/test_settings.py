@@ -0,0 +1,162 @@
+import dataclasses
+
+import pytest
+
+from dame_epc import settings as settings_mod
+from dame_epc.settings import Settings, _months_between, _read_env_file, load_settings
+
+ENV_NAMES = [f.metadata["env"] for f in dataclasses.fields(Settings) if f.init]
+
+REQUIRED = {
+    "PROJECT_ID": "proj",
+    "BUCKET": "bucket",
+    "EPC_EMAIL": "me@example.com",
+    "EPC_API_KEY": "secret",
+    "START_MONTH": "2023-11",
+    "END_MONTH": "2024-02",
+}
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """Empty settings environment, pointed at a (missing) .env in tmp_path."""
+    for name in ENV_NAMES:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("ENV_FILE", str(tmp_path / ".env"))
+    monkeypatch.setattr(settings_mod, "_DOTENV_AVAILABLE", False)
+    return monkeypatch
+
+
+def _set_required(env):
+    for k, v in REQUIRED.items():
+        env.setenv(k, v)
+
+
+def test_defaults_and_required_from_environment(env):
+    _set_required(env)
+    s = load_settings()
+    assert s.project_id == "proj"
+    assert s.region == "europe-west2"
+    assert s.dataset_raw == s.dataset_enr == "dame_epc"
+    assert s.require_partition_filter is False
+    assert (s.page_size, s.concurrency, s.retry_backoff) == (5000, 2, 2.0)
+    assert s.google_application_credentials is None
+    assert s.epc_auth == ("me@example.com", "secret")
+
+
+def test_type_coercion(env):
+    _set_required(env)
+    env.setenv("PAGE_SIZE", "100")
+    env.setenv("RETRY_BACKOFF", "0.5")
+    env.setenv("REQUIRE_PARTITION_FILTER", "Yes")
+    s = load_settings()
+    assert s.page_size == 100
+    assert s.retry_backoff == 0.5
+    assert s.require_partition_filter is True
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [("PAGE_SIZE", "0"), ("PAGE_SIZE", "ten"), ("RETRY_BACKOFF", "fast"), ("REQUIRE_PARTITION_FILTER", "maybe")],
+)
+def test_invalid_values_name_the_variable(env, name, value):
+    _set_required(env)
+    env.setenv(name, value)
+    with pytest.raises(ValueError, match=name):
+        load_settings()
+
+
+def test_missing_required_settings(env):
+    env.setenv("PROJECT_ID", "proj")
+    with pytest.raises(RuntimeError) as exc:
+        load_settings()
+    msg = str(exc.value)
+    assert "BUCKET" in msg and "START_MONTH" in msg and "PROJECT_ID" not in msg
+
+
+def test_env_file_without_dotenv(env, tmp_path):
+    (tmp_path / ".env").write_text(
+        "\n".join(
+            [
+                "# comment",
+                "",
+                "project_id=from-file",
+                'BUCKET="quoted bucket"',
+                "export EPC_EMAIL=me@example.com  # trailing comment",
+                "EPC_API_KEY='a#b'",
+                "START_MONTH=2024-01",
+                "END_MONTH=2024-03",
+                "PAGE_SIZE=250",
+                "not a setting line",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    env.setenv("PAGE_SIZE", "500")  # real environment wins over .env
+    s = load_settings()
+    assert s.project_id == "from-file"
+    assert s.bucket == "quoted bucket"
+    assert s.epc_email == "me@example.com"
+    assert s.epc_api_key == "a#b"
+    assert s.page_size == 500
+    assert s.month_range() == ["2024-01", "2024-02", "2024-03"]
+
+
+def test_read_env_file_minimal_parser(env, tmp_path):
+    path = tmp_path / "x.env"
+    path.write_text('A=1\nexport B = two \nC="x y"\n# D=4\nE=\n', encoding="utf-8")
+    assert _read_env_file(path) == {"A": "1", "B": "two", "C": "x y", "E": ""}
+
+
+def test_overrides_win_and_unknown_overrides_raise(env):
+    _set_required(env)
+    assert load_settings(dataset_enr="other").dataset_enr == "other"
+    with pytest.raises(TypeError, match="datset_enr"):
+        load_settings(datset_enr="other")
+
+
+def test_month_window(env):
+    _set_required(env)
+    s = load_settings()
+    assert s.month_range() == ["2023-11", "2023-12", "2024-01", "2024-02"]
+    assert list(s.iter_months()) == s.month_range()
+    s.month_range().append("2099-01")  # callers get a copy
+    assert len(s.month_range()) == 4
+
+
+def test_window_is_rederived_on_replace(env):
+    _set_required(env)
+    s = dataclasses.replace(load_settings(), end_month="2023-11")
+    assert s.month_range() == ["2023-11"]
+    with pytest.raises(ValueError):
+        dataclasses.replace(s, end_month="2023-10")
+
+
+def test_settings_are_frozen_and_hashable(env):
+    _set_required(env)
+    s = load_settings()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        s.project_id = "x"
+    assert hash(s) == hash(load_settings())
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        ("2024-05", "2024-05", ["2024-05"]),
+        ("2023-12", "2024-01", ["2023-12", "2024-01"]),
+        ("2022-11", "2024-02", None),
+    ],
+)
+def test_months_between(start, end, expected):
+    out = _months_between(start, end)
+    if expected is not None:
+        assert out == expected
+    else:
+        assert len(out) == 16 and out[0] == start and out[-1] == end
+
+
+@pytest.mark.parametrize("start, end", [("2024-02", "2024-01"), ("2024-13", "2024-12"), ("24-01", "2024-01")])
+def test_months_between_rejects_bad_windows(start, end):
+    with pytest.raises(ValueError):
+        _months_between(start, end)
@@ -0,0 +1,97 @@
+import io
+import json
+from urllib.parse import unquote, urlsplit
+
+import pytest
+import requests
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage
+from urllib3.response import HTTPResponse
+
+from dame_epc import state
+
+
+class FakeSession:
+    """
+    HTTP transport for a real storage.Client: serves object metadata and media
+    from `objects` (key -> bytes) and answers 404 for anything else.
+    """
+
+    is_mtls = False
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None, **kwargs):
+        self.calls.append((method, url))
+        path = urlsplit(url).path
+        if "/o/" not in path:  # bucket metadata
+            status, body = 200, json.dumps({"name": "bk"}).encode()
+        else:
+            name = unquote(path.split("/o/", 1)[1])
+            if name not in self.objects:
+                status, body = 404, b'{"error": {"code": 404, "message": "No such object"}}'
+            elif "alt=media" in url:
+                status, body = 200, self.objects[name]
+            else:
+                status, body = 200, json.dumps({"name": name}).encode()
+        resp = requests.Response()
+        resp.url = url
+        resp.request = requests.Request(method, url).prepare()
+        resp.status_code = status
+        resp.headers["content-type"] = "application/json"
+        resp.raw = HTTPResponse(
+            body=io.BytesIO(body), headers={"content-type": "application/json"}, status=status, preload_content=False
+        )
+        return resp
+
+
+@pytest.fixture
+def gcs_http(monkeypatch):
+    session = FakeSession()
+    real_client = storage.Client  # state.storage is this module; keep the class before patching
+
+    def client(project=None):
+        return real_client(project=project or "p", credentials=AnonymousCredentials(), _http=session)
+
+    state.close_clients()
+    monkeypatch.setattr(state.storage, "Client", client)
+    yield session
+    state.close_clients()
+
+
+KEY = "state/domestic/202401/certs.json"
+
+
+def test_is_done_on_real_blob(gcs_http):
+    gcs_http.objects[KEY] = b"{}"
+    assert state.is_done("bk", "domestic", "2024-01", "certs") is True
+    assert state.is_done("bk", "domestic", "2024-02", "certs") is False
+    # one name-only metadata GET per probe (the library may also fetch bucket metadata)
+    object_calls = [url for _, url in gcs_http.calls if "/o/" in urlsplit(url).path]
+    assert len(object_calls) == 2
+    assert all("fields=name" in url for url in object_calls)
+
+
+def test_get_status_on_real_blob(gcs_http):
+    gcs_http.objects[KEY] = json.dumps({"status": "done", "meta": {"rows": 3}}).encode()
+    assert state.get_status("bk", "domestic", "2024-01", "certs") == {"status": "done", "meta": {"rows": 3}}
+    assert state.get_status("bk", "domestic", "2024-02", "certs") is None
+
+
+def test_get_status_non_json_payload(gcs_http):
+    gcs_http.objects[KEY] = b"not json"
+    assert state.get_status("bk", "domestic", "2024-01", "certs") == {"raw": "not json"}
+
+
+def test_is_done_and_get(gcs_http):
+    gcs_http.objects[KEY] = b'{"status": "done"}'
+    assert state.is_done_and_get("bk", "domestic", "2024-01", "certs") == (True, {"status": "done"})
+    assert state.is_done_and_get("bk", "domestic", "2024-03", "certs") == (False, None)
+
+
+def test_checkpoint_path_validates_month():
+    assert state.checkpoint_path("non-domestic", "2024-11", "recs") == "state/non-domestic/202411/recs.json"
+    with pytest.raises(ValueError):
+        state.checkpoint_path("domestic", "2024-1", "certs")
@@ -9,10 +9,22 @@
 -- Idempotent: CREATE OR REPLACE VIEW
 -- Notes:
 --   - Produces a unified schema with a `kind` discriminator.
---   - Recommendations are returned as ARRAY<JSON> named `recommendations`.
+--   - Recommendations are returned as ARRAY<JSON> named `recommendations`
+--     (aggregated once per LMK and LEFT JOINed; NULL when an LMK has none).
 --   - Domestic‑specific cols are NULL for non‑domestic rows and vice‑versa.
 
 CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.enr_combined_certs_with_recs_v` AS
+WITH
+domestic_recs AS (
+  SELECT lmk_key, ARRAY_AGG(payload) AS recommendations
+  FROM `{{PROJECT}}.{{DATASET}}.domestic_recommendations_raw_json`
+  GROUP BY lmk_key
+),
+non_domestic_recs AS (
+  SELECT lmk_key, ARRAY_AGG(payload) AS recommendations
+  FROM `{{PROJECT}}.{{DATASET}}.non_domestic_recommendations_raw_json`
+  GROUP BY lmk_key
+)
 -- Domestic branch
 SELECT
   'domestic' AS kind,
@@ -38,12 +50,10 @@ SELECT
   CAST(NULL AS FLOAT64) AS asset_rating,
   CAST(NULL AS FLOAT64) AS co2_emissions,
   -- Recommendations as ARRAY<JSON>
-  (
-    SELECT ARRAY_AGG(r.payload)
-    FROM `{{PROJECT}}.{{DATASET}}.domestic_recommendations_raw_json` AS r
-    WHERE r.lmk_key = c.lmk_key
-  ) AS recommendations
+  r.recommendations
 FROM `{{PROJECT}}.{{DATASET}}.enr_domestic_certificates_v` AS c
+LEFT JOIN domestic_recs AS r
+  ON r.lmk_key = c.lmk_key
 
 UNION ALL
 
@@ -72,9 +82,7 @@ SELECT
   c.asset_rating,
   c.co2_emissions,
   -- Recommendations as ARRAY<JSON>
-  (
-    SELECT ARRAY_AGG(r.payload)
-    FROM `{{PROJECT}}.{{DATASET}}.non_domestic_recommendations_raw_json` AS r
-    WHERE r.lmk_key = c.lmk_key
-  ) AS recommendations
-FROM `{{PROJECT}}.{{DATASET}}.enr_non_domestic_certificates_v` AS c;
\ No newline at end of file
+  r.recommendations
+FROM `{{PROJECT}}.{{DATASET}}.enr_non_domestic_certificates_v` AS c
+LEFT JOIN non_domestic_recs AS r
+  ON r.lmk_key = c.lmk_key;
\ No newline at end of file
@@ -0,0 +1,28 @@
+-- DAME: Curated domestic certificates (materialized)
+-- Source: {{PROJECT}}.{{DATASET}}.domestic_raw_json (partitioned on lodgement_date)
+-- Idempotent: CREATE MATERIALIZED VIEW IF NOT EXISTS (replacing would force a full rebuild)
+-- Same projection as enr_domestic_certificates_v, partitioned and clustered
+-- for lookups and refreshed incrementally as raw rows land.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.enr_domestic_certificates_mv`
+PARTITION BY lodgement_date
+CLUSTER BY lmk_key, postcode
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 60, max_staleness = INTERVAL "1:0:0" HOUR TO SECOND)
+AS
+SELECT
+  lmk_key,
+  lodgement_date,
+  postcode,
+  uprn,
+  current_energy_efficiency,
+  potential_energy_efficiency,
+  address1,
+  address2,
+  property_type,
+  built_form,
+  main_heating_controls,
+  main_fuel,
+  main_heating_description,
+  hot_water_description,
+  co2_emissions_current
+FROM `{{PROJECT}}.{{DATASET}}.domestic_raw_json`;
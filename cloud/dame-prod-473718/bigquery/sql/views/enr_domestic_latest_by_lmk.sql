@@ -10,6 +10,6 @@ SELECT
 FROM `{{PROJECT}}.{{DATASET}}.enr_domestic_certificates_v`
 QUALIFY ROW_NUMBER() OVER (
   PARTITION BY lmk_key
-  -- Ensure non-NULL dates are preferred, then newest first
-  ORDER BY (lodgement_date IS NULL), lodgement_date DESC, lmk_key
+  -- Newest first; undated rows only win when an LMK has no dated row
+  ORDER BY lodgement_date DESC NULLS LAST
 ) = 1;
\ No newline at end of file
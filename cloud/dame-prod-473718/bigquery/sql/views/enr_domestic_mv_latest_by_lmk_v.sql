@@ -0,0 +1,13 @@
+-- DAME: Latest domestic certificate per LMK key, from the materialized views
+-- Source: {{PROJECT}}.{{DATASET}}.enr_domestic_certificates_mv, {{PROJECT}}.{{DATASET}}.enr_domestic_lmk_max_date_mv
+-- Idempotent: CREATE OR REPLACE VIEW
+
+CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.enr_domestic_mv_latest_by_lmk_v` AS
+SELECT
+  c.*
+FROM `{{PROJECT}}.{{DATASET}}.enr_domestic_certificates_mv` AS c
+JOIN `{{PROJECT}}.{{DATASET}}.enr_domestic_lmk_max_date_mv` AS m
+  ON c.lmk_key = m.lmk_key
+ AND c.lodgement_date IS NOT DISTINCT FROM m.max_lodgement_date
+-- Re-loaded months can leave identical rows; keep one per LMK
+QUALIFY ROW_NUMBER() OVER (PARTITION BY c.lmk_key) = 1;
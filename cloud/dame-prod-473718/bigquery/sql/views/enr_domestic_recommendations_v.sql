@@ -1,8 +1,7 @@
-
-
--- DAME: Domestic recommendations view
+-- DAME: Domestic recommendations view (narrow: helper columns, no payload)
 -- Source: {{PROJECT}}.{{DATASET}}.domestic_recommendations_raw_json
 -- Idempotent: CREATE OR REPLACE VIEW
+-- Use enr_domestic_recommendations_full_v when the JSON payload is needed.
 
 CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.enr_domestic_recommendations_v` AS
 SELECT
@@ -10,6 +9,5 @@ SELECT
   lodgement_date,
   JSON_VALUE(payload, '$."improvement-description"') AS improvement_description,
   JSON_VALUE(payload, '$."indicative-cost"')         AS indicative_cost,
-  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving,
-  payload
-FROM `{{PROJECT}}.{{DATASET}}.domestic_recommendations_raw_json`;
\ No newline at end of file
+  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving
+FROM `{{PROJECT}}.{{DATASET}}.domestic_recommendations_raw_json`;
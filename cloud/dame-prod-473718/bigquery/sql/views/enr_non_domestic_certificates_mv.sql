@@ -0,0 +1,21 @@
+-- DAME: Curated non-domestic certificates (materialized)
+-- Source: {{PROJECT}}.{{DATASET}}.non_domestic_raw_json (partitioned on lodgement_date)
+-- Idempotent: CREATE MATERIALIZED VIEW IF NOT EXISTS (replacing would force a full rebuild)
+-- Same projection as enr_non_domestic_certificates_v, partitioned and clustered
+-- for lookups and refreshed incrementally as raw rows land.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.enr_non_domestic_certificates_mv`
+PARTITION BY lodgement_date
+CLUSTER BY lmk_key
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 60, max_staleness = INTERVAL "1:0:0" HOUR TO SECOND)
+AS
+SELECT
+  lmk_key,
+  lodgement_date,
+  postcode,
+  uprn,
+  building_category,
+  lodgement_type,
+  asset_rating,
+  co2_emissions
+FROM `{{PROJECT}}.{{DATASET}}.non_domestic_raw_json`;
@@ -3,15 +3,19 @@
 -- DAME: Curated non‑domestic certificates view
 -- Source: {{PROJECT}}.{{DATASET}}.non_domestic_raw_json (partitioned on lodgement_date)
 -- Idempotent: CREATE OR REPLACE VIEW
+-- Reads the curated columns filled at ingest; scripts/apply_views backfills
+-- rows loaded before those columns existed before creating this view.
 
 CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.enr_non_domestic_certificates_v` AS
+-- Partitioned on lodgement_date: filter it with a literal/constant predicate
+-- (not a subquery result) so BigQuery prunes partitions.
 SELECT
   lmk_key,
   lodgement_date,
   postcode,
   uprn,
-  JSON_VALUE(payload, '$."building-category"')                                 AS building_category,
-  JSON_VALUE(payload, '$."lodgement-type"')                                    AS lodgement_type,
-  SAFE_CAST(JSON_VALUE(payload, '$."asset-rating"') AS FLOAT64)                AS asset_rating,
-  SAFE_CAST(JSON_VALUE(payload, '$."co2-emissions"') AS FLOAT64)               AS co2_emissions
-FROM `{{PROJECT}}.{{DATASET}}.non_domestic_raw_json`;
\ No newline at end of file
+  building_category,
+  lodgement_type,
+  asset_rating,
+  co2_emissions
+FROM `{{PROJECT}}.{{DATASET}}.non_domestic_raw_json`;
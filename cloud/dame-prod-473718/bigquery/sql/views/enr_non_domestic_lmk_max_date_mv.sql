@@ -0,0 +1,15 @@
+-- DAME: Newest non-domestic lodgement_date per LMK key (materialized)
+-- Source: {{PROJECT}}.{{DATASET}}.non_domestic_raw_json
+-- Idempotent: CREATE MATERIALIZED VIEW IF NOT EXISTS (replacing would force a full rebuild)
+-- MVs cannot use QUALIFY/ROW_NUMBER; this aggregate plus
+-- enr_non_domestic_mv_latest_by_lmk_v is the materialized counterpart of enr_non_domestic_latest_by_lmk.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.enr_non_domestic_lmk_max_date_mv`
+CLUSTER BY lmk_key
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 60, max_staleness = INTERVAL "1:0:0" HOUR TO SECOND)
+AS
+SELECT
+  lmk_key,
+  MAX(lodgement_date) AS max_lodgement_date
+FROM `{{PROJECT}}.{{DATASET}}.non_domestic_raw_json`
+GROUP BY lmk_key;
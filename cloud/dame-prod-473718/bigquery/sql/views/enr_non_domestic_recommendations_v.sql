@@ -1,6 +1,7 @@
--- DAME: Non‑domestic recommendations view
+-- DAME: Non‑domestic recommendations view (narrow: helper columns, no payload)
 -- Source: {{PROJECT}}.{{DATASET}}.non_domestic_recommendations_raw_json
 -- Idempotent: CREATE OR REPLACE VIEW
+-- Use enr_non_domestic_recommendations_full_v when the JSON payload is needed.
 
 CREATE OR REPLACE VIEW `{{PROJECT}}.{{DATASET}}.enr_non_domestic_recommendations_v` AS
 SELECT
@@ -8,6 +9,5 @@ SELECT
   lodgement_date,
   JSON_VALUE(payload, '$."improvement-description"') AS improvement_description,
   JSON_VALUE(payload, '$."indicative-cost"')         AS indicative_cost,
-  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving,
-  payload
+  JSON_VALUE(payload, '$."typical-saving"')          AS typical_saving
 FROM `{{PROJECT}}.{{DATASET}}.non_domestic_recommendations_raw_json`;
@@ -0,0 +1,17 @@
+-- DAME: Non‑domestic LMK keys by lodgement month (materialized)
+-- Source: {{PROJECT}}.{{DATASET}}.non_domestic_raw_json
+-- Idempotent: CREATE MATERIALIZED VIEW IF NOT EXISTS (replacing would force a full rebuild)
+-- Used by the incremental recommendations step to list a month's LMKs without
+-- scanning the raw JSON table; falls back to the raw table if this MV is absent.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{{PROJECT}}.{{DATASET}}.non_domestic_lmks_by_month_mv`
+PARTITION BY lodgement_month
+CLUSTER BY lmk_key
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 60)
+AS
+SELECT
+  DATE_TRUNC(lodgement_date, MONTH) AS lodgement_month,
+  lmk_key,
+  COUNT(*) AS certificates
+FROM `{{PROJECT}}.{{DATASET}}.non_domestic_raw_json`
+GROUP BY lodgement_month, lmk_key;
@@ -3,8 +3,17 @@ from __future__ import annotations
 """
 Apply (create or replace) all BigQuery views found under a views directory.
 
+- Adds/fills the curated columns on the certificate raw tables (once per
+  column set, tracked with a `curated_hash` table label) before the views
+  that read them are created.
 - Replaces placeholders {{PROJECT}} and {{DATASET}} in each SQL file.
-- Executes each file as a separate BigQuery job (idempotent).
+- Executes each file as a separate BigQuery job (idempotent). Files that do not
+  reference each other run concurrently, in dependency-ordered waves.
+- Skips files whose rendered SQL matches the `sql_hash` label on the existing
+  view (use --force to re-apply anyway). The label is only written when the
+  DDL created or replaced the object. A materialized view whose SQL changed is
+  reported as an error, because CREATE ... IF NOT EXISTS would keep the old
+  definition; --force drops and recreates it.
 - Prints a JSON summary with per-file status.
 
 Defaults are taken from dame_epc.settings (.env + env), but can be overridden
@@ -20,18 +29,25 @@ python -m scripts.apply_views --views-dir cloud/.../sql/views --dataset dame_epc
 
 # Only apply files whose names contain "domestic"
 python -m scripts.apply_views --only domestic
+
+# Re-apply every view, even if its SQL hash label is unchanged
+python -m scripts.apply_views --force
 """
 
+import hashlib
 import json
 import os
-from dataclasses import dataclass, asdict
+import re
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 
 from dame_epc.io_utils import ensure_dataset
 from dame_epc.logging_setup import get_logger, setup_logging
+from dame_epc.schema import DOMESTIC_RAW_TABLE, NON_DOMESTIC_RAW_TABLE, backfill_curated_columns_sql
 from dame_epc.settings import Settings, load_settings, settings as _settings
 
 
@@ -58,60 +74,209 @@ def _render_sql(sql_text: str, project: str, dataset: str) -> str:
     return sql_text.replace("{{PROJECT}}", project).replace("{{DATASET}}", dataset)
 
 
+# CREATE [OR REPLACE] [MATERIALIZED] VIEW [IF NOT EXISTS] <name>, at the start of
+# a line so the "-- Idempotent: CREATE OR REPLACE VIEW" header comments don't match.
+_VIEW_NAME_RE = re.compile(
+    r"^\s*create\s+(?:or\s+replace\s+)?(materialized\s+)?view\s+(?:if\s+not\s+exists\s+)?(`[^`]+`|[^\s(;]+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 def _extract_view_name(sql_text: str) -> Optional[str]:
     """
-    Best-effort parse to get the view FQN between 'CREATE OR REPLACE VIEW' and 'AS'.
+    Best-effort parse of the view (or materialized view) name from its DDL.
     """
-    low = sql_text.lower()
-    marker = "create or replace view"
-    if marker not in low:
-        return None
+    m = _VIEW_NAME_RE.search(sql_text)
+    return m.group(2) if m else None
+
+
+def _is_materialized(sql_text: str) -> bool:
+    """True if the file's DDL creates a materialized view."""
+    m = _VIEW_NAME_RE.search(sql_text)
+    return bool(m and m.group(1))
+
+
+def _sql_digest(sql: str) -> str:
+    """Short content hash of the rendered SQL (valid as a label value)."""
+    return hashlib.sha256(sql.encode("utf-8")).hexdigest()[:16]
+
+
+def _table_id(view_name: str) -> str:
+    return view_name.replace("`", "")
+
+
+def _existing_digest(client: bigquery.Client, view_name: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """(exists, `sql_hash` label) of the target object, with one metadata GET."""
+    if not view_name:
+        return False, None
     try:
-        after = sql_text[low.index(marker) + len(marker):]
-        # Split on AS (case-insensitive)
-        idx_as = after.lower().index(" as")
-        name = after[:idx_as].strip()
-        # Remove trailing semicolons/backticks whitespace
-        return " ".join(name.split())
-    except Exception:
-        return None
+        table = client.get_table(_table_id(view_name))
+    except NotFound:
+        return False, None
+    return True, (table.labels or {}).get("sql_hash")
+
+
+def _stamp_digest(client: bigquery.Client, view_name: Optional[str], digest: str) -> None:
+    """Record the applied SQL hash on the view itself (DDL job labels stay on the job)."""
+    if not view_name:
+        return
+    table = client.get_table(_table_id(view_name))
+    table.labels = {**(table.labels or {}), "sql_hash": digest}
+    client.update_table(table, ["labels"])
 
 
-def _apply_sql_file(
-    client: bigquery.Client,
-    sql_path: Path,
-    project: str,
-    dataset: str,
-    region: str,
-    dry_run: bool,
-) -> ViewResult:
-    text = sql_path.read_text(encoding="utf-8")
-    sql = _render_sql(text, project, dataset)
-    view_name = _extract_view_name(sql)
+def _try_stamp_digest(client: bigquery.Client, view_name: Optional[str], digest: str, sql_path: Path, log) -> bool:
+    """_stamp_digest, logging a failure instead of raising (the DDL itself already succeeded)."""
+    try:
+        _stamp_digest(client, view_name, digest)
+        return True
+    except Exception:
+        log.warning("could not stamp sql_hash label", extra={"file": sql_path.name}, exc_info=True)
+        return False
 
-    if dry_run:
-        return ViewResult(file=str(sql_path), view_name=view_name, status="dry-run")
 
-    cfg = bigquery.QueryJobConfig(location=region)
+def _job_config(name: str) -> bigquery.QueryJobConfig:
+    # Location is a client.query() argument, not a QueryJobConfig property
+    cfg = bigquery.QueryJobConfig()
     # Labels make it easy to filter in INFORMATION_SCHEMA and Monitoring
     cfg.labels = {
         "system": "dame",
         "stage": "views",
-        "file": sql_path.stem[:58].replace("-", "_"),  # label key/value length limits
+        "file": name[:58].replace("-", "_"),  # label key/value length limits
     }
+    return cfg
+
 
-    job = client.query(sql, job_config=cfg)
+def _submit_sql(client: bigquery.Client, sql: str, sql_path: Path, region: str, digest: str) -> bigquery.QueryJob:
+    """Start the DDL job without waiting for it."""
+    cfg = _job_config(sql_path.stem)
+    cfg.labels["sql_hash"] = digest
+    return client.query(sql, job_config=cfg, location=region)
+
+
+# DDL outcomes that (re)defined the object; "SKIP" is an IF NOT EXISTS no-op.
+_DDL_APPLIED = ("CREATE", "REPLACE")
+
+
+def _await_job(job: bigquery.QueryJob, sql_path: Path, view_name: Optional[str]) -> ViewResult:
     result = job.result()  # wait
     return ViewResult(
         file=str(sql_path),
         view_name=view_name,
-        status="applied",
+        status="applied" if job.ddl_operation_performed in _DDL_APPLIED else "skipped",
         bytes_processed=getattr(result, "total_bytes_processed", None),
         job_id=job.job_id,
     )
 
 
-def run(views_dir: Path, s: Settings, only: Optional[str], dry_run: bool) -> List[ViewResult]:
+# A dotted table path, each part backticked or bare: `p.d.t`, `p`.`d`.`t`, d.t, p.d.t
+_PART = r"(?:`[^`]+`|[A-Za-z_][\w-]*)"
+_TABLE_PATH_RE = re.compile(rf"{_PART}(?:\s*\.\s*{_PART})*")
+# Comments and string literals can mention tables without reading them
+_NON_CODE_RE = re.compile(r"--[^\n]*|/\*.*?\*/|'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", re.DOTALL)
+
+
+def _qualify(path: str, project: str, dataset: str) -> Optional[str]:
+    """`project.dataset.name` for a 1-3 part table path (None if it has more parts)."""
+    parts = [p for p in "".join(path.replace("`", "").split()).split(".") if p]
+    if not 1 <= len(parts) <= 3:
+        return None
+    return ".".join([project, dataset][: 3 - len(parts)] + parts)
+
+
+def _object_id(view_name: Optional[str], sql_path: Path, project: str, dataset: str) -> str:
+    """Fully qualified id of the object a file creates (file stem when the DDL can't be parsed)."""
+    return _qualify(view_name or sql_path.stem, project, dataset) or sql_path.stem
+
+
+def _referenced_ids(sql: str, project: str, dataset: str) -> Set[str]:
+    """
+    Fully qualified ids of the dataset-qualified table paths in `sql`.
+
+    Single bare names are left out: they are as likely to be CTEs, aliases or
+    columns as tables.
+    """
+    code = _NON_CODE_RE.sub(" ", sql)
+    refs: Set[str] = set()
+    for m in _TABLE_PATH_RE.finditer(code):
+        path = m.group(0)
+        if "." not in path.replace("`", "") and "`" not in path:
+            continue
+        fq = _qualify(path, project, dataset)
+        if fq:
+            refs.add(fq)
+    return refs
+
+
+def _dependencies(sqls: Dict[Path, str], ids: Dict[Path, str], project: str, dataset: str) -> Dict[Path, Set[Path]]:
+    """For each file, the other files whose objects its SQL references (by full id)."""
+    by_id = {ident: f for f, ident in ids.items()}
+    deps: Dict[Path, Set[Path]] = {}
+    for f, sql in sqls.items():
+        refs = _referenced_ids(sql, project, dataset)
+        deps[f] = {by_id[r] for r in refs if r in by_id and by_id[r] != f}
+    return deps
+
+
+def _dependency_waves(deps: Dict[Path, Set[Path]]) -> Tuple[List[List[Path]], List[Path]]:
+    """
+    Group files into waves: every file runs after the files it depends on.
+
+    Returns (waves in file order, files left over by a dependency cycle).
+    """
+    waves: List[List[Path]] = []
+    placed: Set[Path] = set()
+    remaining = list(deps)
+    while remaining:
+        wave = [f for f in remaining if deps[f] <= placed]
+        if not wave:
+            break
+        waves.append(wave)
+        placed.update(wave)
+        remaining = [f for f in remaining if f not in placed]
+    return waves, remaining
+
+
+def _backfill_curated_columns(
+    client: bigquery.Client, s: Settings, log, dry_run: bool, force: bool
+) -> List[ViewResult]:
+    """
+    Add and fill the curated columns on both certificate raw tables.
+
+    The curated views read these columns, so rows loaded before they existed
+    must be filled first. Each table is labelled with the hash of the script
+    that last ran on it; later runs skip it after one metadata GET.
+    """
+    results: List[ViewResult] = []
+    for kind, table in (("domestic", DOMESTIC_RAW_TABLE), ("non-domestic", NON_DOMESTIC_RAW_TABLE)):
+        table_id = f"{s.project_id}.{s.dataset_raw}.{table}"
+        label = f"backfill:{table}"
+        if dry_run:
+            results.append(ViewResult(file=label, view_name=table_id, status="dry-run"))
+            continue
+        sql = backfill_curated_columns_sql(s.project_id, s.dataset_raw, kind)
+        digest = _sql_digest(sql)
+        try:
+            try:
+                tbl = client.get_table(table_id)
+            except NotFound:
+                continue  # the first load creates it with the curated columns
+            if not force and (tbl.labels or {}).get("curated_hash") == digest:
+                results.append(ViewResult(file=label, view_name=table_id, status="skipped"))
+                continue
+            job = client.query(sql, job_config=_job_config(f"backfill_{table}"), location=s.bq_location)
+            job.result()
+            tbl = client.get_table(table_id)  # re-read: the ALTER changed its etag
+            tbl.labels = {**(tbl.labels or {}), "curated_hash": digest}
+            client.update_table(tbl, ["labels"])
+            results.append(ViewResult(file=label, view_name=table_id, status="applied", job_id=job.job_id))
+        except Exception as e:
+            log.exception("curated column backfill failed", extra={"table": table_id})
+            results.append(ViewResult(file=label, view_name=table_id, status="error", error=str(e)))
+    return results
+
+
+def run(views_dir: Path, s: Settings, only: Optional[str], dry_run: bool, force: bool = False) -> List[ViewResult]:
     setup_logging()
     log = get_logger(__name__, component="apply_views", project=s.project_id, dataset=s.dataset_enr)
 
@@ -126,22 +291,99 @@ def run(views_dir: Path, s: Settings, only: Optional[str], dry_run: bool) -> Lis
 
     log.info("applying views", extra={"count": len(files), "dir": str(views_dir), "dataset": s.dataset_enr})
 
-    results: List[ViewResult] = []
+    backfills = _backfill_curated_columns(client, s, log, dry_run, force)
+
+    sqls: Dict[Path, str] = {}
+    results_by_file: Dict[Path, ViewResult] = {}
     for f in files:
         try:
-            res = _apply_sql_file(client, f, s.project_id, s.dataset_enr, s.bq_location, dry_run)
-            results.append(res)
-            log.info("view processed", extra={"file": f.name, "status": res.status})
+            sqls[f] = _render_sql(f.read_text(encoding="utf-8"), s.project_id, s.dataset_enr)
         except Exception as e:
-            log.exception("failed to apply view", extra={"file": f.name})
-            results.append(ViewResult(file=str(f), view_name=None, status="error", error=str(e)))
+            log.exception("failed to read view file", extra={"file": f.name})
+            results_by_file[f] = ViewResult(file=str(f), view_name=None, status="error", error=str(e))
+    view_names = {f: _extract_view_name(sql) for f, sql in sqls.items()}
+    digests = {f: _sql_digest(sql) for f, sql in sqls.items()}
+    ids = {f: _object_id(view_names[f], f, s.project_id, s.dataset_enr) for f in sqls}
+    deps = _dependencies(sqls, ids, s.project_id, s.dataset_enr)
+
+    waves, cyclic = _dependency_waves(deps)
+    for f in cyclic:
+        log.error("dependency cycle; not applied", extra={"file": f.name})
+        results_by_file[f] = ViewResult(
+            file=str(f), view_name=view_names[f], status="error", error="dependency cycle between view files"
+        )
+
+    # Within a wave, all jobs are submitted before any is awaited, so BigQuery
+    # runs them concurrently and a wave takes as long as its slowest job.
+    failed: Set[Path] = set()
+    for wave in waves:
+        jobs: Dict[Path, bigquery.QueryJob] = {}
+        for f in wave:
+            upstream = sorted(ids[g] for g in deps[f] & failed)
+            if upstream:
+                results_by_file[f] = ViewResult(
+                    file=str(f), view_name=view_names[f], status="skipped",
+                    error=f"upstream failed: {', '.join(upstream)}",
+                )
+                failed.add(f)
+                log.warning("view skipped", extra={"file": f.name, "upstream": ",".join(upstream)})
+                continue
+            if dry_run:
+                results_by_file[f] = ViewResult(file=str(f), view_name=view_names[f], status="dry-run")
+                continue
+            try:
+                exists, current = _existing_digest(client, view_names[f])
+                if current == digests[f] and not force:
+                    results_by_file[f] = ViewResult(file=str(f), view_name=view_names[f], status="skipped")
+                    continue
+                if exists and current is None and _is_materialized(sqls[f]) and not force:
+                    # Unlabeled MV (created by hand, or stamping failed after its
+                    # CREATE): its definition is unknown, so adopt it instead of
+                    # failing every run; --force still drops and recreates it.
+                    log.warning(
+                        "materialized view has no sql_hash label; adopting it as current "
+                        "(re-run with --force to recreate)",
+                        extra={"file": f.name},
+                    )
+                    _try_stamp_digest(client, view_names[f], digests[f], f, log)
+                    results_by_file[f] = ViewResult(file=str(f), view_name=view_names[f], status="skipped")
+                    continue
+                if exists and current != digests[f] and _is_materialized(sqls[f]):
+                    # CREATE MATERIALIZED VIEW IF NOT EXISTS would be a no-op, so a
+                    # changed definition is only applied by dropping the MV first.
+                    if not force:
+                        raise RuntimeError(
+                            "materialized view exists with a different sql_hash; "
+                            "re-run with --force to drop and recreate it"
+                        )
+                    log.warning("dropping materialized view to recreate it", extra={"file": f.name})
+                    client.delete_table(_table_id(view_names[f]), not_found_ok=True)
+                jobs[f] = _submit_sql(client, sqls[f], f, s.bq_location, digests[f])
+            except Exception as e:
+                log.exception("failed to apply view", extra={"file": f.name})
+                results_by_file[f] = ViewResult(file=str(f), view_name=view_names[f], status="error", error=str(e))
+                failed.add(f)
+        for f, job in jobs.items():
+            try:
+                results_by_file[f] = _await_job(job, f, view_names[f])
+                # Only a CREATE/REPLACE applied this SQL; never label an IF NOT EXISTS no-op.
+                if job.ddl_operation_performed in _DDL_APPLIED:
+                    _try_stamp_digest(client, view_names[f], digests[f], f, log)
+            except Exception as e:
+                log.exception("failed to apply view", extra={"file": f.name})
+                results_by_file[f] = ViewResult(file=str(f), view_name=view_names[f], status="error", error=str(e))
+                failed.add(f)
+        for f in wave:
+            log.info("view processed", extra={"file": f.name, "status": results_by_file[f].status})
+
+    results: List[ViewResult] = backfills + [results_by_file[f] for f in files]
 
     # Print JSON for CI/pipeline logs
     print(json.dumps([asdict(r) for r in results], indent=2))
     return results
 
 
-def _parse_args() -> tuple[Path, Settings, Optional[str], bool]:
+def _parse_args() -> tuple[Path, Settings, Optional[str], bool, bool]:
     import argparse
 
     parser = argparse.ArgumentParser(description="Apply BigQuery views from SQL files.")
@@ -152,6 +394,11 @@ def _parse_args() -> tuple[Path, Settings, Optional[str], bool]:
     parser.add_argument("--region", default=None, help="Override BigQuery location.")
     parser.add_argument("--only", default=None, help="Apply only files whose names contain this substring (case-insensitive).")
     parser.add_argument("--dry-run", action="store_true", help="Do not execute queries; print plan only.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-apply views even if their SQL hash label is unchanged; drop and recreate changed materialized views.",
+    )
 
     args = parser.parse_args()
 
@@ -162,17 +409,18 @@ def _parse_args() -> tuple[Path, Settings, Optional[str], bool]:
     else:
         s = _settings
 
-    # CLI overrides
-    if args.project:
-        s.project_id = args.project  # type: ignore[attr-defined]
-    if args.dataset:
-        s.dataset_enr = args.dataset  # type: ignore[attr-defined]
-    if args.region:
-        s.region = args.region  # type: ignore[attr-defined]
+    # CLI overrides (Settings is frozen, so derive a copy)
+    overrides = {
+        field: value
+        for field, value in (("project_id", args.project), ("dataset_enr", args.dataset), ("region", args.region))
+        if value
+    }
+    if overrides:
+        s = replace(s, **overrides)
 
-    return Path(args.views_dir), s, args.only, bool(args.dry_run)
+    return Path(args.views_dir), s, args.only, bool(args.dry_run), bool(args.force)
 
 
 if __name__ == "__main__":
-    views_dir, s, only, dry_run = _parse_args()
-    run(views_dir, s, only, dry_run)
\ No newline at end of file
+    views_dir, s, only, dry_run, force = _parse_args()
+    run(views_dir, s, only, dry_run, force)
\ No newline at end of file